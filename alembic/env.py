@@ -42,9 +42,10 @@ from app.models.section_model import Section  # noqa: F401
 from app.models.board_model import Board, Board_Comment  # noqa: F401
 from app.models.friend_model import Friend, Friend_List  # noqa: F401
 from app.models.subscriber_model import Subscriber  # noqa: F401
-from app.models.blog_model import Blog, Blog_Tag, Blog_Comment, Blog_Stats, Blog_Status, Blog_Summary, Blog_TTS, Saved_Blog  # noqa: F401
+from app.models.blog_model import Blog, Blog_Tag, Blog_Comment, Blog_Stats, Blog_Stats_Flush_Batch, Blog_Status, Blog_Summary, Blog_TTS, Saved_Blog  # noqa: F401
 from app.models.project_model import Project, Project_Attachment, Project_Monetization  # noqa: F401
 from app.models.auth_model import RefreshToken, Code, Social_Account  # noqa: F401
+from app.models.analytics_model import Blog_Daily_Rollup, User_Daily_Rollup, Payment_Daily_Rollup, Media_Daily_Rollup, Project_Daily_Rollup  # noqa: F401
 
 target_metadata = SQLModel.metadata
 
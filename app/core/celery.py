@@ -138,4 +138,28 @@ celery_app.conf.beat_schedule = {
             "expires": 1800,  # 任务过期时间：30分钟
         },
     },
+    "flush-blog-stats": {
+        "task": "blog_stats_flush_task",
+        # 每隔 REDIS_COUNTER_FLUSH_INTERVAL 秒把浏览 / 点赞 / 收藏增量写入数据库
+        "schedule": settings.redis.REDIS_COUNTER_FLUSH_INTERVAL,
+        "options": {
+            "expires": settings.redis.REDIS_COUNTER_FLUSH_INTERVAL,
+        },
+    },
+    "refresh-analytics-rollups": {
+        "task": "analytics_rollup_task",
+        # 每隔 CELERY_ANALYTICS_ROLLUP_INTERVAL 秒增量刷新分析后台汇总表
+        "schedule": settings.celery.CELERY_ANALYTICS_ROLLUP_INTERVAL,
+        "options": {
+            "expires": settings.celery.CELERY_ANALYTICS_ROLLUP_INTERVAL,
+        },
+    },
+    "rebuild-analytics-rollups-daily": {
+        "task": "analytics_rollup_task",
+        "schedule": crontab(hour=4, minute=0),  # 每天凌晨 4 点全量重建
+        "args": (True,),  # full=True，纠正删除等增量刷新无法发现的变化
+        "options": {
+            "expires": 3600,  # 任务过期时间：1小时
+        },
+    },
 }
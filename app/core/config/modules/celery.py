@@ -29,3 +29,7 @@ class CelerySettings(EnvBaseSettings):
     )
     CELERY_TIMEZONE: str = Field(default="UTC", description="Celery timezone")
     CELERY_ENABLE_UTC: bool = Field(default=True, description="Enable UTC for Celery")
+    CELERY_ANALYTICS_ROLLUP_INTERVAL: int = Field(
+        default=300,
+        description="Interval of incrementally refreshing the analytics daily rollup tables in seconds",
+    )
@@ -1,3 +1,4 @@
+from typing import List
 from pydantic import Field, PositiveInt
 from app.core.config.base import EnvBaseSettings
 
@@ -29,3 +30,23 @@ class DatabaseSettings(EnvBaseSettings):
         default=2,
         description="Database connection pool max overflow (保守策略：降低溢出连接)",
     )
+
+    # 只读从库配置
+    DATABASE_REPLICA_URLS: List[str] = Field(
+        default=[],
+        description="Read replica connection URLs; GET requests read from a healthy replica when set",
+    )
+
+    DATABASE_REPLICA_MAX_LAG: int = Field(
+        default=5,
+        description="Replicas lagging behind the primary by more than this many seconds are skipped",
+    )
+
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL: PositiveInt = Field(
+        default=10, description="Interval of re-checking replica lag (seconds)"
+    )
+
+    DATABASE_READ_YOUR_WRITES_SECONDS: int = Field(
+        default=10,
+        description="After a successful write request the client reads from the primary for this many seconds",
+    )
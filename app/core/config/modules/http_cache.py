@@ -0,0 +1,45 @@
+from pydantic import Field
+from app.core.config.base import EnvBaseSettings
+
+
+class HttpCacheSettings(EnvBaseSettings):
+    """HTTP conditional request (ETag / Cache-Control) configuration"""
+
+    HTTP_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Whether public GET endpoints return ETag and honor If-None-Match",
+    )
+
+    HTTP_CACHE_MAX_AGE: int = Field(
+        default=60,
+        ge=0,
+        description="Cache-Control max-age (seconds) for public responses",
+    )
+
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = Field(
+        default=300,
+        ge=0,
+        description="Cache-Control stale-while-revalidate (seconds) for public responses",
+    )
+
+    HTTP_CACHE_SURROGATE_KEYS: bool = Field(
+        default=False,
+        description="Emit Surrogate-Key headers and purge the nginx proxy cache on invalidation; nginx only caches responses carrying Surrogate-Key, so this also enables the proxy cache",
+    )
+
+    HTTP_CACHE_SURROGATE_TTL: int = Field(
+        default=86400,
+        ge=1,
+        description="How long (seconds) the surrogate-key to URL index is kept in Redis",
+    )
+
+    HTTP_CACHE_PURGE_URL: str = Field(
+        default="http://127.0.0.1:8081",
+        description="Internal nginx listener that always bypasses and refreshes the proxy cache",
+    )
+
+    HTTP_CACHE_PURGE_TIMEOUT: int = Field(
+        default=10,
+        ge=1,
+        description="Timeout (seconds) for each nginx cache refresh request",
+    )
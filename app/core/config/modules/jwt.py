@@ -19,3 +19,11 @@ class JWTSettings(EnvBaseSettings):
     JWT_AUDIENCE: Optional[str] = Field(
         default="xiaoli_users", description="JWT audience"
     )
+    JWT_CLAIMS_CACHE_SIZE: PositiveInt = Field(
+        default=4096,
+        description="Number of verified tokens whose decoded claims are kept in memory per worker until they expire",
+    )
+    JWT_PRINCIPAL_CACHE_TTL: PositiveInt = Field(
+        default=300,
+        description="How long the authenticated user's status/role snapshot is cached in Redis (seconds)",
+    )
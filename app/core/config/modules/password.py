@@ -0,0 +1,18 @@
+from pydantic import Field, PositiveInt
+from app.core.config.base import EnvBaseSettings
+
+
+class PasswordSettings(EnvBaseSettings):
+    PASSWORD_HASH_TIME_COST: PositiveInt = Field(
+        default=2, description="Argon2 time cost (iterations)"
+    )
+    PASSWORD_HASH_MEMORY_COST: PositiveInt = Field(
+        default=65536, description="Argon2 memory cost in KiB (64MB)"
+    )
+    PASSWORD_HASH_PARALLELISM: PositiveInt = Field(
+        default=1, description="Argon2 parallelism (lanes)"
+    )
+    PASSWORD_HASH_MAX_CONCURRENCY: PositiveInt = Field(
+        default=2,
+        description="Argon2 hashes running at once per worker; each uses PASSWORD_HASH_MEMORY_COST (2GB 服务器 / 2 个 worker：2 × 64MB)",
+    )
@@ -1,3 +1,4 @@
+from typing import List
 from app.core.config.base import EnvBaseSettings
 from pydantic import Field
 
@@ -17,3 +18,145 @@ class RedisSettings(EnvBaseSettings):
     REDIS_DEFAULT_TTL: int = Field(
         default=3600, description="Default cache time-to-live in seconds"
     )
+    REDIS_CACHE_TAG_FAMILIES: List[str] = Field(
+        default=[
+            "admin_all_users",
+            "blog_archived_lists",
+            "blog_comment_lists",
+            "blog_details",
+            "blog_details_seo",
+            "blog_lists",
+            "blog_navigation",
+            "blog_summary",
+            "blog_tts",
+            "board_comment_lists",
+            "board_details",
+            "friend_details",
+            "friend_list",
+            "friend_lists",
+            "get_recent_populor_blog",
+            "media_lists",
+            "payment_record",
+            "project_details",
+            "project_lists",
+            "project_seo",
+            "project_summary",
+            "project_tts",
+            "section_details",
+            "section_lists_tree",
+            "seo_lists",
+            "tag_lists",
+            "user_saved_blogs",
+        ],
+        description="Cache key families (prefix before the first ':') registered in cache_tag sets so they can be invalidated by prefix",
+    )
+    REDIS_LOCAL_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Enable the per-worker in-process LRU cache in front of Redis",
+    )
+    REDIS_LOCAL_CACHE_MAX_BYTES: int = Field(
+        default=32 * 1024 * 1024,
+        description="Memory budget of the in-process cache per worker in bytes (2GB 服务器 / 2 个 worker)",
+    )
+    REDIS_LOCAL_CACHE_TTL: int = Field(
+        default=60,
+        description="Maximum time-to-live of in-process cache entries in seconds",
+    )
+    REDIS_LOCAL_CACHE_FAMILIES: List[str] = Field(
+        default=[
+            "section_lists_tree",
+            "section_details_by_slug",
+            "section_seo_by_slug",
+            "friend_details",
+            "friend_list",
+            "board_details",
+            "tag_lists",
+            "blog_lists",
+            "blog_lists_by_tag_slug",
+            "blog_archived_lists",
+            "blog_details",
+            "blog_details_seo",
+            "blog_summary",
+            "blog_tts",
+            "blog_navigation",
+            "get_recent_populor_blog",
+            "project_lists",
+            "project_details",
+            "project_seo",
+            "user_principal",
+        ],
+        description="Key families (prefix before the first ':') served from the in-process cache",
+    )
+    REDIS_INVALIDATION_CHANNEL: str = Field(
+        default="cache_invalidation",
+        description="Pub/sub channel used to broadcast cache invalidations across processes",
+    )
+    REDIS_SINGLE_FLIGHT_LEASE_MS: int = Field(
+        default=5000,
+        description="Lease of the cross-worker rebuild lock taken on a cache miss (milliseconds)",
+    )
+    REDIS_SINGLE_FLIGHT_POLL_MS: int = Field(
+        default=50,
+        description="Polling interval while waiting for another worker to rebuild a key (milliseconds)",
+    )
+    REDIS_STALE_TTL: int = Field(
+        default=600,
+        description="How long past its soft TTL a stale-while-revalidate entry may still be served (seconds)",
+    )
+    REDIS_CACHE_CODEC: str = Field(
+        default="zlib",
+        description="Codec for large cached values: 'zlib' or 'none'. Existing values stay readable after switching",
+    )
+    REDIS_CACHE_COMPRESSION_THRESHOLD: int = Field(
+        default=1024,
+        description="Cached values shorter than this many characters are stored as plain JSON",
+    )
+    REDIS_CACHE_COMPRESSION_LEVEL: int = Field(
+        default=6, description="zlib compression level (1 = fastest, 9 = smallest)"
+    )
+    REDIS_METRICS_LOG_INTERVAL: int = Field(
+        default=600,
+        description="Interval of the periodic per-key-family cache metrics log summary in seconds (0 disables)",
+    )
+    REDIS_WARMING_ON_STARTUP: bool = Field(
+        default=True, description="Schedule cache warming when the API starts"
+    )
+    REDIS_WARMING_PAGES: int = Field(
+        default=2,
+        description="Number of blog list pages warmed per section and language",
+    )
+    REDIS_WARMING_PAGE_SIZE: int = Field(
+        default=20, description="Page size of warmed blog lists (the API default)"
+    )
+    REDIS_WARMING_RECENT_BLOGS: int = Field(
+        default=10,
+        description="Number of recently published blogs whose details, SEO and navigation are warmed",
+    )
+    REDIS_WARMING_CONCURRENCY: int = Field(
+        default=2,
+        description="Maximum number of warming queries running against MySQL at once",
+    )
+    REDIS_WARMING_DEBOUNCE: int = Field(
+        default=10,
+        description="Delay before warming runs; triggers within this window are merged (seconds)",
+    )
+    REDIS_COUNTER_FLUSH_INTERVAL: int = Field(
+        default=30,
+        description="Interval of flushing buffered blog view/like/save counters to MySQL in seconds",
+    )
+    REDIS_UNIQUE_VIEW_RETENTION_DAYS: int = Field(
+        default=30,
+        description="Days of per-blog daily unique-viewer HyperLogLogs kept for view dedup and unique viewer stats",
+    )
+    REDIS_STATS_PROJECTION_TTL: int = Field(
+        default=3600,
+        description="TTL of the per-blog real-time stats hashes attached to blog lists in seconds",
+    )
+    REDIS_TOGGLE_WINDOW_SECONDS: int = Field(
+        default=86400,
+        description="How long a like stays toggled for the same client before it can be counted again, in seconds",
+    )
+    REDIS_TRENDING_HALF_LIFE_HOURS: float = Field(
+        default=24,
+        description="Half-life of the time-decayed blog trending score in hours",
+    )
@@ -11,9 +11,11 @@ from app.core.config.modules.azure import AzureSettings
 from app.core.config.modules.domain import DomainSettings
 from app.core.config.modules.email import EmailSettings
 from app.core.config.modules.files import FilesSettings
+from app.core.config.modules.http_cache import HttpCacheSettings
 from app.core.config.modules.invoice import InvoiceSettings
 from app.core.config.modules.jwt import JWTSettings
 from app.core.config.modules.logging import LoggingSettings
+from app.core.config.modules.password import PasswordSettings
 from app.core.config.modules.rate_limit import RateLimitSettings
 from app.core.config.modules.redis import RedisSettings
 from app.core.config.modules.social_account import SocialAccountSettings
@@ -66,6 +68,10 @@ class Settings:
     def files(self) -> FilesSettings:
         return FilesSettings()
 
+    @cached_property
+    def http_cache(self) -> HttpCacheSettings:
+        return HttpCacheSettings()
+
     @cached_property
     def invoice(self) -> InvoiceSettings:
         return InvoiceSettings()
@@ -78,6 +84,10 @@ class Settings:
     def logging(self) -> LoggingSettings:
         return LoggingSettings()
 
+    @cached_property
+    def password(self) -> PasswordSettings:
+        return PasswordSettings()
+
     @cached_property
     def rate_limit(self) -> RateLimitSettings:
         return RateLimitSettings()
@@ -0,0 +1,160 @@
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+from app.core.database.local_cache import get_key_family
+
+# 延迟直方图分桶上界（毫秒），最后一个桶收集所有更慢的请求
+LATENCY_BUCKETS_MS = [0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+
+    def quantile(self, q: float) -> float:
+        """按分桶上界估算分位数（落在最后一个桶时返回最大上界）"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                break
+        return LATENCY_BUCKETS_MS[min(index, len(LATENCY_BUCKETS_MS) - 1)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {
+            f"le_{bound}": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)
+        }
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class FamilyMetrics:
+    def __init__(self):
+        self.hits = 0
+        self.local_hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.invalidations = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.get_latency = LatencyHistogram()
+        self.set_latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        reads = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / reads, 4) if reads else None,
+            "sets": self.sets,
+            "invalidations": self.invalidations,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "avg_value_bytes": round(self.bytes_written / self.sets)
+            if self.sets
+            else None,
+            "get_latency": self.get_latency.snapshot(),
+            "set_latency": self.set_latency.snapshot(),
+        }
+
+
+class CacheMetrics:
+    """按键族（见 get_key_family）统计缓存读写 - 每个进程各自统计
+
+    字节数按 Redis 中实际存储的（编码后）值计算，本地缓存命中不计字节与延迟。
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.families: Dict[str, FamilyMetrics] = {}
+
+    def family(self, key: str) -> FamilyMetrics:
+        name = get_key_family(key)
+        metrics = self.families.get(name)
+        if metrics is None:
+            metrics = self.families[name] = FamilyMetrics()
+        return metrics
+
+    def record_local_hit(self, key: str) -> None:
+        metrics = self.family(key)
+        metrics.hits += 1
+        metrics.local_hits += 1
+
+    def record_get(self, key: str, value: Any, elapsed_ms: float) -> None:
+        metrics = self.family(key)
+        if value is None:
+            metrics.misses += 1
+        else:
+            metrics.hits += 1
+            metrics.bytes_read += len(value)
+        metrics.get_latency.observe(elapsed_ms)
+
+    def record_mget(
+        self, keys: List[str], values: List[Any], elapsed_ms: float
+    ) -> None:
+        """一次 MGET 的耗时平摊到每个键上"""
+        per_key_ms = elapsed_ms / len(keys) if keys else 0.0
+        for key, value in zip(keys, values):
+            self.record_get(key, value, per_key_ms)
+
+    def record_set(self, key: str, value: str, elapsed_ms: float) -> None:
+        metrics = self.family(key)
+        metrics.sets += 1
+        metrics.bytes_written += len(value)
+        metrics.set_latency.observe(elapsed_ms)
+
+    def record_invalidation(self, key_or_prefix: str) -> None:
+        self.family(key_or_prefix).invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "since": self.started_at,
+            "uptime_seconds": round(time.time() - self.started_at),
+            "families": {
+                name: metrics.snapshot()
+                for name, metrics in sorted(self.families.items())
+            },
+        }
+
+    def summary_lines(self) -> List[str]:
+        """周期日志使用的单行摘要，按读次数降序"""
+        lines = []
+        ordered = sorted(
+            self.families.items(),
+            key=lambda item: item[1].hits + item[1].misses,
+            reverse=True,
+        )
+        for name, metrics in ordered:
+            data = metrics.snapshot()
+            hit_ratio = data["hit_ratio"]
+            lines.append(
+                f"{name}: hit_ratio={'-' if hit_ratio is None else f'{hit_ratio:.1%}'} "
+                f"hits={metrics.hits} (local={metrics.local_hits}) misses={metrics.misses} "
+                f"sets={metrics.sets} invalidations={metrics.invalidations} "
+                f"avg_bytes={data['avg_value_bytes'] or '-'} "
+                f"get_p95={data['get_latency']['p95_ms']}ms "
+                f"set_p95={data['set_latency']['p95_ms']}ms"
+            )
+        return lines
@@ -0,0 +1,71 @@
+import base64
+import zlib
+from typing import Dict, Optional
+
+
+class CacheCodec:
+    """缓存值编解码器 - 编码结果以 marker 开头，读取时按 marker 选择解码器"""
+
+    name = ""
+    marker = ""
+
+    def encode(self, value: str) -> str:
+        raise NotImplementedError
+
+    def decode(self, value: str) -> str:
+        raise NotImplementedError
+
+
+class ZlibCodec(CacheCodec):
+    """zlib 压缩 UTF-8 文本，再用 base64 编码以兼容 decode_responses=True 的客户端"""
+
+    name = "zlib"
+    marker = "\x01"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, value: str) -> str:
+        compressed = zlib.compress(value.encode("utf-8"), self.level)
+        return self.marker + base64.b64encode(compressed).decode("ascii")
+
+    def decode(self, value: str) -> str:
+        compressed = base64.b64decode(value[len(self.marker) :])
+        return zlib.decompress(compressed).decode("utf-8")
+
+
+class CacheValueCodec:
+    """RedisManager 使用的编解码入口
+
+    - 小于阈值的值原样写入，保持可读并避免压缩开销
+    - 没有 marker 的值视为旧的纯 JSON 文本，读取时原样返回，无需迁移
+    - 解码总是按 marker 查找，切换写入编解码器后旧数据仍可读取
+    """
+
+    def __init__(self, codec: Optional[str], threshold: int, level: int = 6):
+        self.codecs: Dict[str, CacheCodec] = {}
+        self.register(ZlibCodec(level))
+        self.codec = self.get_codec(codec)
+        self.threshold = threshold
+
+    def register(self, codec: CacheCodec) -> None:
+        self.codecs[codec.marker] = codec
+
+    def get_codec(self, name: Optional[str]) -> Optional[CacheCodec]:
+        if not name or name == "none":
+            return None
+        for codec in self.codecs.values():
+            if codec.name == name:
+                return codec
+        raise ValueError(f"Unknown cache codec: {name}")
+
+    def encode(self, value: str) -> str:
+        if self.codec is None or len(value) < self.threshold:
+            return value
+        encoded = self.codec.encode(value)
+        # 压缩无收益时（例如已经压缩过的数据）保留原值
+        return encoded if len(encoded) < len(value.encode("utf-8")) else value
+
+    def decode(self, value: str) -> str:
+        codec = self.codecs.get(value[:1])
+        return codec.decode(value) if codec else value
@@ -3,6 +3,7 @@ from typing import Any, Optional
 from app.core.logger import logger_manager
 from app.core.database.mysql import mysql_manager
 from app.core.database.redis import redis_manager
+from app.core.database.revocation import access_token_revocations
 
 logger = logger_manager.get_logger(__name__)
 
@@ -17,6 +18,9 @@ class DatabaseConnectionManager:
     async def initialize(self) -> None:
         """初始化所有数据库连接"""
         await self.redis_manager.initialize_async()
+        await self.redis_manager.start_invalidation_listener()
+        await access_token_revocations.start_listener()
+        await self.redis_manager.start_metrics_reporter()
         await self.mysql_manager.initialize()
 
     async def test_connections(self) -> bool:
@@ -37,6 +41,7 @@ class DatabaseConnectionManager:
 
     async def close(self) -> None:
         """关闭所有数据库连接"""
+        await access_token_revocations.stop_listener()
         await self.redis_manager.close()
         await self.mysql_manager.close()
 
@@ -0,0 +1,460 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config.settings import settings
+from app.core.database.redis import redis_manager
+
+# 取出一批待落库增量：没有处理中的批次时，把所有待落库增量移入处理中的 hash 并生成批次号；
+# 上一批尚未确认时原样返回该批（不并入新的增量），批次号不变，落库据此判断是否已写入。
+# 移动与清空在同一脚本内完成，期间的新增量不会丢失。处理中的增量在落库提交后才删除
+# KEYS[1] = 待落库 id 集合, KEYS[2] = 处理中 id 集合, KEYS[3] = 处理中批次号
+# ARGV[1] = 增量 hash 键前缀, ARGV[2] = 处理中增量 hash 键前缀, ARGV[3] = 新批次号
+# 返回 [批次号, id1, {field, delta, ...}, id2, {...}, ...]，没有增量时返回空列表
+CLAIM_COUNTERS_SCRIPT = """
+local batch = redis.call('GET', KEYS[3])
+if redis.call('SCARD', KEYS[2]) == 0 then
+    local ids = redis.call('SMEMBERS', KEYS[1])
+    if #ids == 0 then
+        redis.call('DEL', KEYS[3])
+        return {}
+    end
+    redis.call('DEL', KEYS[1])
+    for _, id in ipairs(ids) do
+        local key = ARGV[1] .. id
+        local values = redis.call('HGETALL', key)
+        for i = 1, #values, 2 do
+            redis.call('HINCRBY', ARGV[2] .. id, values[i], values[i + 1])
+        end
+        redis.call('DEL', key)
+        redis.call('SADD', KEYS[2], id)
+    end
+    batch = false
+end
+if not batch then
+    batch = ARGV[3]
+    redis.call('SET', KEYS[3], batch)
+end
+local result = {batch}
+for _, id in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    result[#result + 1] = id
+    result[#result + 1] = redis.call('HGETALL', ARGV[2] .. id)
+end
+return result
+"""
+
+# 统计投影已存在时才累加，不存在时等待下一次读取从数据库完整加载
+# KEYS[1] = 统计投影 hash; ARGV = field1, delta1, field2, delta2, ...
+INCR_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+# 记录一次访问：访客首次出现在当天的 HyperLogLog 中时才累加浏览数
+# KEYS[1] = 当天 HyperLogLog, KEYS[2] = 增量 hash, KEYS[3] = 待落库 id 集合,
+# KEYS[4] = 统计投影 hash（没有投影时传空字符串）
+# ARGV[1] = 访客标识, ARGV[2] = HyperLogLog TTL（秒）, ARGV[3] = 实体 id, ARGV[4] = 计数字段
+RECORD_UNIQUE_VIEW_SCRIPT = """
+if redis.call('PFADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+if redis.call('TTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+redis.call('HINCRBY', KEYS[2], ARGV[4], 1)
+redis.call('SADD', KEYS[3], ARGV[3])
+if KEYS[4] ~= '' and redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('HINCRBY', KEYS[4], ARGV[4], 1)
+end
+return 1
+"""
+
+# 切换一次操作状态（例如点赞 / 取消点赞），判断与写入在同一脚本内完成，并发点击不会重复计数
+# 统计投影不存在时不做任何修改并返回 {-1, -1}，由调用方从数据库加载投影后重试
+# 操作者不在 ZSET 中但旧格式的状态键存在时视为已操作：删除旧键并按取消处理
+# KEYS[1] = 操作者 ZSET（分数为操作时间）, KEYS[2] = 增量 hash, KEYS[3] = 待落库 id 集合,
+# KEYS[4] = 统计投影 hash, KEYS[5] = 旧格式的状态键（没有时传空字符串）
+# ARGV[1] = 操作者, ARGV[2] = 当前时间戳, ARGV[3] = 有效期（秒）, ARGV[4] = 实体 id, ARGV[5] = 计数字段
+# 返回 {新状态 1/0, 最新计数}
+TOGGLE_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then
+    return {-1, -1}
+end
+local now = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local state = 1
+local delta = 1
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    state = 0
+    delta = -1
+elseif KEYS[5] ~= '' and redis.call('DEL', KEYS[5]) == 1 then
+    state = 0
+    delta = -1
+else
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+end
+redis.call('EXPIRE', KEYS[1], window)
+redis.call('HINCRBY', KEYS[2], ARGV[5], delta)
+redis.call('SADD', KEYS[3], ARGV[4])
+return {state, redis.call('HINCRBY', KEYS[4], ARGV[5], delta)}
+"""
+
+
+class StatsProjection:
+    """Redis 中的实时统计投影 - 每个实体一个 hash，保存完整的实时统计值
+
+    stats:{name}:{id}  hash，字段 -> 实时值（已落库值 + 待落库增量）
+
+    写路径在投影存在时同步累加；读取未命中的实体由调用方从数据库加载后回填。
+    落库任务提交后会删除对应投影，纠正回填与累加并发时可能产生的偏差。
+    """
+
+    def __init__(self, name: str, fields: Sequence[str]):
+        self.name = name
+        self.fields = tuple(fields)
+        self.key_prefix = f"stats:{name}:"
+
+    @property
+    def ttl(self) -> int:
+        return settings.redis.REDIS_STATS_PROJECTION_TTL
+
+    def key(self, entity_id: int) -> str:
+        return f"{self.key_prefix}{entity_id}"
+
+    def incr_args(self, deltas: Dict[str, int]) -> List:
+        return [item for pair in deltas.items() for item in pair]
+
+    async def get_many_async(
+        self, entity_ids: Iterable[int]
+    ) -> Dict[int, Dict[str, int]]:
+        """一次往返批量 HGETALL，只返回字段完整的投影"""
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return {}
+        async with redis_manager.pipeline_async() as pipe:
+            for entity_id in entity_ids:
+                pipe.hgetall(self.key(entity_id))
+            results = await pipe.execute()
+        projections = {}
+        for entity_id, values in zip(entity_ids, results):
+            if values and all(field in values for field in self.fields):
+                projections[entity_id] = {
+                    field: int(values[field]) for field in self.fields
+                }
+        return projections
+
+    async def set_many_async(self, stats: Dict[int, Dict[str, int]]) -> None:
+        if not stats:
+            return
+        async with redis_manager.pipeline_async() as pipe:
+            for entity_id, values in stats.items():
+                pipe.hset(self.key(entity_id), mapping=values)
+                pipe.expire(self.key(entity_id), self.ttl)
+
+    async def incr_async(self, entity_id: int, **deltas: int) -> None:
+        """投影存在时累加（用于不走写回式计数的字段，例如评论数）"""
+        script = await redis_manager.get_async_script(INCR_IF_EXISTS_SCRIPT)
+        await script(keys=[self.key(entity_id)], args=self.incr_args(deltas))
+
+    async def delete_async(self, entity_ids: Iterable[int]) -> None:
+        keys = [self.key(entity_id) for entity_id in entity_ids]
+        if keys:
+            client = await redis_manager.get_async_client()
+            await client.delete(*keys)
+
+    def delete_sync(self, entity_ids: Iterable[int]) -> None:
+        keys = [self.key(entity_id) for entity_id in entity_ids]
+        if keys:
+            redis_manager.get_sync_client().delete(*keys)
+
+
+class WriteBehindCounter:
+    """写回式计数器 - 增量先用 HINCRBY 累加在 Redis 中，由定时任务批量写入 MySQL
+
+    counter:{name}:{id}             hash，字段 -> 尚未落库的增量
+    counter_dirty:{name}            set，有待落库增量的 id
+    counter_processing:{name}:{id}  hash，落库任务已取出、尚未提交的增量
+    counter_processing_ids:{name}   set，有处理中增量的 id
+    counter_processing_batch:{name} 处理中增量的批次号
+
+    读取时把数据库中的值与 get_pending_* 返回的增量（含处理中的增量）相加即为实时值。
+    落库任务提交后才调用 ack_sync 删除处理中的增量；任务在提交前被终止时，
+    处理中的增量由下一次落库以同一批次号重新取出，不会丢失；
+    提交后确认前被终止时，落库按批次号跳过已写入的批次，不会重复累加。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: Sequence[str],
+        projection: Optional[StatsProjection] = None,
+    ):
+        self.name = name
+        self.fields = tuple(fields)
+        self.projection = projection
+        self.key_prefix = f"counter:{name}:"
+        self.dirty_key = f"counter_dirty:{name}"
+        self.processing_prefix = f"counter_processing:{name}:"
+        self.processing_ids_key = f"counter_processing_ids:{name}"
+        self.processing_batch_key = f"counter_processing_batch:{name}"
+
+    def pending_key(self, entity_id: int) -> str:
+        return f"{self.key_prefix}{entity_id}"
+
+    def processing_key(self, entity_id: int) -> str:
+        return f"{self.processing_prefix}{entity_id}"
+
+    def _check_fields(self, deltas: Dict[str, int]) -> None:
+        unknown = set(deltas) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown counter fields for {self.name}: {unknown}")
+
+    @staticmethod
+    def _parse_pending(values: Dict[str, str]) -> Dict[str, int]:
+        return {field: int(delta) for field, delta in values.items() if int(delta)}
+
+    async def incr_async(self, entity_id: int, **deltas: int) -> None:
+        """累加增量，一次往返完成 HINCRBY、登记待落库 id 与更新统计投影"""
+        self._check_fields(deltas)
+        async with redis_manager.pipeline_async() as pipe:
+            for field, delta in deltas.items():
+                pipe.hincrby(self.pending_key(entity_id), field, delta)
+            pipe.sadd(self.dirty_key, entity_id)
+            if self.projection is not None:
+                script = await redis_manager.get_async_script(INCR_IF_EXISTS_SCRIPT)
+                await script(
+                    keys=[self.projection.key(entity_id)],
+                    args=self.projection.incr_args(deltas),
+                    client=pipe,
+                )
+
+    def incr_sync(self, entity_id: int, **deltas: int) -> None:
+        self._check_fields(deltas)
+        with redis_manager.pipeline_sync() as pipe:
+            for field, delta in deltas.items():
+                pipe.hincrby(self.pending_key(entity_id), field, delta)
+            pipe.sadd(self.dirty_key, entity_id)
+            if self.projection is not None:
+                script = redis_manager.get_sync_script(INCR_IF_EXISTS_SCRIPT)
+                script(
+                    keys=[self.projection.key(entity_id)],
+                    args=self.projection.incr_args(deltas),
+                    client=pipe,
+                )
+
+    async def get_pending_async(
+        self, entity_ids: Iterable[int]
+    ) -> Dict[int, Dict[str, int]]:
+        """批量读取尚未落库的增量（含处理中的增量），没有增量的 id 不出现在结果中"""
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return {}
+        async with redis_manager.pipeline_async() as pipe:
+            for entity_id in entity_ids:
+                pipe.hgetall(self.pending_key(entity_id))
+                pipe.hgetall(self.processing_key(entity_id))
+            results = await pipe.execute()
+        pending = {}
+        for index, entity_id in enumerate(entity_ids):
+            deltas = self._parse_pending(results[2 * index] or {})
+            for field, delta in self._parse_pending(
+                results[2 * index + 1] or {}
+            ).items():
+                deltas[field] = deltas.get(field, 0) + delta
+            deltas = {field: delta for field, delta in deltas.items() if delta}
+            if deltas:
+                pending[entity_id] = deltas
+        return pending
+
+    @staticmethod
+    def merge(stats: Dict[str, int], pending: Dict[str, int]) -> Dict[str, int]:
+        """把待落库增量合并到数据库中读出的统计值上"""
+        return {field: value + pending.get(field, 0) for field, value in stats.items()}
+
+    def claim_sync(self) -> Tuple[Optional[str], Dict[int, Dict[str, int]]]:
+        """原子地取出一批处理中的增量，返回 (批次号, 增量)，没有增量时返回 (None, {})
+
+        上一批未确认（提交前失败、或提交后确认前被终止）时返回同一批次号与同一批增量；
+        落库提交后需调用 ack_sync，提交失败时保持不动，由下一次落库重试。
+        """
+        script = redis_manager.get_sync_script(CLAIM_COUNTERS_SCRIPT)
+        result: List = script(
+            keys=[self.dirty_key, self.processing_ids_key, self.processing_batch_key],
+            args=[self.key_prefix, self.processing_prefix, uuid.uuid4().hex],
+        )
+        if not result:
+            return None, {}
+        batch_id = result[0]
+        claimed = {}
+        for index in range(1, len(result), 2):
+            values = result[index + 1]
+            deltas = self._parse_pending(dict(zip(values[::2], values[1::2])))
+            if deltas:
+                claimed[int(result[index])] = deltas
+        if not claimed:
+            # 增量全部相互抵消，无需落库
+            self.ack_sync()
+            return None, {}
+        return batch_id, claimed
+
+    def ack_sync(self) -> None:
+        """落库提交后删除本批处理中的增量与批次号
+
+        批次取出后不再并入新增量，处理中集合中的 id 即为本批的全部 id（含增量为 0 的 id）。
+        """
+        client = redis_manager.get_sync_client()
+        entity_ids = client.smembers(self.processing_ids_key)
+        with redis_manager.pipeline_sync(transaction=True) as pipe:
+            if entity_ids:
+                pipe.delete(
+                    *[self.processing_key(entity_id) for entity_id in entity_ids]
+                )
+            pipe.delete(self.processing_ids_key, self.processing_batch_key)
+
+
+class UniqueViewTracker:
+    """按天去重的独立访客统计 - 每个实体每天一个 HyperLogLog（约 12KB 上限）
+
+    viewers:{name}:{id}:{YYYYMMDD}  HyperLogLog，保留 REDIS_UNIQUE_VIEW_RETENTION_DAYS 天
+
+    同一访客当天重复访问不计入浏览数；HyperLogLog 为概率结构，
+    极少数新访客可能被判定为已访问（误差约 0.81%）。
+    """
+
+    def __init__(self, name: str, counter: WriteBehindCounter, field: str):
+        self.name = name
+        self.counter = counter
+        self.field = field
+
+    @property
+    def retention_days(self) -> int:
+        return settings.redis.REDIS_UNIQUE_VIEW_RETENTION_DAYS
+
+    def day_key(self, entity_id: int, day: datetime) -> str:
+        return f"viewers:{self.name}:{entity_id}:{day:%Y%m%d}"
+
+    def window_keys(self, entity_id: int, days: Optional[int] = None) -> List[str]:
+        """最近 days 天（含今天，UTC）的 HyperLogLog 键"""
+        today = datetime.now(timezone.utc)
+        days = min(days or self.retention_days, self.retention_days)
+        return [
+            self.day_key(entity_id, today - timedelta(days=offset))
+            for offset in range(days)
+        ]
+
+    async def record_view_async(self, entity_id: int, viewer: str) -> bool:
+        """记录访问并在当天首次访问时累加浏览数，一次往返完成，返回是否计入"""
+        projection = self.counter.projection
+        script = await redis_manager.get_async_script(RECORD_UNIQUE_VIEW_SCRIPT)
+        counted = await script(
+            keys=[
+                self.day_key(entity_id, datetime.now(timezone.utc)),
+                self.counter.pending_key(entity_id),
+                self.counter.dirty_key,
+                projection.key(entity_id) if projection is not None else "",
+            ],
+            args=[viewer, self.retention_days * 86400, entity_id, self.field],
+        )
+        return bool(counted)
+
+    async def count_unique_async(
+        self, entity_ids: Iterable[int], days: Optional[int] = None
+    ) -> Dict[int, int]:
+        """最近 days 天的独立访客数（多天 HyperLogLog 的并集基数）"""
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return {}
+        async with redis_manager.pipeline_async() as pipe:
+            for entity_id in entity_ids:
+                pipe.pfcount(*self.window_keys(entity_id, days))
+            results = await pipe.execute()
+        return dict(zip(entity_ids, results))
+
+
+class ToggleTracker:
+    """可切换的操作状态（例如点赞） - 每个实体一个 ZSET 记录操作者
+
+    toggles:{name}:{id}  ZSET，操作者 -> 操作时间，超过 REDIS_TOGGLE_WINDOW_SECONDS 的记录失效
+
+    切换在一个 Lua 脚本中完成：判断状态、写入操作者、累加写回式计数与统计投影，
+    并返回新状态与最新计数。记录失效后同一操作者可以再次操作。
+
+    legacy_key 为改用 ZSET 之前每个操作者一个键的格式（{entity_id} / {actor} 占位），
+    操作者不在 ZSET 中时回退检查旧键，旧键过期后不再起作用。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        counter: WriteBehindCounter,
+        field: str,
+        legacy_key: Optional[str] = None,
+    ):
+        if counter.projection is None:
+            raise ValueError(f"Toggle tracker {name} requires a stats projection")
+        self.name = name
+        self.counter = counter
+        self.field = field
+        self.legacy_key = legacy_key
+
+    @property
+    def window_seconds(self) -> int:
+        return settings.redis.REDIS_TOGGLE_WINDOW_SECONDS
+
+    def key(self, entity_id: int) -> str:
+        return f"toggles:{self.name}:{entity_id}"
+
+    async def toggle_async(
+        self, entity_id: int, actor: str
+    ) -> Optional[Tuple[bool, int]]:
+        """切换操作者的状态，返回 (新状态, 最新计数)；统计投影不存在时不做修改并返回 None"""
+        script = await redis_manager.get_async_script(TOGGLE_SCRIPT)
+        state, count = await script(
+            keys=[
+                self.key(entity_id),
+                self.counter.pending_key(entity_id),
+                self.counter.dirty_key,
+                self.counter.projection.key(entity_id),
+                self.legacy_key.format(entity_id=entity_id, actor=actor)
+                if self.legacy_key
+                else "",
+            ],
+            args=[actor, int(time.time()), self.window_seconds, entity_id, self.field],
+        )
+        if state == -1:
+            return None
+        return bool(state), int(count)
+
+
+# 博客实时统计投影，列表页据此附加统计数据而不查询 Blog_Stats
+blog_stats_projection = StatsProjection("blog", ("views", "likes", "comments", "saves"))
+
+# 栏目下的博客数量（全部 / 已发布），博客列表分页总数据此获取，不再执行 COUNT(*)
+section_blog_counts = StatsProjection("section_blogs", ("all", "published"))
+
+# 标签下已发布的博客数量
+tag_blog_counts = StatsProjection("tag_blogs", ("published",))
+
+# 博客浏览 / 点赞 / 收藏计数，由 blog_stats_flush_task 定时写入 Blog_Stats
+blog_stats_counter = WriteBehindCounter(
+    "blog_stats", ("views", "likes", "saves"), projection=blog_stats_projection
+)
+
+# 博客独立访客，浏览数按“访客 + 天”去重
+blog_view_tracker = UniqueViewTracker("blog", blog_stats_counter, "views")
+
+# 博客点赞，同一 IP 在有效期内再次点击为取消点赞（兼容 24 小时内旧格式的点赞键）
+blog_like_tracker = ToggleTracker(
+    "blog_likes",
+    blog_stats_counter,
+    "likes",
+    legacy_key="blog_like_button:{entity_id}:ip={actor}",
+)
@@ -6,9 +6,11 @@ from fastapi.security import APIKeyCookie
 
 from app.core.database.mysql import mysql_manager
 from app.core.database.redis import redis_manager
+from app.core.database.revocation import access_token_revocations
 from app.core.security import security_manager
 from app.crud.auth_crud import get_auth_crud
 from app.models.auth_model import RefreshToken
+from app.schemas.auth_schemas import CurrentUser
 from app.core.logger import logger_manager
 from app.core.config.settings import settings
 
@@ -41,11 +43,13 @@ class Dependencies:
         self,
         access_token: str = Depends(get_access_token_cookie),
         db: AsyncSession = Depends(mysql_manager.get_db),
-    ):
-        self.logger.info(
-            f"get_current_user called with access_token: {'***' if access_token else 'None'}"
-        )
+    ) -> CurrentUser:
+        """校验 access_token 并返回当前用户的状态与角色快照
 
+        是否已登出由进程内撤销集合判断，集合未同步时黑名单检查与快照读取合并为
+        一次 Redis 往返；快照命中时不查询 MySQL，快照在启用 / 禁用、删除用户以及
+        重置密码时失效。
+        """
         if not access_token:
             self.logger.warning("No access_token provided in request")
             raise HTTPException(
@@ -55,21 +59,30 @@ class Dependencies:
 
         # 使用 JWT 验证 access_token（不查询数据库）
         try:
-            self.logger.info("Attempting to decode access token")
             token_data = security_manager.decode_token(access_token)
             if token_data:
-                self.logger.info(
-                    f"Token decoded successfully, user_id: {token_data.get('user_id')}"
-                )
                 user_id = token_data.get("user_id")
                 jti = token_data.get("jti")
 
                 if user_id and jti:
-                    # 检查 token 是否在黑名单中（已登出）
+                    # 检查 token 是否已撤销（已登出），同时读取用户快照
+                    cached_principal = None
+                    principal_key = f"user_principal:{user_id}"
                     try:
-                        is_blacklisted = await redis_manager.exists_async(
-                            f"blacklist:access_token:{jti}"
-                        )
+                        # 撤销集合已同步到内存时不访问 Redis，否则与快照合并为一次往返
+                        is_blacklisted = access_token_revocations.check_local(jti)
+                        if is_blacklisted is None:
+                            (
+                                cached_principal,
+                                is_blacklisted,
+                            ) = await redis_manager.get_with_exists_async(
+                                principal_key,
+                                access_token_revocations.blacklist_key(jti),
+                            )
+                        elif not is_blacklisted:
+                            cached_principal = await redis_manager.get_async(
+                                principal_key
+                            )
                         if is_blacklisted:
                             self.logger.warning(
                                 f"Access token {jti} is blacklisted (user logged out)"
@@ -86,17 +99,18 @@ class Dependencies:
                         )
                         # 如果 Redis 不可用，允许请求通过（降级策略）
 
-                    # 从数据库中获取用户信息
-                    user = await self.auth_crud.get_user_by_id(user_id)
+                    if cached_principal:
+                        user = CurrentUser.model_validate_json(cached_principal)
+                    else:
+                        # 快照未命中，从数据库中获取用户信息
+                        user = await self.auth_crud.get_user_principal(user_id)
                     if (
                         user
                         and user.is_active
                         and user.is_verified
                         and not user.is_deleted
                     ):
-                        self.logger.info(
-                            f"User authenticated via access token: {user.email}"
-                        )
+                        self.logger.debug(f"User authenticated: {user.id}")
                         return user
                     else:
                         self.logger.warning(
@@ -0,0 +1,100 @@
+import re
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+# 族名末尾的参数段：`_123` / `_<uuid>` 形式的 id，或 `=...` 形式的查询参数
+_FAMILY_PARAM_SUFFIX = re.compile(r"(=.*|_[0-9a-fA-F-]*[0-9][0-9a-fA-F-]*)$")
+
+
+def get_key_family(key: str) -> str:
+    """缓存键所属的族：第一个 ':' 之前的前缀，去掉末尾的 id / 参数段
+
+    user_profile_42 与 analytics_growth_trends_30 分别归入 user_profile 与
+    analytics_growth_trends，保证族的数量有界。
+    """
+    prefix = key.split(":", 1)[0]
+    return _FAMILY_PARAM_SUFFIX.sub("", prefix) or prefix
+
+
+class LocalCache:
+    """进程内 LRU 缓存 - 按字节预算淘汰，支持 TTL
+
+    只在单个事件循环内使用，不做加锁处理。
+    """
+
+    def __init__(self, max_bytes: int, default_ttl: int):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # key -> (value, expires_at, size)
+        self._data: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self.current_bytes = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, key: str, field: str) -> None:
+        family = self.stats.setdefault(
+            get_key_family(key), {"hits": 0, "misses": 0, "evictions": 0}
+        )
+        family[field] += 1
+
+    def _pop(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            self._record(key, "misses")
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            self._record(key, "misses")
+            return None
+
+        self._data.move_to_end(key)
+        self._record(key, "hits")
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        # 单个条目超过预算的一半时不放入本地缓存，避免把热点数据全部挤出
+        if size > self.max_bytes // 2:
+            self._pop(key)
+            return
+
+        ttl = min(ttl or self.default_ttl, self.default_ttl)
+        self._pop(key)
+        self._data[key] = (value, time.monotonic() + ttl, size)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes and self._data:
+            evicted_key, (_, _, evicted_size) = self._data.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self._record(evicted_key, "evictions")
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._pop(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """删除等于 prefix 或以 "prefix:" 开头的所有键"""
+        scoped = f"{prefix}:"
+        for key in [k for k in self._data if k == prefix or k.startswith(scoped)]:
+            self._pop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "entries": len(self._data),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "families": {family: dict(data) for family, data in self.stats.items()},
+        }
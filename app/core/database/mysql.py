@@ -1,16 +1,86 @@
-from collections.abc import AsyncGenerator
-from typing import Optional
+import asyncio
+import itertools
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, Dict, List, Optional, TypeVar
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
     AsyncSession,
     AsyncEngine,
 )
-from sqlalchemy import create_engine, text, Engine
+from sqlalchemy import create_engine, text, Engine, Select
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.logger import logger_manager
 from app.core.config.settings import settings
 
+T = TypeVar("T")
+
+# 会话 info 中的读写分离标记
+READ_ENGINE_KEY = "read_engine"  # 本会话只读查询使用的从库（同步 Engine）
+USE_PRIMARY_KEY = "use_primary"  # 为 True 时所有语句都发往主库
+
+# 写请求成功后下发的 Cookie，有效期内该客户端的读取都走主库（读己之写）
+RECENT_WRITE_COOKIE = "db_recent_write"
+
+# 只读请求方法，只有这些请求会从从库读取
+READ_ONLY_METHODS = ("GET", "HEAD")
+# 写请求方法，成功后下发 RECENT_WRITE_COOKIE（不含 CORS 预检的 OPTIONS）
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class RoutingSession(Session):
+    """读写分离会话
+
+    info 中设置了 read_engine 时，不加锁的 SELECT 发往该从库，其余语句
+    （写入、刷新、SELECT ... FOR UPDATE、原始 SQL）发往主库；
+    会话一旦访问过主库，之后的查询都留在主库，保证同一请求内读己之写。
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        read_engine = self.info.get(READ_ENGINE_KEY)
+        if read_engine is None or self.info.get(USE_PRIMARY_KEY):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        if (
+            not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            return read_engine
+        self.info[USE_PRIMARY_KEY] = True
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+class LazyAsyncSession:
+    """按需创建的异步会话代理
+
+    请求依赖注入时只创建代理，第一次访问会话属性（execute、add、info 等）时
+    才通过 factory 创建真正的 AsyncSession；完全由 Redis 缓存返回的请求不会
+    创建会话，也不会从连接池借出连接。
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_active(self) -> bool:
+        """是否已经创建了真正的会话"""
+        return self._session is not None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_session(), name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
 
 class MySQLManager:
     """MySQL 连接管理器 - 使用 SQLModel ORM"""
@@ -21,10 +91,16 @@ class MySQLManager:
         self.async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
         self.sync_engine: Optional[Engine] = None
         self.sync_session_maker: Optional[sessionmaker[Session]] = None
+        # 只读从库（异步），以及每个从库最近一次检测到的复制延迟（None 表示不可用）
+        self.replica_engines: List[AsyncEngine] = []
+        self.replica_lag: Dict[int, Optional[float]] = {}
+        self.replica_checked_at: float = 0.0
+        self._replica_cycle = itertools.count()
+        self._replica_refresh: Optional[asyncio.Task] = None
 
-    def get_sqlalchemy_url(self) -> str:
-        """构建 SQLAlchemy 异步连接 URL"""
-        url = settings.database.DATABASE_URL
+    def get_sqlalchemy_url(self, url: Optional[str] = None) -> str:
+        """构建 SQLAlchemy 异步连接 URL（默认为主库）"""
+        url = url or settings.database.DATABASE_URL
         # 确保使用 aiomysql 驱动
         if url.startswith("mysql://"):
             return url.replace("mysql://", "mysql+aiomysql://", 1)
@@ -51,24 +127,16 @@ class MySQLManager:
         try:
             db = settings.database
             # 初始化异步引擎
-            self.async_engine = create_async_engine(
-                self.get_sqlalchemy_url(),
-                echo=db.ECHO,
-                pool_pre_ping=db.POOL_PRE_PING,
-                pool_timeout=db.POOL_TIMEOUT,
-                pool_size=db.POOL_SIZE,
-                max_overflow=db.POOL_MAX_OVERFLOW,
-                # 设置MySQL时区为UTC（会话级别）
-                # 这确保每个连接都使用 UTC 时区，避免时区转换问题
-                # 注意: aiomysql 不支持 time_zone 参数，只能通过 init_command 设置
-                # 注意：init_command 只支持单个语句，使用正确的语法
-                connect_args={
-                    "init_command": "SET SESSION time_zone = '+00:00'",
-                },
-            )
+            self.async_engine = self._create_async_engine(self.get_sqlalchemy_url())
+            # 只读从库使用与主库相同的连接池配置
+            self.replica_engines = [
+                self._create_async_engine(self.get_sqlalchemy_url(url))
+                for url in db.DATABASE_REPLICA_URLS
+            ]
             self.async_session_maker = async_sessionmaker(
                 self.async_engine,
                 class_=AsyncSession,
+                sync_session_class=RoutingSession,
                 expire_on_commit=False,
             )
 
@@ -93,18 +161,143 @@ class MySQLManager:
                 expire_on_commit=False,
             )
 
-            self.logger.info("✅ MySQL initialized successfully (async + sync).")
+            # 启动时检测一次从库延迟，之后由 choose_read_engine 在后台定期刷新
+            if self.replica_engines:
+                await self.refresh_replica_lag()
+
+            self.logger.info(
+                f"✅ MySQL initialized successfully (async + sync, {len(self.replica_engines)} read replicas)."
+            )
         except Exception:
             self.logger.exception("❌ Failed to initialize MySQL.")
             raise
 
-    async def get_db(self) -> AsyncGenerator[AsyncSession, None]:
-        """FastAPI 依赖注入使用：返回异步会话生成器"""
+    def _create_async_engine(self, url: str) -> AsyncEngine:
+        db = settings.database
+        return create_async_engine(
+            url,
+            echo=db.ECHO,
+            pool_pre_ping=db.POOL_PRE_PING,
+            pool_timeout=db.POOL_TIMEOUT,
+            pool_size=db.POOL_SIZE,
+            max_overflow=db.POOL_MAX_OVERFLOW,
+            # 设置MySQL时区为UTC（会话级别）
+            # 这确保每个连接都使用 UTC 时区，避免时区转换问题
+            # 注意: aiomysql 不支持 time_zone 参数，只能通过 init_command 设置
+            # 注意：init_command 只支持单个语句，使用正确的语法
+            connect_args={
+                "init_command": "SET SESSION time_zone = '+00:00'",
+            },
+        )
+
+    async def get_db(self, request: Request) -> AsyncGenerator[AsyncSession, None]:
+        """FastAPI 依赖注入使用：返回异步会话生成器
+
+        返回的是 LazyAsyncSession，第一次使用时才创建会话，缓存命中的请求不占用连接。
+        配置了从库时，只读请求的会话把 SELECT 路由到一个复制延迟正常的从库；
+        写请求、刚写入过的客户端（RECENT_WRITE_COOKIE）以及没有可用从库时全部走主库。
+        """
         if not self.async_session_maker:
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
-        async with self.async_session_maker() as session:
+        read_only = (
+            request.method in READ_ONLY_METHODS
+            and RECENT_WRITE_COOKIE not in request.cookies
+        )
+        session = LazyAsyncSession(lambda: self._open_session(read_only))
+        try:
             yield session
+        finally:
+            await session.close()
+
+    def _open_session(self, read_only: bool) -> AsyncSession:
+        session = self.async_session_maker()
+        if read_only:
+            read_engine = self.choose_read_engine()
+            if read_engine is not None:
+                session.info[READ_ENGINE_KEY] = read_engine.sync_engine
+        return session
+
+    @staticmethod
+    def use_primary(session: AsyncSession) -> None:
+        """本会话之后的所有查询都走主库（编辑器等需要读己之写的路径）"""
+        session.info[USE_PRIMARY_KEY] = True
+
+    @staticmethod
+    def mark_recent_write(response: Response) -> None:
+        """写请求成功后调用，使该客户端在一段时间内从主库读取"""
+        response.set_cookie(
+            RECENT_WRITE_COOKIE,
+            "1",
+            max_age=settings.database.DATABASE_READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            secure=True,
+            samesite="lax",
+        )
+
+    async def check_replica_lag(self, engine: AsyncEngine) -> Optional[float]:
+        """返回从库的复制延迟（秒）；复制中断或无法连接时返回 None"""
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(text("SHOW REPLICA STATUS"))
+                row: Optional[Dict[str, Any]] = result.mappings().first()
+        except Exception as e:
+            self.logger.warning(f"Failed to check replica lag: {e}")
+            return None
+        if row is None:
+            # 未配置复制（例如只读代理或本地测试实例），视为没有延迟
+            return 0.0
+        lag = row.get("Seconds_Behind_Source")
+        return None if lag is None else float(lag)
+
+    async def refresh_replica_lag(self) -> None:
+        """每隔 DATABASE_REPLICA_LAG_CHECK_INTERVAL 秒重新检测所有从库的延迟"""
+        now = time.monotonic()
+        interval = settings.database.DATABASE_REPLICA_LAG_CHECK_INTERVAL
+        if now - self.replica_checked_at < interval:
+            return
+        self.replica_checked_at = now
+        for index, engine in enumerate(self.replica_engines):
+            lag = await self.check_replica_lag(engine)
+            if self.replica_lag.get(index, 0.0) is not None and lag is None:
+                self.logger.warning(f"Read replica #{index} is unavailable")
+            self.replica_lag[index] = lag
+
+    def choose_read_engine(self) -> Optional[AsyncEngine]:
+        """轮询选择一个延迟不超过 DATABASE_REPLICA_MAX_LAG 的从库，没有时返回 None
+
+        使用最近一次检测到的延迟，检测结果过期时在后台重新检测，不阻塞当前请求。
+        """
+        if not self.replica_engines:
+            return None
+        self._schedule_replica_refresh()
+        max_lag = settings.database.DATABASE_REPLICA_MAX_LAG
+        healthy = [
+            engine
+            for index, engine in enumerate(self.replica_engines)
+            if (lag := self.replica_lag.get(index)) is not None and lag <= max_lag
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._replica_cycle) % len(healthy)]
+
+    def _schedule_replica_refresh(self) -> None:
+        interval = settings.database.DATABASE_REPLICA_LAG_CHECK_INTERVAL
+        if time.monotonic() - self.replica_checked_at < interval:
+            return
+        if self._replica_refresh is not None and not self._replica_refresh.done():
+            return
+        self._replica_refresh = asyncio.get_running_loop().create_task(
+            self.refresh_replica_lag()
+        )
+
+    async def run_in_session(self, func: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """在独立的异步会话中执行 func（用于请求结束后仍在运行的后台任务）"""
+        if not self.async_session_maker:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        async with self.async_session_maker() as session:
+            return await func(session)
 
     def get_sync_db(self) -> Session:
         """Celery 任务使用：返回同步会话"""
@@ -141,6 +334,15 @@ class MySQLManager:
                 self.logger.exception("❌ Failed to dispose MySQL async engine.")
                 raise
 
+        if self._replica_refresh is not None:
+            self._replica_refresh.cancel()
+            self._replica_refresh = None
+        for engine in self.replica_engines:
+            await engine.dispose()
+        self.replica_engines = []
+        self.replica_lag = {}
+        self.replica_checked_at = 0.0
+
         if self.sync_engine:
             try:
                 self.sync_engine.dispose()
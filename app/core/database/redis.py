@@ -1,12 +1,85 @@
-from typing import Optional, cast
+import asyncio
+import json
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 from redis.asyncio import Redis as AsyncRedis
 from redis.asyncio import from_url as async_from_url
+from redis.asyncio.client import Pipeline as AsyncPipeline
 from redis import Redis as SyncRedis
 from redis import from_url as sync_from_url
+from redis.client import Pipeline as SyncPipeline
 from app.core.config.settings import settings
+from app.core.database.cache_metrics import CacheMetrics
+from app.core.database.codec import CacheValueCodec
+from app.core.database.local_cache import LocalCache, get_key_family
 from app.core.logger import logger_manager
 
 
+# 缓存标签集合前缀：cache_tag:{前缀} -> 以该前缀开头的所有缓存键
+CACHE_TAG_PREFIX = "cache_tag:"
+
+# 每次写入时随机抽查的标签集合成员数，移除已过期的成员，使集合大小与存活的键数量相当
+CACHE_TAG_PRUNE_SAMPLE = 5
+
+# 按前缀失效时每批 SSCAN / UNLINK 的成员数
+CACHE_TAG_SCAN_COUNT = 500
+
+# 写入缓存并登记到各级前缀标签集合中（标签集合 TTL 只增不减，保证不早于成员过期）
+# 每个标签集合随机抽查若干成员，已过期的从集合中移除
+# KEYS[1] = 缓存键, KEYS[2..n] = 标签集合; ARGV[1] = 值, ARGV[2] = TTL（秒）, ARGV[3] = 抽查数量
+SET_WITH_TAGS_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+for i = 2, #KEYS do
+    local sample = redis.call('SRANDMEMBER', KEYS[i], tonumber(ARGV[3]))
+    for _, member in ipairs(sample) do
+        if redis.call('EXISTS', member) == 0 then
+            redis.call('SREM', KEYS[i], member)
+        end
+    end
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if redis.call('TTL', KEYS[i]) < ttl then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+return 1
+"""
+
+
+# 仅当锁仍属于自己时才释放，避免误删租约过期后被其他进程获取的锁
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 单飞重建锁前缀：lock:{缓存键}
+LOCK_PREFIX = "lock:"
+
+# 进程内 leader 被取消时通知等待者重新竞争
+_RETRY = object()
+
+# stale-while-revalidate 缓存数据的信封字段
+SOFT_EXPIRES_FIELD = "__soft_expires_at__"
+DATA_FIELD = "__data__"
+
+
 class RedisManager:
     """Redis 连接管理器 - 支持异步和同步客户端"""
 
@@ -15,6 +88,246 @@ class RedisManager:
         self.async_client: Optional[AsyncRedis] = None
         self.sync_client: Optional[SyncRedis] = None
         self.config = settings.redis
+        # 已注册的 Lua 脚本（按脚本源码缓存，客户端关闭时清空）
+        self.async_scripts: Dict[str, Any] = {}
+        self.sync_scripts: Dict[str, Any] = {}
+        # 缓存值编解码（超过阈值的值压缩后写入 Redis，本地缓存保存解码后的文本）
+        try:
+            self.codec = CacheValueCodec(
+                codec=self.config.REDIS_CACHE_CODEC,
+                threshold=self.config.REDIS_CACHE_COMPRESSION_THRESHOLD,
+                level=self.config.REDIS_CACHE_COMPRESSION_LEVEL,
+            )
+        except ValueError as e:
+            self.logger.warning(f"{e}, cached values will be stored uncompressed")
+            self.codec = CacheValueCodec(codec=None, threshold=0)
+        # 按键族统计命中率、字节数与延迟
+        self.metrics = CacheMetrics()
+        self.metrics_task: Optional[asyncio.Task] = None
+        # 进程内 LRU 缓存（仅在失效监听运行时启用，保证跨进程一致性）
+        self.local_cache = LocalCache(
+            max_bytes=self.config.REDIS_LOCAL_CACHE_MAX_BYTES,
+            default_ttl=self.config.REDIS_LOCAL_CACHE_TTL,
+        )
+        self.local_cache_families = set(self.config.REDIS_LOCAL_CACHE_FAMILIES)
+        self.cache_tag_families = set(self.config.REDIS_CACHE_TAG_FAMILIES)
+        # 每收到一次失效消息递增，防止把失效前读到的旧值写回本地缓存
+        self.local_cache_generation = 0
+        self.instance_id = uuid.uuid4().hex
+        self.invalidation_task: Optional[asyncio.Task] = None
+        # 进程内正在重建的缓存键 -> 结果 Future
+        self.inflight: Dict[str, asyncio.Future] = {}
+        # 正在后台刷新的缓存键及任务（保留引用，防止任务被回收）
+        self.refreshing: Set[str] = set()
+        self.refresh_tasks: Set[asyncio.Task] = set()
+
+    # -------------------------------
+    # ✅ 缓存标签 - 替代 KEYS 模式匹配
+    # -------------------------------
+
+    def get_cache_tags(self, key: str) -> List[str]:
+        """返回缓存键在每个 ':' 边界上的前缀标签集合
+
+        例如 blog_lists:3:lang=zh -> [cache_tag:blog_lists, cache_tag:blog_lists:3]
+        只有 REDIS_CACHE_TAG_FAMILIES 中的缓存族会登记，其余键返回空列表。
+        """
+        if get_key_family(key) not in self.cache_tag_families:
+            return []
+        parts = key.split(":")
+        return [
+            f"{CACHE_TAG_PREFIX}{':'.join(parts[:i])}" for i in range(1, len(parts))
+        ]
+
+    def pattern_to_prefix(self, pattern: str) -> str:
+        """将失效模式转换为标签前缀
+
+        支持 "prefix:*" 与不含通配符的精确前缀；其余通配写法会退化为
+        第一个通配符之前最长的 ':' 边界前缀（宁可多失效，也不漏失效）。
+        """
+        if pattern.endswith(":*") and not any(c in pattern[:-2] for c in "*?["):
+            return pattern[:-2]
+        if not any(c in pattern for c in "*?["):
+            return pattern
+
+        literal = pattern[: min(pattern.find(c) for c in "*?[" if c in pattern)]
+        prefix = literal.rsplit(":", 1)[0] if ":" in literal else ""
+        if not prefix:
+            raise ValueError(f"Unsupported cache invalidation pattern: {pattern}")
+        self.logger.warning(
+            f"Cache pattern '{pattern}' is not a ':*' prefix, invalidating '{prefix}:*' instead"
+        )
+        return prefix
+
+    # -------------------------------
+    # ✅ 进程内缓存 - pub/sub 跨进程失效
+    # -------------------------------
+
+    def is_local_cache_family(self, key: str) -> bool:
+        return (
+            self.config.REDIS_LOCAL_CACHE_ENABLED
+            and get_key_family(key) in self.local_cache_families
+        )
+
+    def use_local_cache(self, key: str) -> bool:
+        """该键是否走进程内缓存：需属于配置的键族且失效监听运行中"""
+        return (
+            self.invalidation_task is not None
+            and not self.invalidation_task.done()
+            and self.is_local_cache_family(key)
+        )
+
+    def build_invalidation_message(
+        self, keys: Optional[List[str]] = None, prefixes: Optional[List[str]] = None
+    ) -> str:
+        return json.dumps(
+            {"origin": self.instance_id, "keys": keys or [], "prefixes": prefixes or []}
+        )
+
+    def apply_invalidation_message(self, data: str) -> None:
+        """处理其他进程广播的失效消息"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            self.logger.warning(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+
+        if message.get("origin") == self.instance_id:
+            return
+
+        self.local_cache_generation += 1
+        if message.get("keys"):
+            self.local_cache.delete(*message["keys"])
+        for prefix in message.get("prefixes") or []:
+            self.local_cache.delete_prefix(prefix)
+
+    async def start_invalidation_listener(self) -> None:
+        """启动失效消息监听（FastAPI 生命周期内调用）"""
+        if not self.config.REDIS_LOCAL_CACHE_ENABLED:
+            return
+        if self.invalidation_task and not self.invalidation_task.done():
+            return
+        self.invalidation_task = asyncio.create_task(self._listen_invalidations())
+
+    async def stop_invalidation_listener(self) -> None:
+        if not self.invalidation_task:
+            return
+        self.invalidation_task.cancel()
+        try:
+            await self.invalidation_task
+        except asyncio.CancelledError:
+            pass
+        self.invalidation_task = None
+        self.local_cache.clear()
+
+    async def _listen_invalidations(self) -> None:
+        channel = self.config.REDIS_INVALIDATION_CHANNEL
+        while True:
+            try:
+                client = await self.get_async_client()
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(channel)
+                    # 订阅建立之前可能错过了失效消息，丢弃全部本地数据
+                    self.local_cache_generation += 1
+                    self.local_cache.clear()
+                    self.logger.info(f"✅ Subscribed to cache invalidation: {channel}")
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.apply_invalidation_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Cache invalidation listener failed: {e}")
+                self.local_cache_generation += 1
+                self.local_cache.clear()
+                await asyncio.sleep(1)
+
+    def filter_invalidation(
+        self, keys: Optional[List[str]], prefixes: Optional[List[str]]
+    ) -> Tuple[List[str], List[str]]:
+        """只有可能被其他进程缓存在本地的键族才需要广播"""
+        return (
+            [key for key in keys or [] if self.is_local_cache_family(key)],
+            [prefix for prefix in prefixes or [] if self.is_local_cache_family(prefix)],
+        )
+
+    async def publish_invalidation_async(
+        self, keys: Optional[List[str]] = None, prefixes: Optional[List[str]] = None
+    ) -> None:
+        keys, prefixes = self.filter_invalidation(keys, prefixes)
+        if not keys and not prefixes:
+            return
+        try:
+            client = await self.get_async_client()
+            await client.publish(
+                self.config.REDIS_INVALIDATION_CHANNEL,
+                self.build_invalidation_message(keys, prefixes),
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def publish_invalidation_sync(
+        self, keys: Optional[List[str]] = None, prefixes: Optional[List[str]] = None
+    ) -> None:
+        keys, prefixes = self.filter_invalidation(keys, prefixes)
+        if not keys and not prefixes:
+            return
+        try:
+            self.get_sync_client().publish(
+                self.config.REDIS_INVALIDATION_CHANNEL,
+                self.build_invalidation_message(keys, prefixes),
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def schedule_http_cache_purge(self, keys: List[str], prefixes: List[str]) -> None:
+        """交给 Celery 刷新依赖这些缓存键的 nginx 代理缓存条目"""
+        if not settings.http_cache.HTTP_CACHE_SURROGATE_KEYS:
+            return
+        try:
+            from app.tasks.http_cache_purge_task import http_cache_purge_task
+
+            http_cache_purge_task.delay(keys, prefixes)
+        except Exception as e:
+            self.logger.warning(f"Failed to schedule proxy cache purge: {e}")
+
+    def get_local_cache_stats(self) -> Dict[str, object]:
+        return self.local_cache.get_stats()
+
+    # -------------------------------
+    # ✅ 缓存指标 - 按键族统计，周期输出日志
+    # -------------------------------
+
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """当前进程的缓存指标（多 worker 部署时每个 worker 各自统计）"""
+        snapshot = self.metrics.snapshot()
+        snapshot["instance_id"] = self.instance_id
+        snapshot["local_cache"] = self.get_local_cache_stats()
+        return snapshot
+
+    async def start_metrics_reporter(self) -> None:
+        """每隔 REDIS_METRICS_LOG_INTERVAL 秒输出一次缓存指标摘要（0 表示关闭）"""
+        if self.config.REDIS_METRICS_LOG_INTERVAL <= 0:
+            return
+        if self.metrics_task and not self.metrics_task.done():
+            return
+        self.metrics_task = asyncio.create_task(self._report_metrics())
+
+    async def stop_metrics_reporter(self) -> None:
+        if not self.metrics_task:
+            return
+        self.metrics_task.cancel()
+        try:
+            await self.metrics_task
+        except asyncio.CancelledError:
+            pass
+        self.metrics_task = None
+
+    async def _report_metrics(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.REDIS_METRICS_LOG_INTERVAL)
+            lines = self.metrics.summary_lines()
+            if lines:
+                self.logger.info("📊 Cache metrics since start:\n" + "\n".join(lines))
 
     async def initialize_async(self) -> None:
         """初始化异步 Redis 客户端 - 用于 FastAPI"""
@@ -22,6 +335,7 @@ class RedisManager:
             self.logger.debug("Redis async client already initialized.")
             return
 
+        self.async_scripts = {}
         try:
             self.async_client = async_from_url(
                 self.config.REDIS_CONNECTION_URL,
@@ -42,6 +356,7 @@ class RedisManager:
             self.logger.debug("Redis sync client already initialized.")
             return
 
+        self.sync_scripts = {}
         try:
             self.sync_client = sync_from_url(
                 self.config.REDIS_CONNECTION_URL,
@@ -67,24 +382,70 @@ class RedisManager:
         assert self.async_client is not None
         return self.async_client
 
-    async def get_async(self, key: str) -> Optional[str]:
+    async def get_async_script(self, source: str) -> Any:
+        """获取（必要时注册）异步 Lua 脚本，调用时自动使用 EVALSHA"""
+        if source not in self.async_scripts:
+            client = await self.get_async_client()
+            self.async_scripts[source] = client.register_script(source)
+        return self.async_scripts[source]
+
+    def decode_value(self, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        value = value.decode() if isinstance(value, bytes) else value
+        return self.codec.decode(value)
+
+    async def get_async(self, key: str, track: bool = True) -> Optional[str]:
+        """读取缓存；track=False 时不计入指标（例如等待其他进程重建时的轮询）"""
+        use_local = self.use_local_cache(key)
+        if use_local:
+            local_value = self.local_cache.get(key)
+            if local_value is not None:
+                if track:
+                    self.metrics.record_local_hit(key)
+                return local_value
+        generation = self.local_cache_generation
+
         client = await self.get_async_client()
-        result = await client.get(key)
-        return result.decode() if isinstance(result, bytes) else result
+        started = time.perf_counter()
+        raw = await client.get(key)
+        if track:
+            self.metrics.record_get(key, raw, (time.perf_counter() - started) * 1000)
+        result = self.decode_value(raw)
+        if (
+            use_local
+            and result is not None
+            and generation == self.local_cache_generation
+        ):
+            self.local_cache.set(key, result)
+        return result
 
     async def set_async(self, key: str, value: str, ex: Optional[int] = None) -> bool:
         client = await self.get_async_client()
         ex = ex or self.config.REDIS_DEFAULT_TTL
-        return await client.set(key, value, ex=ex)
+        tags = self.get_cache_tags(key)
+        encoded = self.codec.encode(value)
+        started = time.perf_counter()
+        if not tags:
+            result = await client.set(key, encoded, ex=ex)
+        else:
+            script = await self.get_async_script(SET_WITH_TAGS_SCRIPT)
+            result = bool(
+                await script(
+                    keys=[key, *tags], args=[encoded, ex, CACHE_TAG_PRUNE_SAMPLE]
+                )
+            )
+        self.metrics.record_set(key, encoded, (time.perf_counter() - started) * 1000)
+        if self.use_local_cache(key):
+            self.local_cache.set(key, value, ex)
+        return result
 
     async def delete_async(self, *keys: str) -> int:
-        client = await self.get_async_client()
-        return await client.delete(*keys)
+        return await self.invalidate_async(keys=keys)
 
     async def delete_pattern_async(self, pattern: str) -> int:
-        client = await self.get_async_client()
-        keys = await client.keys(pattern)
-        return await client.delete(*keys) if keys else 0
+        """按前缀失效缓存（基于标签集合，不使用 KEYS）"""
+        return await self.invalidate_async(patterns=[pattern])
 
     async def exists_async(self, key: str) -> bool:
         """检查键是否存在（异步）"""
@@ -92,6 +453,356 @@ class RedisManager:
         result = await client.exists(key)
         return result > 0
 
+    async def get_with_exists_async(
+        self, key: str, exists_key: str
+    ) -> Tuple[Optional[str], bool]:
+        """读取 key 并检查 exists_key 是否存在，合并为一次往返
+
+        key 命中进程内缓存时只发送 EXISTS。
+        """
+        use_local = self.use_local_cache(key)
+        if use_local:
+            local_value = self.local_cache.get(key)
+            if local_value is not None:
+                self.metrics.record_local_hit(key)
+                return local_value, await self.exists_async(exists_key)
+        generation = self.local_cache_generation
+
+        client = await self.get_async_client()
+        started = time.perf_counter()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.exists(exists_key)
+            raw, exists = await pipe.execute()
+        self.metrics.record_get(key, raw, (time.perf_counter() - started) * 1000)
+        result = self.decode_value(raw)
+        if (
+            use_local
+            and result is not None
+            and generation == self.local_cache_generation
+        ):
+            self.local_cache.set(key, result)
+        return result, exists > 0
+
+    @asynccontextmanager
+    async def pipeline_async(
+        self, transaction: bool = False
+    ) -> AsyncIterator[AsyncPipeline]:
+        """批量发送命令，退出上下文时若仍有未执行的命令则一次性 execute
+
+        transaction=True 时包在 MULTI/EXEC 中执行。需要读取结果时在上下文内自行
+        调用 pipe.execute()。直接操作 Redis，不经过进程内缓存与缓存标签，
+        写缓存请用 mset_async，失效请用 invalidate_async。
+        """
+        client = await self.get_async_client()
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            if len(pipe):
+                await pipe.execute()
+
+    async def mget_async(self, keys: List[str]) -> List[Optional[str]]:
+        """批量读取，本地缓存未命中的键合并为一次 MGET"""
+        results: List[Optional[str]] = [None] * len(keys)
+        missing: List[int] = []
+        for index, key in enumerate(keys):
+            if self.use_local_cache(key):
+                local_value = self.local_cache.get(key)
+                if local_value is not None:
+                    self.metrics.record_local_hit(key)
+                    results[index] = local_value
+                    continue
+            missing.append(index)
+        if not missing:
+            return results
+
+        generation = self.local_cache_generation
+        client = await self.get_async_client()
+        missing_keys = [keys[index] for index in missing]
+        started = time.perf_counter()
+        values = await client.mget(missing_keys)
+        self.metrics.record_mget(
+            missing_keys, values, (time.perf_counter() - started) * 1000
+        )
+        for index, value in zip(missing, values):
+            value = self.decode_value(value)
+            results[index] = value
+            key = keys[index]
+            if (
+                value is not None
+                and generation == self.local_cache_generation
+                and self.use_local_cache(key)
+            ):
+                self.local_cache.set(key, value)
+        return results
+
+    async def mset_async(
+        self,
+        mapping: Dict[str, str],
+        ex: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """批量写入（一次往返），ttls 可为单个键指定 TTL，否则使用 ex / 默认 TTL"""
+        if not mapping:
+            return True
+        ttls = ttls or {}
+        client = await self.get_async_client()
+        script = await self.get_async_script(SET_WITH_TAGS_SCRIPT)
+        encoded_values = {
+            key: self.codec.encode(value) for key, value in mapping.items()
+        }
+        started = time.perf_counter()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, encoded in encoded_values.items():
+                key_ex = ttls.get(key) or ex or self.config.REDIS_DEFAULT_TTL
+                tags = self.get_cache_tags(key)
+                if not tags:
+                    pipe.set(key, encoded, ex=key_ex)
+                else:
+                    await script(
+                        keys=[key, *tags],
+                        args=[encoded, key_ex, CACHE_TAG_PRUNE_SAMPLE],
+                        client=pipe,
+                    )
+            results = await pipe.execute()
+        per_key_ms = (time.perf_counter() - started) * 1000 / len(encoded_values)
+        for key, encoded in encoded_values.items():
+            self.metrics.record_set(key, encoded, per_key_ms)
+
+        for key, value in mapping.items():
+            if self.use_local_cache(key):
+                self.local_cache.set(
+                    key, value, ttls.get(key) or ex or self.config.REDIS_DEFAULT_TTL
+                )
+        return all(results)
+
+    async def invalidate_async(
+        self, keys: Iterable[str] = (), patterns: Iterable[str] = ()
+    ) -> int:
+        """删除多个键并按前缀失效多个模式，只广播一条失效消息
+
+        前缀失效按批 SSCAN 标签集合，每批在一个 MULTI 中 UNLINK 并从集合中移除，
+        不在 Lua 中一次处理整个集合。
+        """
+        keys = list(keys)
+        prefixes = [self.pattern_to_prefix(pattern) for pattern in patterns]
+        if not keys and not prefixes:
+            return 0
+
+        self.local_cache.delete(*keys)
+        for prefix in prefixes:
+            self.local_cache.delete_prefix(prefix)
+
+        client = await self.get_async_client()
+        # 精确键以及前缀本身对应的键
+        deleted = await client.unlink(*keys, *prefixes)
+        for prefix in prefixes:
+            deleted += await self._invalidate_tag_async(client, prefix)
+
+        for key_or_prefix in [*keys, *prefixes]:
+            self.metrics.record_invalidation(key_or_prefix)
+        await self.publish_invalidation_async(keys=keys, prefixes=prefixes)
+        self.schedule_http_cache_purge(keys, prefixes)
+        return deleted
+
+    async def _invalidate_tag_async(self, client: AsyncRedis, prefix: str) -> int:
+        """删除前缀标签集合中登记的所有键
+
+        只从集合中移除本次扫描到并删除的成员，失效期间新写入的键仍登记在集合中；
+        集合为空时由 Redis 自动删除。
+        """
+        tag = f"{CACHE_TAG_PREFIX}{prefix}"
+        deleted = 0
+        batch: List[str] = []
+        async for member in client.sscan_iter(tag, count=CACHE_TAG_SCAN_COUNT):
+            batch.append(member)
+            if len(batch) < CACHE_TAG_SCAN_COUNT:
+                continue
+            deleted += await self._unlink_tagged_async(client, tag, batch)
+            batch = []
+        if batch:
+            deleted += await self._unlink_tagged_async(client, tag, batch)
+        return deleted
+
+    @staticmethod
+    async def _unlink_tagged_async(
+        client: AsyncRedis, tag: str, members: List[str]
+    ) -> int:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.srem(tag, *members)
+            pipe.unlink(*members)
+            _, deleted = await pipe.execute()
+        return int(deleted)
+
+    def dump_cache_value(
+        self, result: Any, ex: Optional[int], stale_while_revalidate: bool
+    ) -> Tuple[str, int]:
+        """序列化缓存数据，返回 (值, Redis 过期时间)
+
+        stale_while_revalidate 时把软过期时间戳和数据一起存入，ex 视为软 TTL，
+        Redis 中的硬 TTL 额外延长 REDIS_STALE_TTL，期间可返回旧值并后台刷新。
+        """
+        ex = ex or self.config.REDIS_DEFAULT_TTL
+        if not stale_while_revalidate:
+            return json.dumps(result), ex
+        envelope = {SOFT_EXPIRES_FIELD: time.time() + ex, DATA_FIELD: result}
+        return json.dumps(envelope), ex + self.config.REDIS_STALE_TTL
+
+    @staticmethod
+    def load_cache_value(cache_data: str) -> Tuple[Any, bool]:
+        """反序列化缓存数据，返回 (数据, 是否已过软 TTL)"""
+        value = json.loads(cache_data)
+        if isinstance(value, dict) and SOFT_EXPIRES_FIELD in value:
+            return value[DATA_FIELD], value[SOFT_EXPIRES_FIELD] <= time.time()
+        return value, False
+
+    async def get_or_build_async(
+        self,
+        key: str,
+        build: Callable[[], Awaitable[Any]],
+        ex: Optional[int] = None,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """读取 JSON 缓存，未命中时单飞重建
+
+        同一进程内对同一个键的并发未命中只会执行一次 build，其余协程等待其结果；
+        跨 worker 通过短租约 Redis 锁保证只有一个进程重建，其余进程轮询缓存直到
+        结果写入或租约过期（过期后自行重建，避免无限等待）。
+
+        传入 refresh 时启用 stale-while-revalidate：超过软 TTL（ex）的数据仍立即
+        返回，同时由一个进程在后台调用 refresh 重建。refresh 会在请求结束后运行，
+        不能依赖请求级的数据库会话。
+        """
+        stale_while_revalidate = refresh is not None
+        while True:
+            cache_data = await self.get_async(key)
+            if cache_data is not None:
+                result, is_stale = self.load_cache_value(cache_data)
+                if is_stale and refresh is not None:
+                    await self._schedule_refresh(key, refresh, ex)
+                return result
+
+            inflight = self.inflight.get(key)
+            if inflight is not None:
+                result = await asyncio.shield(inflight)
+                if result is _RETRY:
+                    continue
+                return result
+
+            future = asyncio.get_running_loop().create_future()
+            self.inflight[key] = future
+            try:
+                result = await self._build_with_lock(
+                    key, build, ex, stale_while_revalidate
+                )
+            except asyncio.CancelledError:
+                future.set_result(_RETRY)
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # 等待者会自行取出异常；这里标记已读取，避免未取异常的警告
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                self.inflight.pop(key, None)
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        client = await self.get_async_client()
+        lease_ms = self.config.REDIS_SINGLE_FLIGHT_LEASE_MS
+        return bool(await client.set(lock_key, token, nx=True, px=lease_ms))
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            script = await self.get_async_script(RELEASE_LOCK_SCRIPT)
+            await script(keys=[lock_key], args=[token])
+        except Exception as e:
+            self.logger.warning(f"Failed to release rebuild lock {lock_key}: {e}")
+
+    async def _build_with_lock(
+        self,
+        key: str,
+        build: Callable[[], Awaitable[Any]],
+        ex: Optional[int],
+        stale_while_revalidate: bool = False,
+    ) -> Any:
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        lease_ms = self.config.REDIS_SINGLE_FLIGHT_LEASE_MS
+
+        lock_unavailable = False
+        try:
+            acquired = await self._acquire_lock(lock_key, token)
+        except Exception as e:
+            # Redis 不可用时退化为仅进程内合并
+            self.logger.warning(f"Failed to acquire rebuild lock for {key}: {e}")
+            acquired, lock_unavailable = False, True
+
+        if not acquired and not lock_unavailable:
+            # 其他 worker 正在重建：等待其写入缓存
+            deadline = time.monotonic() + lease_ms / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.config.REDIS_SINGLE_FLIGHT_POLL_MS / 1000)
+                cache_data = await self.get_async(key, track=False)
+                if cache_data is not None:
+                    return self.load_cache_value(cache_data)[0]
+            self.logger.warning(f"Rebuild lock for {key} expired, rebuilding locally")
+
+        try:
+            result = await build()
+            value, hard_ex = self.dump_cache_value(result, ex, stale_while_revalidate)
+            await self.set_async(key, value, ex=hard_ex)
+            return result
+        finally:
+            if acquired:
+                await self._release_lock(lock_key, token)
+
+    async def _schedule_refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ex: Optional[int],
+    ) -> None:
+        """为过了软 TTL 的键启动后台刷新（跨 worker 只会有一个刷新任务）"""
+        if key in self.refreshing:
+            return
+
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        try:
+            if not await self._acquire_lock(lock_key, token):
+                return
+        except Exception as e:
+            self.logger.warning(f"Failed to acquire refresh lock for {key}: {e}")
+            return
+
+        self.refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, refresh, ex, lock_key, token))
+        self.refresh_tasks.add(task)
+        task.add_done_callback(self.refresh_tasks.discard)
+
+    async def _refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ex: Optional[int],
+        lock_key: str,
+        token: str,
+    ) -> None:
+        try:
+            result = await refresh()
+            value, hard_ex = self.dump_cache_value(result, ex, True)
+            await self.set_async(key, value, ex=hard_ex)
+            # 其他 worker 本地缓存中的旧值需要丢弃
+            await self.publish_invalidation_async(keys=[key])
+            self.logger.debug(f"Refreshed stale cache entry {key}")
+        except Exception as e:
+            self.logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            self.refreshing.discard(key)
+            await self._release_lock(lock_key, token)
+
     async def async_test_connection(self) -> bool:
         try:
             client = await self.get_async_client()
@@ -113,28 +824,130 @@ class RedisManager:
         assert self.sync_client is not None
         return self.sync_client
 
+    def get_sync_script(self, source: str) -> Any:
+        """获取（必要时注册）同步 Lua 脚本，调用时自动使用 EVALSHA"""
+        if source not in self.sync_scripts:
+            self.sync_scripts[source] = self.get_sync_client().register_script(source)
+        return self.sync_scripts[source]
+
     def get_sync(self, key: str) -> Optional[str]:
-        result = self.get_sync_client().get(key)
-        if result is None:
-            return None
-        return result.decode() if isinstance(result, bytes) else cast(str, result)
+        started = time.perf_counter()
+        raw = self.get_sync_client().get(key)
+        self.metrics.record_get(key, raw, (time.perf_counter() - started) * 1000)
+        return self.decode_value(raw)
 
     def set_sync(self, key: str, value: str, ex: Optional[int] = None) -> bool:
         ex = ex or self.config.REDIS_DEFAULT_TTL
-        result = self.get_sync_client().set(key, value, ex=ex)
-        return cast(bool, result)
+        client = self.get_sync_client()
+        tags = self.get_cache_tags(key)
+        encoded = self.codec.encode(value)
+        started = time.perf_counter()
+        if not tags:
+            result = cast(bool, client.set(key, encoded, ex=ex))
+        else:
+            script = self.get_sync_script(SET_WITH_TAGS_SCRIPT)
+            result = bool(
+                script(keys=[key, *tags], args=[encoded, ex, CACHE_TAG_PRUNE_SAMPLE])
+            )
+        self.metrics.record_set(key, encoded, (time.perf_counter() - started) * 1000)
+        return result
 
     def delete_sync(self, *keys: str) -> int:
-        result = self.get_sync_client().delete(*keys)
-        return cast(int, result)
+        return self.invalidate_sync(keys=keys)
 
     def delete_pattern_sync(self, pattern: str) -> int:
-        client = self.get_sync_client()
-        keys = client.keys(pattern)
+        """按前缀失效缓存（基于标签集合，不使用 KEYS）"""
+        return self.invalidate_sync(patterns=[pattern])
+
+    @contextmanager
+    def pipeline_sync(self, transaction: bool = False) -> Iterator[SyncPipeline]:
+        """pipeline_async 的同步版本"""
+        with self.get_sync_client().pipeline(transaction=transaction) as pipe:
+            yield pipe
+            if len(pipe):
+                pipe.execute()
+
+    def mget_sync(self, keys: List[str]) -> List[Optional[str]]:
         if not keys:
+            return []
+        started = time.perf_counter()
+        values = cast(List[Any], self.get_sync_client().mget(keys))
+        self.metrics.record_mget(keys, values, (time.perf_counter() - started) * 1000)
+        return [self.decode_value(value) for value in values]
+
+    def mset_sync(
+        self,
+        mapping: Dict[str, str],
+        ex: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        if not mapping:
+            return True
+        ttls = ttls or {}
+        script = self.get_sync_script(SET_WITH_TAGS_SCRIPT)
+        encoded_values = {
+            key: self.codec.encode(value) for key, value in mapping.items()
+        }
+        started = time.perf_counter()
+        with self.get_sync_client().pipeline(transaction=False) as pipe:
+            for key, encoded in encoded_values.items():
+                key_ex = ttls.get(key) or ex or self.config.REDIS_DEFAULT_TTL
+                tags = self.get_cache_tags(key)
+                if not tags:
+                    pipe.set(key, encoded, ex=key_ex)
+                else:
+                    script(
+                        keys=[key, *tags],
+                        args=[encoded, key_ex, CACHE_TAG_PRUNE_SAMPLE],
+                        client=pipe,
+                    )
+            results = pipe.execute()
+        per_key_ms = (time.perf_counter() - started) * 1000 / len(encoded_values)
+        for key, encoded in encoded_values.items():
+            self.metrics.record_set(key, encoded, per_key_ms)
+        return all(results)
+
+    def invalidate_sync(
+        self, keys: Iterable[str] = (), patterns: Iterable[str] = ()
+    ) -> int:
+        keys = list(keys)
+        prefixes = [self.pattern_to_prefix(pattern) for pattern in patterns]
+        if not keys and not prefixes:
             return 0
-        result = client.delete(*keys)
-        return cast(int, result)
+
+        client = self.get_sync_client()
+        deleted = cast(int, client.unlink(*keys, *prefixes))
+        for prefix in prefixes:
+            deleted += self._invalidate_tag_sync(client, prefix)
+
+        for key_or_prefix in [*keys, *prefixes]:
+            self.metrics.record_invalidation(key_or_prefix)
+        self.publish_invalidation_sync(keys=keys, prefixes=prefixes)
+        self.schedule_http_cache_purge(keys, prefixes)
+        return deleted
+
+    def _invalidate_tag_sync(self, client: SyncRedis, prefix: str) -> int:
+        """_invalidate_tag_async 的同步版本"""
+        tag = f"{CACHE_TAG_PREFIX}{prefix}"
+        deleted = 0
+        batch: List[str] = []
+        for member in client.sscan_iter(tag, count=CACHE_TAG_SCAN_COUNT):
+            batch.append(member)
+            if len(batch) < CACHE_TAG_SCAN_COUNT:
+                continue
+            deleted += self._unlink_tagged_sync(client, tag, batch)
+            batch = []
+        if batch:
+            deleted += self._unlink_tagged_sync(client, tag, batch)
+        return deleted
+
+    @staticmethod
+    def _unlink_tagged_sync(client: SyncRedis, tag: str, members: List[str]) -> int:
+        with client.pipeline(transaction=True) as pipe:
+            pipe.srem(tag, *members)
+            pipe.unlink(*members)
+            _, deleted = pipe.execute()
+        return int(deleted)
 
     def sync_test_connection(self) -> bool:
         try:
@@ -152,10 +965,14 @@ class RedisManager:
 
     async def close(self) -> None:
         """关闭异步和同步客户端"""
+        await self.stop_metrics_reporter()
+        await self.stop_invalidation_listener()
+
         if self.async_client:
             try:
                 await self.async_client.close()
                 self.async_client = None
+                self.async_scripts = {}
                 self.logger.info("✅ Redis async client closed.")
             except Exception:
                 self.logger.exception("❌ Failed to close Redis async client.")
@@ -164,6 +981,7 @@ class RedisManager:
             try:
                 self.sync_client.close()
                 self.sync_client = None
+                self.sync_scripts = {}
                 self.logger.info("✅ Redis sync client closed.")
             except Exception:
                 self.logger.exception("❌ Failed to close Redis sync client.")
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import time
+from typing import Dict, Optional
+
+from app.core.config.settings import settings
+from app.core.database.redis import redis_manager
+from app.core.logger import logger_manager
+
+
+class TokenRevocationList:
+    """已撤销 JWT 的进程内集合 - pub/sub 跨进程同步
+
+    blacklist:{name}:{jti}     撤销标记，TTL 为令牌剩余有效期（未同步到内存时的回退检查）
+    revoked_tokens:{name}      ZSET，jti -> 令牌过期时间戳，worker 启动时据此加载全部仍有效的撤销
+                               （首次加载前先把只有 blacklist 键的旧撤销补入）
+    revoked_tokens_backfilled:{name}  补入完成标记，TTL 为一个令牌有效期，期间不再 SCAN
+    token_revocation:{name}    撤销广播频道
+
+    每个 worker 在内存中保存尚未过期的已撤销 jti（最多为一个令牌有效期内的登出次数），
+    订阅建立并完成加载后，“未撤销”的判断完全在内存中完成，不访问 Redis；
+    订阅断开期间 check_local 返回 None，调用方回退到 Redis 检查。
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.zset_key = f"revoked_tokens:{name}"
+        self.backfill_marker_key = f"revoked_tokens_backfilled:{name}"
+        self.channel = f"token_revocation:{name}"
+        self.logger = logger_manager.get_logger(__name__)
+        # jti -> 令牌过期时间戳（秒）
+        self.revoked: Dict[str, float] = {}
+        self.next_prune_at = 0.0
+        self.listener_task: Optional[asyncio.Task] = None
+        # 订阅已建立且已从 Redis 加载时为 True
+        self.ready = False
+
+    def blacklist_key(self, jti: str) -> str:
+        return f"blacklist:{self.name}:{jti}"
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        if expires_at > time.time():
+            self.revoked[jti] = expires_at
+
+    def _prune(self, now: float) -> None:
+        """移除已过期的撤销；最多每秒执行一次"""
+        if now < self.next_prune_at:
+            return
+        self.next_prune_at = now + 1
+        self.revoked = {
+            jti: expires_at
+            for jti, expires_at in self.revoked.items()
+            if expires_at > now
+        }
+
+    def check_local(self, jti: str) -> Optional[bool]:
+        """内存中判断 jti 是否已撤销；内存集合未同步时返回 None"""
+        if not self.ready or self.listener_task is None or self.listener_task.done():
+            return None
+        now = time.time()
+        self._prune(now)
+        expires_at = self.revoked.get(jti)
+        return expires_at is not None and expires_at > now
+
+    async def is_revoked_async(self, jti: str) -> bool:
+        revoked = self.check_local(jti)
+        if revoked is not None:
+            return revoked
+        return await redis_manager.exists_async(self.blacklist_key(jti))
+
+    async def revoke_async(self, jti: str, expires_at: Optional[float] = None) -> None:
+        """撤销 jti 直到 expires_at（默认为 access token 的完整有效期）"""
+        now = time.time()
+        max_ttl = settings.jwt.JWT_ACCESS_TOKEN_EXPIRATION
+        if expires_at is None:
+            expires_at = now + max_ttl
+        ttl = int(expires_at - now) + 1
+        if ttl <= 0:
+            return
+
+        self._add(jti, expires_at)
+        async with redis_manager.pipeline_async() as pipe:
+            pipe.set(self.blacklist_key(jti), "1", ex=ttl)
+            pipe.zadd(self.zset_key, {jti: expires_at})
+            pipe.zremrangebyscore(self.zset_key, "-inf", now)
+            pipe.expire(self.zset_key, max_ttl + 60)
+            pipe.publish(
+                self.channel, json.dumps({"jti": jti, "expires_at": expires_at})
+            )
+
+    async def _backfill(self, client) -> None:
+        """把只有 blacklist 键的撤销（引入 ZSET 之前的登出）补入 ZSET
+
+        按 SCAN + TTL 还原过期时间；键数量最多为一个令牌有效期内的登出次数。
+        旧键最多存活一个令牌有效期，完成后写入标记，之后的加载与重连不再 SCAN；
+        标记在补入完成后才写入，同时启动的 worker 各自补入一次，不会读到未补全的 ZSET。
+        """
+        max_ttl = settings.jwt.JWT_ACCESS_TOKEN_EXPIRATION
+        if await client.exists(self.backfill_marker_key):
+            return
+        prefix = self.blacklist_key("")
+        keys = [key async for key in client.scan_iter(match=f"{prefix}*", count=1000)]
+        entries: Dict[str, float] = {}
+        if keys:
+            now = time.time()
+            async with redis_manager.pipeline_async() as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+            entries = {
+                key[len(prefix) :]: now + ttl
+                for key, ttl in zip(keys, ttls)
+                if ttl is not None and ttl > 0
+            }
+        async with redis_manager.pipeline_async() as pipe:
+            if entries:
+                pipe.zadd(self.zset_key, entries)
+                pipe.expire(self.zset_key, max_ttl + 60)
+            pipe.set(self.backfill_marker_key, "1", ex=max_ttl, nx=True)
+        self.logger.info(
+            f"Backfilled {len(entries)} revoked tokens into {self.zset_key}"
+        )
+
+    async def _load(self) -> None:
+        """从 Redis 加载所有尚未过期的撤销"""
+        client = await redis_manager.get_async_client()
+        await self._backfill(client)
+        now = time.time()
+        entries = await client.zrangebyscore(
+            self.zset_key, now, "+inf", withscores=True
+        )
+        self.revoked = {}
+        for jti, expires_at in entries:
+            self._add(jti, expires_at)
+
+    def apply_message(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+            self._add(message["jti"], float(message["expires_at"]))
+        except (TypeError, ValueError, KeyError):
+            self.logger.warning(f"Ignoring malformed token revocation: {data!r}")
+
+    async def start_listener(self) -> None:
+        """启动撤销广播监听（FastAPI 生命周期内调用）"""
+        if self.listener_task and not self.listener_task.done():
+            return
+        self.listener_task = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        if not self.listener_task:
+            return
+        self.listener_task.cancel()
+        try:
+            await self.listener_task
+        except asyncio.CancelledError:
+            pass
+        self.listener_task = None
+        self.ready = False
+        self.revoked = {}
+
+    async def _listen(self) -> None:
+        while True:
+            self.ready = False
+            try:
+                client = await redis_manager.get_async_client()
+                async with client.pubsub() as pubsub:
+                    # 先订阅再加载，加载期间的撤销广播不会丢失
+                    await pubsub.subscribe(self.channel)
+                    await self._load()
+                    self.ready = True
+                    self.logger.info(
+                        f"✅ Loaded {len(self.revoked)} revoked tokens, subscribed to {self.channel}"
+                    )
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.apply_message(message["data"])
+            except asyncio.CancelledError:
+                self.ready = False
+                raise
+            except Exception as e:
+                self.logger.warning(f"Token revocation listener failed: {e}")
+                await asyncio.sleep(1)
+
+
+# 已登出的 access token
+access_token_revocations = TokenRevocationList("access_token")
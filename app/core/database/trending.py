@@ -0,0 +1,225 @@
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config.settings import settings
+from app.core.database.redis import redis_manager
+
+# 衰减分数的时间基准（2025-01-01 UTC），分数只在同一基准下可比
+TRENDING_EPOCH = 1735689600
+
+# 滚动窗口 -> 小时桶数量
+TRENDING_WINDOWS = {"24h": 24, "7d": 24 * 7, "30d": 24 * 30}
+
+# 累计排行的有效期：到期后由读取方从数据库重新加载，纠正增量维护可能累积的偏差
+LEADERBOARD_TTL = 86400
+
+# 博客互动事件权重
+BLOG_ENGAGEMENT_WEIGHTS = {"view": 1, "like": 3, "save": 4, "comment": 5}
+
+# 记录一次互动：更新时间衰减分数并累加到当前小时桶
+# 衰减分数保存在对数空间：score = ln(Σ weight * e^((t - epoch) / τ))，
+# 新事件的增量越来越大等价于旧事件按指数衰减，且不会溢出
+# KEYS[1] = 衰减分数 ZSET, KEYS[2] = 当前小时桶 ZSET
+# ARGV[1] = 成员, ARGV[2] = ln(weight) + (t - epoch) / τ, ARGV[3] = weight, ARGV[4] = 小时桶 TTL
+RECORD_ENGAGEMENT_SCRIPT = """
+local add = tonumber(ARGV[2])
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if current then
+    current = tonumber(current)
+    local high = math.max(current, add)
+    add = high + math.log(math.exp(current - high) + math.exp(add - high))
+end
+redis.call('ZADD', KEYS[1], add, ARGV[1])
+redis.call('ZINCRBY', KEYS[2], ARGV[3], ARGV[1])
+if redis.call('TTL', KEYS[2]) < 0 then
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+return 1
+"""
+
+# 排行榜已完整加载时才写入，避免写出只含部分成员的排行榜
+# KEYS[1] = 排行榜 ZSET; ARGV[1] = 'incr' 或 'set'; ARGV[2..] = score1, member1, ...
+UPDATE_LEADERBOARD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    if ARGV[1] == 'incr' then
+        redis.call('ZINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    else
+        redis.call('ZADD', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+
+class TrendingRanking:
+    """时间衰减热度排行 - Redis ZSET
+
+    trending:{name}:score               对数空间的衰减热度，半衰期 REDIS_TRENDING_HALF_LIFE_HOURS
+    trending:{name}:hour:{YYYYMMDDHH}   每小时的互动权重之和，用于 24h / 7d / 30d 滚动窗口
+    trending:{name}:window:{window}     滚动窗口的合并结果，短暂缓存
+    """
+
+    def __init__(self, name: str, weights: Dict[str, int]):
+        self.name = name
+        self.weights = weights
+        self.score_key = f"trending:{name}:score"
+
+    @property
+    def half_life_seconds(self) -> float:
+        return settings.redis.REDIS_TRENDING_HALF_LIFE_HOURS * 3600
+
+    def hour_key(self, moment: datetime) -> str:
+        return f"trending:{self.name}:hour:{moment:%Y%m%d%H}"
+
+    def window_key(self, window: str) -> str:
+        return f"trending:{self.name}:window:{window}"
+
+    def window_hour_keys(self, window: str) -> List[str]:
+        now = datetime.now(timezone.utc)
+        return [
+            self.hour_key(now - timedelta(hours=offset))
+            for offset in range(TRENDING_WINDOWS[window])
+        ]
+
+    def log_increment(self, weight: float, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return math.log(weight) + (now - TRENDING_EPOCH) * math.log(2) / (
+            self.half_life_seconds
+        )
+
+    def decayed_score(self, raw_score: float, now: Optional[float] = None) -> float:
+        """把对数空间分数换算为当前时刻的衰减热度"""
+        now = time.time() if now is None else now
+        return math.exp(
+            raw_score - (now - TRENDING_EPOCH) * math.log(2) / self.half_life_seconds
+        )
+
+    async def record_async(self, entity_id: int, event: str) -> None:
+        """记录一次互动事件（取消点赞 / 收藏等负向事件不记录，由衰减自然淡出）"""
+        weight = self.weights[event]
+        script = await redis_manager.get_async_script(RECORD_ENGAGEMENT_SCRIPT)
+        await script(
+            keys=[self.score_key, self.hour_key(datetime.now(timezone.utc))],
+            args=[
+                entity_id,
+                self.log_increment(weight),
+                weight,
+                (TRENDING_WINDOWS["30d"] + 1) * 3600,
+            ],
+        )
+
+    async def top_async(
+        self, limit: int, window: Optional[str] = None
+    ) -> List[Tuple[int, float]]:
+        """热度前 limit 的 (id, 分数)；window 为空时按衰减热度，否则按滚动窗口内的权重和"""
+        client = await redis_manager.get_async_client()
+        if window is None:
+            rows = await client.zrevrange(self.score_key, 0, limit - 1, withscores=True)
+            return [(int(member), self.decayed_score(score)) for member, score in rows]
+
+        window_key = self.window_key(window)
+        if not await client.exists(window_key):
+            # 合并结果缓存 60 秒，窗口按小时滚动，无需每次请求重新合并
+            async with redis_manager.pipeline_async() as pipe:
+                pipe.zunionstore(window_key, self.window_hour_keys(window))
+                pipe.expire(window_key, 60)
+        rows = await client.zrevrange(window_key, 0, limit - 1, withscores=True)
+        return [(int(member), score) for member, score in rows]
+
+    async def remove_async(self, entity_id: int) -> None:
+        """从衰减热度中移除（取消发布 / 删除）；小时桶中的记录由调用方读取时过滤"""
+        client = await redis_manager.get_async_client()
+        await client.zrem(self.score_key, entity_id)
+
+
+class Leaderboard:
+    """按指标的累计排行 - 每个指标一个 ZSET，分数为累计值
+
+    leaderboard:{name}:{metric}
+
+    排行榜需要先从数据库完整加载（seed_async），之后由写路径增量维护；
+    未加载时所有写入都会被忽略，读取方应回退到数据库并加载。
+    加载后 LEADERBOARD_TTL 秒过期，定期从数据库重新加载。
+    """
+
+    def __init__(self, name: str, metrics: Sequence[str]):
+        self.name = name
+        self.metrics = tuple(metrics)
+
+    def key(self, metric: str) -> str:
+        return f"leaderboard:{self.name}:{metric}"
+
+    @staticmethod
+    def _score_args(mode: str, scores: Dict[int, int]) -> List:
+        args: List = [mode]
+        for entity_id, score in scores.items():
+            args.extend([score, entity_id])
+        return args
+
+    async def is_loaded_async(self) -> bool:
+        client = await redis_manager.get_async_client()
+        keys = [self.key(metric) for metric in self.metrics]
+        return await client.exists(*keys) == len(keys)
+
+    async def seed_async(self, rows: Iterable[Dict[str, int]]) -> None:
+        """从数据库的完整统计加载排行榜，rows 需包含 id 与各指标"""
+        rows = list(rows)
+        if not rows:
+            return
+        async with redis_manager.pipeline_async(transaction=True) as pipe:
+            for metric in self.metrics:
+                pipe.delete(self.key(metric))
+                pipe.zadd(self.key(metric), {row["id"]: row[metric] for row in rows})
+                pipe.expire(self.key(metric), LEADERBOARD_TTL)
+
+    async def incr_async(self, entity_id: int, metric: str, delta: int) -> None:
+        script = await redis_manager.get_async_script(UPDATE_LEADERBOARD_SCRIPT)
+        await script(
+            keys=[self.key(metric)],
+            args=self._score_args("incr", {entity_id: delta}),
+        )
+
+    async def remove_async(self, entity_id: int) -> None:
+        async with redis_manager.pipeline_async() as pipe:
+            for metric in self.metrics:
+                pipe.zrem(self.key(metric), entity_id)
+
+    def set_sync(self, stats: Dict[int, Dict[str, int]]) -> None:
+        """写入落库后的最新累计值"""
+        script = redis_manager.get_sync_script(UPDATE_LEADERBOARD_SCRIPT)
+        with redis_manager.pipeline_sync() as pipe:
+            for metric in self.metrics:
+                scores = {
+                    entity_id: values[metric]
+                    for entity_id, values in stats.items()
+                    if metric in values
+                }
+                if scores:
+                    script(
+                        keys=[self.key(metric)],
+                        args=self._score_args("set", scores),
+                        client=pipe,
+                    )
+
+    async def top_async(self, limit: int) -> Dict[str, List[Tuple[int, int]]]:
+        """每个指标前 limit 的 (id, 累计值)，一次往返"""
+        async with redis_manager.pipeline_async() as pipe:
+            for metric in self.metrics:
+                pipe.zrevrange(self.key(metric), 0, limit - 1, withscores=True)
+            results = await pipe.execute()
+        return {
+            metric: [(int(member), int(score)) for member, score in rows]
+            for metric, rows in zip(self.metrics, results)
+        }
+
+
+# 博客热度排行（热门博客）
+blog_trending = TrendingRanking("blog", BLOG_ENGAGEMENT_WEIGHTS)
+
+# 博客各项统计的累计排行（分析后台前十排行）
+blog_leaderboard = Leaderboard("blog", ("views", "likes", "comments", "saves"))
@@ -1,4 +1,9 @@
+import asyncio
+import hashlib
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple, Union
 
@@ -71,19 +76,30 @@ class PasswordValidator:
 
 
 class PasswordHasher:
-    """Handles password hashing and verification using Argon2 only"""
+    """Handles password hashing and verification using Argon2 only
+
+    Argon2 每次计算占用 PASSWORD_HASH_MEMORY_COST 内存并耗时数十毫秒，异步路径
+    （hash_async / verify_async）在有界线程池中执行，不阻塞事件循环；线程数即
+    同时进行的计算数上限，其余请求在线程池队列中等待，内存占用不随并发登录增长。
+    """
 
     def __init__(self):
         self.logger = logger_manager.get_logger(__name__)
+        password_settings = settings.password
 
         # 使用Argon2 - 高性能配置
         self.ph = argon2.PasswordHasher(
-            time_cost=2,  # 时间成本（迭代次数）- 优化性能
-            memory_cost=65536,  # 内存成本（64MB）
-            parallelism=1,  # 并行度
+            time_cost=password_settings.PASSWORD_HASH_TIME_COST,  # 时间成本（迭代次数）
+            memory_cost=password_settings.PASSWORD_HASH_MEMORY_COST,  # 内存成本（KiB）
+            parallelism=password_settings.PASSWORD_HASH_PARALLELISM,  # 并行度
             hash_len=32,  # 哈希长度
             salt_len=16,  # 盐长度
         )
+        # argon2-cffi 计算期间释放 GIL，线程池可以真正并行
+        self.executor = ThreadPoolExecutor(
+            max_workers=password_settings.PASSWORD_HASH_MAX_CONCURRENCY,
+            thread_name_prefix="argon2",
+        )
         self.logger.info("Using Argon2 for password hashing")
 
     def hash(self, password: str) -> str:
@@ -108,9 +124,34 @@ class PasswordHasher:
             self.logger.error(f"Error verifying password: {e}")
             return False
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """哈希参数与当前配置不一致时返回 True（登录成功后应重新哈希）"""
+        try:
+            return self.ph.check_needs_rehash(hashed_password)
+        except Exception as e:
+            self.logger.error(f"Error checking password hash parameters: {e}")
+            return False
+
+    async def hash_async(self, password: str) -> str:
+        """在线程池中哈希密码"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """在线程池中校验密码"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.verify, plain_password, hashed_password
+        )
+
 
 class JWTManager:
-    """Handles JWT token creation, decoding and validation"""
+    """Handles JWT token creation, decoding and validation
+
+    同一个 access token 在有效期内会被反复提交，验签成功的声明按令牌摘要缓存在
+    有界 LRU 中直到 exp，命中时跳过 HMAC 验签与声明解析。缓存只保存通过本实例
+    issuer / audience 校验的令牌，过期判断与 PyJWT 一致（now >= exp 即过期）。
+    """
 
     def __init__(
         self,
@@ -120,6 +161,7 @@ class JWTManager:
         audience: str,
         access_token_expiry: int,
         refresh_token_expiry: int,
+        claims_cache_size: int = 4096,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
@@ -128,6 +170,9 @@ class JWTManager:
         self.access_token_expiry = access_token_expiry
         self.refresh_token_expiry = refresh_token_expiry
         self.logger = logger
+        # 令牌 SHA-256 摘要 -> 已验证的声明
+        self.claims_cache_size = claims_cache_size
+        self.claims_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
 
     def timestamp_to_datetime(self, timestamp: int) -> datetime:
         """Convert a Unix timestamp to a UTC datetime object"""
@@ -170,6 +215,36 @@ class JWTManager:
         Decode and validate a JWT token.
         Optionally verify the JTI claim if provided.
         """
+        claims = self._get_cached_claims(token)
+        if claims is None:
+            claims = self._verify_token(token)
+            if claims is None:
+                return None
+
+        if expected_jti and claims.get("jti") != expected_jti:
+            self.logger.error("JTI mismatch. Token invalid.")
+            return None
+
+        # 返回副本，调用方修改声明不会影响缓存
+        return dict(claims)
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _get_cached_claims(self, token: str) -> Optional[Dict]:
+        digest = self._token_digest(token)
+        claims = self.claims_cache.get(digest)
+        if claims is None:
+            return None
+        if time.time() >= claims["exp"]:
+            del self.claims_cache[digest]
+            return None
+        self.claims_cache.move_to_end(digest)
+        return claims
+
+    def _verify_token(self, token: str) -> Optional[Dict]:
+        """验签并校验声明，成功时写入缓存"""
         try:
             decoded_token = jwt.decode(
                 token,
@@ -179,23 +254,22 @@ class JWTManager:
                 issuer=self.issuer,
                 options={"require": ["iss", "aud", "exp"]},
             )
-
-            if expected_jti and decoded_token.get("jti") != expected_jti:
-                self.logger.error("JTI mismatch. Token invalid.")
-                return None
-
-            self.logger.info(
-                f"Token decoded successfully for user_id: {
-                    decoded_token.get('user_id')
-                }"
-            )
-            return decoded_token
-
         except ExpiredSignatureError:
             self.logger.warning("JWT token has expired.")
+            return None
         except (InvalidTokenError, DecodeError) as e:
             self.logger.error(f"Invalid JWT token: {e}")
-        return None
+            return None
+
+        self.logger.debug(
+            f"Token decoded successfully for user_id: {decoded_token.get('user_id')}"
+        )
+        # 带 nbf 的令牌在生效前无效，不缓存（本服务签发的令牌不含 nbf）
+        if "nbf" not in decoded_token and isinstance(decoded_token["exp"], int):
+            self.claims_cache[self._token_digest(token)] = decoded_token
+            while len(self.claims_cache) > self.claims_cache_size:
+                self.claims_cache.popitem(last=False)
+        return decoded_token
 
 
 class SecurityManager:
@@ -211,6 +285,7 @@ class SecurityManager:
             audience=settings.jwt.JWT_AUDIENCE,
             access_token_expiry=settings.jwt.JWT_ACCESS_TOKEN_EXPIRATION,
             refresh_token_expiry=settings.jwt.JWT_REFRESH_TOKEN_EXPIRATION,
+            claims_cache_size=settings.jwt.JWT_CLAIMS_CACHE_SIZE,
         )
 
     def validate_password(self, password: str) -> bool:
@@ -225,6 +300,20 @@ class SecurityManager:
         """Verify a password against its hash"""
         return self.hasher.verify(plain_password, hashed_password)
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password without blocking the event loop"""
+        return await self.hasher.hash_async(password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Verify a password without blocking the event loop"""
+        return await self.hasher.verify_async(plain_password, hashed_password)
+
+    def password_needs_rehash(self, hashed_password: str) -> bool:
+        """Whether the hash was made with outdated Argon2 parameters"""
+        return self.hasher.needs_rehash(hashed_password)
+
     def create_access_token(self, data: Dict) -> Tuple[str, datetime]:
         """Create an access token"""
         return self.jwt_manager.create_access_token(data)
@@ -1,20 +1,29 @@
 import json
-from typing import List, Dict, Any
+from typing import Any, Dict, List
 from datetime import datetime, timezone, timedelta
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case
 from sqlmodel import select, func
+from app.models.analytics_model import (
+    Blog_Daily_Rollup,
+    Media_Daily_Rollup,
+    Payment_Daily_Rollup,
+    Project_Daily_Rollup,
+    User_Daily_Rollup,
+)
 from app.models.user_model import User
-from app.models.blog_model import Blog, Blog_Status, Blog_Stats, Blog_Tag
+from app.models.blog_model import Blog, Blog_Tag
 from app.models.project_model import Project, ProjectType
 from app.models.payment_model import Payment_Record, PaymentStatus, PaymentType
-from app.models.media_model import Media
 from app.models.section_model import Section
 from app.models.tag_model import Tag
 from app.core.logger import logger_manager
+from app.crud.blog_crud import ensure_blog_leaderboard_loaded
 from app.crud.project_crud import convert_project_type
 from app.core.database.mysql import mysql_manager
 from app.core.database.redis import redis_manager
+from app.core.database.trending import blog_leaderboard
 
 
 class AnalyticCrud:
@@ -41,6 +50,25 @@ class AnalyticCrud:
 
         return start, now
 
+    @staticmethod
+    def _sum_since(column: Any, day_column: Any, start: datetime) -> Any:
+        """汇总表中 start 当天及之后的桶之和"""
+        return func.sum(case((day_column >= start.date(), column), else_=0))
+
+    async def _get_cached(self, cache_key: str, build_name: str, *args: Any) -> Any:
+        """统计数据缓存 5 分钟；过期后先返回旧值，再在独立会话中后台刷新
+
+        build_name 为本类构建方法的名称，后台刷新时在新会话的实例上按名称调用。
+        """
+        return await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: getattr(self, build_name)(*args),
+            ex=300,
+            refresh=lambda: mysql_manager.run_in_session(
+                lambda db: getattr(AnalyticCrud(db), build_name)(*args)
+            ),
+        )
+
     async def get_user_location(self) -> List[Dict[str, Any]]:
         """Get all users' location (longitude and latitude)"""
         cache_key = "all_users_location"
@@ -69,42 +97,29 @@ class AnalyticCrud:
     async def get_blog_statistics(self) -> Dict[str, Any]:
         """获取博客统计数据"""
         cache_key = "analytics_blog_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
-
-        # 总博客数
-        total_blogs = await self.db.execute(select(func.count(Blog.id)))
-        total_blogs = total_blogs.scalar_one()
+        return await self._get_cached(cache_key, "_build_blog_statistics")
 
-        # 已发布博客数
-        published_blogs = await self.db.execute(
-            select(func.count(Blog_Status.id)).where(Blog_Status.is_published == True)
-        )
-        published_blogs = published_blogs.scalar_one()
-
-        # 归档博客数
-        archived_blogs = await self.db.execute(
-            select(func.count(Blog_Status.id)).where(Blog_Status.is_archived == True)
-        )
-        archived_blogs = archived_blogs.scalar_one()
-
-        # 精选博客数
-        featured_blogs = await self.db.execute(
-            select(func.count(Blog_Status.id)).where(Blog_Status.is_featured == True)
-        )
-        featured_blogs = featured_blogs.scalar_one()
-
-        # 本月新增博客
+    async def _build_blog_statistics(self) -> Dict[str, Any]:
+        # 总数、本月新增与累计浏览 / 点赞 / 评论 / 收藏均来自每日汇总表
         start_date, end_date = self._get_date_range("month")
-        new_blogs_this_month = await self.db.execute(
-            select(func.count(Blog.id)).where(
-                Blog.created_at >= start_date, Blog.created_at <= end_date
+        totals = await self.db.execute(
+            select(
+                func.sum(Blog_Daily_Rollup.blogs),
+                func.sum(Blog_Daily_Rollup.published),
+                func.sum(Blog_Daily_Rollup.archived),
+                func.sum(Blog_Daily_Rollup.featured),
+                self._sum_since(
+                    Blog_Daily_Rollup.blogs, Blog_Daily_Rollup.day, start_date
+                ),
+                func.sum(Blog_Daily_Rollup.views),
+                func.sum(Blog_Daily_Rollup.likes),
+                func.sum(Blog_Daily_Rollup.comments),
+                func.sum(Blog_Daily_Rollup.saves),
             )
         )
-        new_blogs_this_month = new_blogs_this_month.scalar_one()
+        totals_row = totals.first()
 
-        # 本月更新博客
+        # 本月更新博客（按 updated_at 索引只扫描本月范围）
         updated_blogs_this_month = await self.db.execute(
             select(func.count(Blog.id)).where(
                 Blog.updated_at >= start_date, Blog.updated_at <= end_date
@@ -112,141 +127,77 @@ class AnalyticCrud:
         )
         updated_blogs_this_month = updated_blogs_this_month.scalar_one()
 
-        # 总浏览量、点赞、评论、收藏
-        stats_totals = await self.db.execute(
-            select(
-                func.sum(Blog_Stats.views),
-                func.sum(Blog_Stats.likes),
-                func.sum(Blog_Stats.comments),
-                func.sum(Blog_Stats.saves),
-            )
-        )
-        stats_row = stats_totals.first()
-
         # 各栏目博客分布
         section_distribution = await self.db.execute(
-            select(Section.chinese_title, func.count(Blog.id))
-            .join(Blog, Blog.section_id == Section.id)
+            select(Section.chinese_title, func.sum(Blog_Daily_Rollup.blogs))
+            .join(Blog_Daily_Rollup, Blog_Daily_Rollup.section_id == Section.id)
             .group_by(Section.id, Section.chinese_title)
-            .order_by(func.count(Blog.id).desc())
+            .order_by(func.sum(Blog_Daily_Rollup.blogs).desc())
         )
         section_dist = [
-            {"section": row[0], "count": row[1]} for row in section_distribution.all()
+            {"section": row[0], "count": int(row[1])}
+            for row in section_distribution.all()
         ]
 
         result = {
-            "total_blogs": total_blogs,
-            "published_blogs": published_blogs,
-            "archived_blogs": archived_blogs,
-            "featured_blogs": featured_blogs,
-            "new_blogs_this_month": new_blogs_this_month,
+            "total_blogs": int(totals_row[0] or 0),
+            "published_blogs": int(totals_row[1] or 0),
+            "archived_blogs": int(totals_row[2] or 0),
+            "featured_blogs": int(totals_row[3] or 0),
+            "new_blogs_this_month": int(totals_row[4] or 0),
             "updated_blogs_this_month": updated_blogs_this_month,
-            "total_views": int(stats_row[0] or 0),
-            "total_likes": int(stats_row[1] or 0),
-            "total_comments": int(stats_row[2] or 0),
-            "total_saves": int(stats_row[3] or 0),
+            "total_views": int(totals_row[5] or 0),
+            "total_likes": int(totals_row[6] or 0),
+            "total_comments": int(totals_row[7] or 0),
+            "total_saves": int(totals_row[8] or 0),
             "section_distribution": section_dist,
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_top_ten_blog_performers(self) -> Dict[str, Any]:
         """获取博客热门前十排行"""
         cache_key = "analytics_top_ten_blog_performers"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_top_ten_blog_performers")
 
-        # 最多浏览
-        top_views = await self.db.execute(
-            select(Blog.slug, Section.slug, Blog.chinese_title, Blog_Stats.views)
-            .join(Blog_Stats, Blog_Stats.blog_id == Blog.id)
-            .join(Section, Section.id == Blog.section_id)
-            .order_by(Blog_Stats.views.desc())
-            .limit(10)
-        )
-        top_views_list = [
-            {
-                "blog_slug": row[0],
-                "section_slug": row[1],
-                "title": row[2],
-                "views": row[3],
-            }
-            for row in top_views.all()
-        ]
-
-        # 最多点赞
-        top_likes = await self.db.execute(
-            select(Blog.slug, Section.slug, Blog.chinese_title, Blog_Stats.likes)
-            .join(Blog_Stats, Blog_Stats.blog_id == Blog.id)
-            .join(Section, Section.id == Blog.section_id)
-            .order_by(Blog_Stats.likes.desc())
-            .limit(10)
-        )
-        top_likes_list = [
-            {
-                "blog_slug": row[0],
-                "section_slug": row[1],
-                "title": row[2],
-                "likes": row[3],
-            }
-            for row in top_likes.all()
-        ]
+    async def _build_top_ten_blog_performers(self) -> Dict[str, Any]:
+        # 排名来自 Redis 中按指标维护的累计排行（ZSET），不再对 Blog_Stats 逐指标排序
+        await ensure_blog_leaderboard_loaded(self.db)
 
-        # 最多评论
-        top_comments = await self.db.execute(
-            select(Blog.slug, Section.slug, Blog.chinese_title, Blog_Stats.comments)
-            .join(Blog_Stats, Blog_Stats.blog_id == Blog.id)
-            .join(Section, Section.id == Blog.section_id)
-            .order_by(Blog_Stats.comments.desc())
-            .limit(10)
-        )
-        top_comments_list = [
-            {
-                "blog_slug": row[0],
-                "section_slug": row[1],
-                "title": row[2],
-                "comments": row[3],
-            }
-            for row in top_comments.all()
-        ]
+        ranking = await blog_leaderboard.top_async(10)
+        blog_ids = {blog_id for rows in ranking.values() for blog_id, _ in rows}
+        if not blog_ids:
+            return {f"top_{metric}": [] for metric in blog_leaderboard.metrics}
 
-        # 最多收藏
-        top_saves = await self.db.execute(
-            select(Blog.slug, Section.slug, Blog.chinese_title, Blog_Stats.saves)
-            .join(Blog_Stats, Blog_Stats.blog_id == Blog.id)
+        # 一次查询取出所有上榜博客的信息
+        blogs = await self.db.execute(
+            select(Blog.id, Blog.slug, Section.slug, Blog.chinese_title)
             .join(Section, Section.id == Blog.section_id)
-            .order_by(Blog_Stats.saves.desc())
-            .limit(10)
-        )
-        top_saves_list = [
-            {
-                "blog_slug": row[0],
-                "section_slug": row[1],
-                "title": row[2],
-                "saves": row[3],
-            }
-            for row in top_saves.all()
-        ]
+            .where(Blog.id.in_(blog_ids))
+        )
+        blog_info = {row[0]: row[1:] for row in blogs.all()}
+
+        result = {}
+        for metric in blog_leaderboard.metrics:
+            result[f"top_{metric}"] = [
+                {
+                    "blog_slug": blog_info[blog_id][0],
+                    "section_slug": blog_info[blog_id][1],
+                    "title": blog_info[blog_id][2],
+                    metric: score,
+                }
+                for blog_id, score in ranking[metric]
+                if blog_id in blog_info
+            ]
 
-        result = {
-            "top_views": top_views_list,
-            "top_likes": top_likes_list,
-            "top_comments": top_comments_list,
-            "top_saves": top_saves_list,
-        }
-
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_tag_statistics(self, limit: int = 20) -> List[Dict[str, Any]]:
         """获取标签统计（热门标签）"""
         cache_key = f"analytics_tag_statistics_{limit}"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_tag_statistics", limit)
 
+    async def _build_tag_statistics(self, limit: int = 20) -> List[Dict[str, Any]]:
         tag_stats = await self.db.execute(
             select(Tag.slug, Tag.chinese_title, func.count(Blog_Tag.id))
             .join(Blog_Tag, Blog_Tag.tag_id == Tag.id)
@@ -264,154 +215,115 @@ class AnalyticCrud:
             for row in tag_stats.all()
         ]
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_project_statistics(self) -> Dict[str, Any]:
         """获取项目统计数据"""
         cache_key = "analytics_project_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
-
-        # 总项目数
-        total_projects = await self.db.execute(select(func.count(Project.id)))
-        total_projects = total_projects.scalar_one()
-
-        # 已发布项目数
-        published_projects = await self.db.execute(
-            select(func.count(Project.id)).where(Project.is_published == True)
-        )
-        published_projects = published_projects.scalar_one()
+        return await self._get_cached(cache_key, "_build_project_statistics")
 
-        # 本月新增项目
-        start_date, end_date = self._get_date_range("month")
-        new_projects_this_month = await self.db.execute(
-            select(func.count(Project.id)).where(
-                Project.created_at >= start_date, Project.created_at <= end_date
+    async def _build_project_statistics(self) -> Dict[str, Any]:
+        # 总数与本月新增来自每日汇总表
+        start_date, _ = self._get_date_range("month")
+        totals = await self.db.execute(
+            select(
+                func.sum(Project_Daily_Rollup.projects),
+                func.sum(Project_Daily_Rollup.published),
+                self._sum_since(
+                    Project_Daily_Rollup.projects, Project_Daily_Rollup.day, start_date
+                ),
             )
         )
-        new_projects_this_month = new_projects_this_month.scalar_one()
+        totals_row = totals.first()
 
         # 项目类型分布
         type_distribution = await self.db.execute(
-            select(Project.type, func.count(Project.id)).group_by(Project.type)
+            select(
+                Project_Daily_Rollup.type, func.sum(Project_Daily_Rollup.projects)
+            ).group_by(Project_Daily_Rollup.type)
         )
         type_dist = {
-            convert_project_type(ProjectType(row[0]).name): row[1]
+            convert_project_type(ProjectType(row[0]).name): int(row[1])
             for row in type_distribution.all()
         }
 
         # 各栏目项目分布
         section_distribution = await self.db.execute(
-            select(Section.chinese_title, func.count(Project.id))
-            .join(Project, Project.section_id == Section.id)
-            .where(Project.section_id.isnot(None))
+            select(Section.chinese_title, func.sum(Project_Daily_Rollup.projects))
+            .join(Project_Daily_Rollup, Project_Daily_Rollup.section_id == Section.id)
             .group_by(Section.id, Section.chinese_title)
-            .order_by(func.count(Project.id).desc())
+            .order_by(func.sum(Project_Daily_Rollup.projects).desc())
         )
         section_dist = [
-            {"section": row[0], "count": row[1]} for row in section_distribution.all()
+            {"section": row[0], "count": int(row[1])}
+            for row in section_distribution.all()
         ]
 
         result = {
-            "total_projects": total_projects,
-            "published_projects": published_projects,
-            "new_projects_this_month": new_projects_this_month,
+            "total_projects": int(totals_row[0] or 0),
+            "published_projects": int(totals_row[1] or 0),
+            "new_projects_this_month": int(totals_row[2] or 0),
             "type_distribution": type_dist,
             "section_distribution": section_dist,
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_payment_statistics(self) -> Dict[str, Any]:
         """获取支付统计数据"""
         cache_key = "analytics_payment_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
-
-        # 总收入（仅成功的支付）
-        total_revenue = await self.db.execute(
-            select(func.sum(Payment_Record.amount)).where(
-                Payment_Record.payment_status == PaymentStatus.success
-            )
-        )
-        total_revenue = float(total_revenue.scalar_one() or 0)
-
-        # 总支付记录数
-        total_payments = await self.db.execute(select(func.count(Payment_Record.id)))
-        total_payments = total_payments.scalar_one()
-
-        # 成功支付数
-        successful_payments = await self.db.execute(
-            select(func.count(Payment_Record.id)).where(
-                Payment_Record.payment_status == PaymentStatus.success
-            )
-        )
-        successful_payments = successful_payments.scalar_one()
-
-        # 本月收入
-        start_date, end_date = self._get_date_range("month")
-        monthly_revenue = await self.db.execute(
-            select(func.sum(Payment_Record.amount)).where(
-                Payment_Record.payment_status == PaymentStatus.success,
-                Payment_Record.created_at >= start_date,
-                Payment_Record.created_at <= end_date,
-            )
-        )
-        monthly_revenue = float(monthly_revenue.scalar_one() or 0)
+        return await self._get_cached(cache_key, "_build_payment_statistics")
 
-        # 本月支付数
-        monthly_payments = await self.db.execute(
-            select(func.count(Payment_Record.id)).where(
-                Payment_Record.created_at >= start_date,
-                Payment_Record.created_at <= end_date,
-            )
-        )
-        monthly_payments = monthly_payments.scalar_one()
-
-        # 本年收入
+    async def _build_payment_statistics(self) -> Dict[str, Any]:
+        # 按支付方式与状态汇总一次，其余指标在内存中合计（最多 方式数 × 状态数 行）
+        month_start, _ = self._get_date_range("month")
         year_start, _ = self._get_date_range("year")
-        yearly_revenue = await self.db.execute(
-            select(func.sum(Payment_Record.amount)).where(
-                Payment_Record.payment_status == PaymentStatus.success,
-                Payment_Record.created_at >= year_start,
-                Payment_Record.created_at <= end_date,
-            )
-        )
-        yearly_revenue = float(yearly_revenue.scalar_one() or 0)
-
-        # 支付方式分布
-        payment_type_distribution = await self.db.execute(
-            select(Payment_Record.payment_type, func.count(Payment_Record.id)).group_by(
-                Payment_Record.payment_type
-            )
-        )
-        payment_type_dist = {
-            PaymentType(row[0]).name.capitalize(): row[1]
-            for row in payment_type_distribution.all()
-        }
-
-        # 支付状态分布
-        payment_status_distribution = await self.db.execute(
+        rollup = Payment_Daily_Rollup
+        groups = await self.db.execute(
             select(
-                Payment_Record.payment_status, func.count(Payment_Record.id)
-            ).group_by(Payment_Record.payment_status)
-        )
-        payment_status_dist = {
-            PaymentStatus(row[0]).name: row[1]
-            for row in payment_status_distribution.all()
-        }
-
-        # 总税费
-        total_tax = await self.db.execute(
-            select(func.sum(Payment_Record.tax_amount)).where(
-                Payment_Record.payment_status == PaymentStatus.success
+                rollup.payment_type,
+                rollup.payment_status,
+                func.sum(rollup.payments),
+                func.sum(rollup.amount),
+                func.sum(rollup.tax_amount),
+                self._sum_since(rollup.payments, rollup.day, month_start),
+                self._sum_since(rollup.amount, rollup.day, month_start),
+                self._sum_since(rollup.amount, rollup.day, year_start),
+            ).group_by(rollup.payment_type, rollup.payment_status)
+        )
+
+        total_revenue = total_tax = monthly_revenue = yearly_revenue = 0.0
+        total_payments = successful_payments = monthly_payments = 0
+        payment_type_dist: Dict[str, int] = {}
+        payment_status_dist: Dict[str, int] = {}
+        for (
+            payment_type,
+            payment_status,
+            payments,
+            amount,
+            tax_amount,
+            month_payments,
+            month_amount,
+            year_amount,
+        ) in groups.all():
+            payments = int(payments or 0)
+            total_payments += payments
+            monthly_payments += int(month_payments or 0)
+            type_name = PaymentType(payment_type).name.capitalize()
+            payment_type_dist[type_name] = (
+                payment_type_dist.get(type_name, 0) + payments
             )
-        )
-        total_tax = float(total_tax.scalar_one() or 0)
+            status_name = PaymentStatus(payment_status).name
+            payment_status_dist[status_name] = (
+                payment_status_dist.get(status_name, 0) + payments
+            )
+            # 收入与税费仅统计成功的支付
+            if payment_status == PaymentStatus.success:
+                successful_payments += payments
+                total_revenue += float(amount or 0)
+                total_tax += float(tax_amount or 0)
+                monthly_revenue += float(month_amount or 0)
+                yearly_revenue += float(year_amount or 0)
 
         result = {
             "total_revenue": total_revenue,
@@ -425,16 +337,14 @@ class AnalyticCrud:
             "payment_status_distribution": payment_status_dist,
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_top_ten_revenue_projects(self) -> List[Dict[str, Any]]:
         """获取收入最高的前十项目"""
         cache_key = "analytics_top_ten_revenue_projects"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_top_ten_revenue_projects")
 
+    async def _build_top_ten_revenue_projects(self) -> List[Dict[str, Any]]:
         top_projects = await self.db.execute(
             select(
                 Project.slug,
@@ -459,94 +369,73 @@ class AnalyticCrud:
             for row in top_projects.all()
         ]
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_media_statistics(self) -> Dict[str, Any]:
         """获取媒体文件统计"""
         cache_key = "analytics_media_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_media_statistics")
 
-        # 总文件数
-        total_media = await self.db.execute(select(func.count(Media.id)))
-        total_media = total_media.scalar_one()
-
-        # 头像数量
-        avatar_count = await self.db.execute(
-            select(func.count(Media.id)).where(Media.is_avatar == True)
-        )
-        avatar_count = avatar_count.scalar_one()
-
-        # 本月新增文件
-        start_date, end_date = self._get_date_range("month")
-        new_media_this_month = await self.db.execute(
-            select(func.count(Media.id)).where(
-                Media.created_at >= start_date, Media.created_at <= end_date
+    async def _build_media_statistics(self) -> Dict[str, Any]:
+        start_date, _ = self._get_date_range("month")
+        totals = await self.db.execute(
+            select(
+                func.sum(Media_Daily_Rollup.media),
+                func.sum(Media_Daily_Rollup.avatars),
+                self._sum_since(
+                    Media_Daily_Rollup.media, Media_Daily_Rollup.day, start_date
+                ),
             )
         )
-        new_media_this_month = new_media_this_month.scalar_one()
+        totals_row = totals.first()
 
         result = {
-            "total_media": total_media,
-            "avatar_count": avatar_count,
-            "new_media_this_month": new_media_this_month,
+            "total_media": int(totals_row[0] or 0),
+            "avatar_count": int(totals_row[1] or 0),
+            "new_media_this_month": int(totals_row[2] or 0),
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_growth_trends(self, days: int = 30) -> Dict[str, Any]:
         """获取增长趋势数据（最近N天）"""
         cache_key = f"analytics_growth_trends_{days}"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_growth_trends", days)
 
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+    async def _build_growth_trends(self, days: int = 30) -> Dict[str, Any]:
+        start_day = (datetime.now(timezone.utc) - timedelta(days=days)).date()
 
         # 用户增长趋势
         user_growth = await self.db.execute(
-            select(
-                func.date(User.created_at).label("date"),
-                func.count(User.id).label("count"),
-            )
-            .where(User.created_at >= start_date)
-            .group_by(func.date(User.created_at))
-            .order_by(func.date(User.created_at))
+            select(User_Daily_Rollup.day, User_Daily_Rollup.users)
+            .where(User_Daily_Rollup.day >= start_day)
+            .order_by(User_Daily_Rollup.day)
         )
         user_trend = [
             {"date": row[0].isoformat(), "count": row[1]} for row in user_growth.all()
         ]
 
-        # 博客增长趋势
+        # 博客增长趋势（汇总各栏目）
         blog_growth = await self.db.execute(
-            select(
-                func.date(Blog.created_at).label("date"),
-                func.count(Blog.id).label("count"),
-            )
-            .where(Blog.created_at >= start_date)
-            .group_by(func.date(Blog.created_at))
-            .order_by(func.date(Blog.created_at))
+            select(Blog_Daily_Rollup.day, func.sum(Blog_Daily_Rollup.blogs))
+            .where(Blog_Daily_Rollup.day >= start_day)
+            .group_by(Blog_Daily_Rollup.day)
+            .order_by(Blog_Daily_Rollup.day)
         )
         blog_trend = [
-            {"date": row[0].isoformat(), "count": row[1]} for row in blog_growth.all()
+            {"date": row[0].isoformat(), "count": int(row[1])}
+            for row in blog_growth.all()
         ]
 
-        # 收入趋势
+        # 收入趋势（汇总各支付方式的成功支付）
         revenue_growth = await self.db.execute(
-            select(
-                func.date(Payment_Record.created_at).label("date"),
-                func.sum(Payment_Record.amount).label("revenue"),
-            )
+            select(Payment_Daily_Rollup.day, func.sum(Payment_Daily_Rollup.amount))
             .where(
-                Payment_Record.created_at >= start_date,
-                Payment_Record.payment_status == PaymentStatus.success,
+                Payment_Daily_Rollup.day >= start_day,
+                Payment_Daily_Rollup.payment_status == PaymentStatus.success,
             )
-            .group_by(func.date(Payment_Record.created_at))
-            .order_by(func.date(Payment_Record.created_at))
+            .group_by(Payment_Daily_Rollup.day)
+            .order_by(Payment_Daily_Rollup.day)
         )
         revenue_trend = [
             {"date": row[0].isoformat(), "revenue": float(row[1])}
@@ -559,53 +448,41 @@ class AnalyticCrud:
             "revenue_growth": revenue_trend,
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_user_statistics(self) -> Dict[str, Any]:
         """获取用户统计数据"""
         cache_key = "analytics_user_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
-
-        # 总用户数
-        total_users = await self.db.execute(select(func.count(User.id)))
-        total_users = total_users.scalar_one()
+        return await self._get_cached(cache_key, "_build_user_statistics")
 
-        # 活跃用户数（is_active 为 True 且未删除的用户）
-        active_users = await self.db.execute(
-            select(func.count(User.id)).where(
-                User.is_active == True, User.is_deleted == False
-            )
-        )
-        active_users = active_users.scalar_one()
-
-        # 本月新增用户
-        start_date, end_date = self._get_date_range("month")
-        new_users_this_month = await self.db.execute(
-            select(func.count(User.id)).where(
-                User.created_at >= start_date, User.created_at <= end_date
+    async def _build_user_statistics(self) -> Dict[str, Any]:
+        # 活跃用户为 is_active 为 True 且未删除的用户
+        start_date, _ = self._get_date_range("month")
+        totals = await self.db.execute(
+            select(
+                func.sum(User_Daily_Rollup.users),
+                func.sum(User_Daily_Rollup.active_users),
+                self._sum_since(
+                    User_Daily_Rollup.users, User_Daily_Rollup.day, start_date
+                ),
             )
         )
-        new_users_this_month = new_users_this_month.scalar_one()
+        totals_row = totals.first()
 
         result = {
-            "total_users": total_users,
-            "active_users": active_users,
-            "new_users_this_month": new_users_this_month,
+            "total_users": int(totals_row[0] or 0),
+            "active_users": int(totals_row[1] or 0),
+            "new_users_this_month": int(totals_row[2] or 0),
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
     async def get_overview_statistics(self) -> Dict[str, Any]:
         """获取总览统计数据（汇总所有关键指标）"""
         cache_key = "analytics_overview_statistics"
-        cached_data = await redis_manager.get_async(cache_key)
-        if cached_data:
-            return json.loads(cached_data)
+        return await self._get_cached(cache_key, "_build_overview_statistics")
 
+    async def _build_overview_statistics(self) -> Dict[str, Any]:
         # 并发获取各项统计
         user_stats = await self.get_user_statistics()
         blog_stats = await self.get_blog_statistics()
@@ -631,9 +508,12 @@ class AnalyticCrud:
             },
         }
 
-        await redis_manager.set_async(cache_key, json.dumps(result), ex=300)
         return result
 
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """缓存指标保存在进程内存中，不经过数据库与缓存"""
+        return redis_manager.get_cache_metrics()
+
 
 def get_analytic_crud(db: AsyncSession = Depends(mysql_manager.get_db)) -> AnalyticCrud:
     return AnalyticCrud(db)
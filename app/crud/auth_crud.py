@@ -21,7 +21,9 @@ from app.core.security import security_manager
 from app.core.config.settings import settings
 from app.core.database.mysql import mysql_manager
 from app.core.database.redis import redis_manager
+from app.core.database.revocation import access_token_revocations
 from app.core.i18n.i18n import get_message, get_current_language, Language
+from app.schemas.auth_schemas import CurrentUser
 from app.crud.subscriber_crud import get_subscriber_crud
 from app.tasks.client_info_task import client_info_task
 from app.tasks.greeting_email_task import greeting_email_task
@@ -66,6 +68,26 @@ class AuthCrud:
         result = await self.db.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_user_principal(self, user_id: int) -> Optional[CurrentUser]:
+        """从数据库读取用户状态与角色快照并写入缓存（用户不存在时不缓存）"""
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return None
+        principal = CurrentUser(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            is_deleted=user.is_deleted,
+        )
+        await redis_manager.set_async(
+            f"user_principal:{user_id}",
+            principal.model_dump_json(),
+            ex=settings.jwt.JWT_PRINCIPAL_CACHE_TTL,
+        )
+        return principal
+
     async def _get_valid_code(self, user_id: int, type: CodeType) -> Optional[Code]:
         """获取有效的验证码"""
         statement = select(Code).where(
@@ -135,6 +157,7 @@ class AuthCrud:
 
         # 提交所有更改
         await self.db.commit()
+        await redis_manager.delete_async(f"user_principal:{user.id}")
 
     async def _get_user_tokens(self, user_id: int) -> Sequence[RefreshToken]:
         """Get all valid refresh tokens for user - 优化查询"""
@@ -422,7 +445,7 @@ class AuthCrud:
             self.logger.info(f"User account created successfully: {email}")
 
             # 清理user list缓存
-            await redis_manager.delete_pattern_async("admin_all_users:page=*")
+            await redis_manager.delete_pattern_async("admin_all_users:*")
 
             return True
 
@@ -463,14 +486,16 @@ class AuthCrud:
             )
 
         # 检验密码是否一样
-        if security_manager.verify_password(new_password, user.password_hash):
+        if await security_manager.verify_password_async(
+            new_password, user.password_hash
+        ):
             raise HTTPException(
                 status_code=400,
                 detail=get_message(key="auth.common.passwordSameAsOld"),
             )
 
         # 加密新密码
-        new_password_hash = security_manager.hash_password(new_password)
+        new_password_hash = await security_manager.hash_password_async(new_password)
 
         # 检查用户是否已激活
         if not user.is_active:
@@ -503,6 +528,7 @@ class AuthCrud:
         statement = update(Code).where(Code.id == valid_code.id).values(is_used=True)
         await self.db.execute(statement)
         await self.db.commit()
+        await redis_manager.delete_async(f"user_principal:{user.id}")
 
         self.logger.info(f"Password reset successfully for user: {email}")
         return True
@@ -517,14 +543,16 @@ class AuthCrud:
             user = await self.get_user_by_email(user_email)
             if user and user.password_hash:
                 # 验证新密码是否和数据库中的密码是否一样
-                if security_manager.verify_password(new_password, user.password_hash):
+                if await security_manager.verify_password_async(
+                    new_password, user.password_hash
+                ):
                     raise HTTPException(
                         status_code=409,
                         detail=get_message(key="auth.common.passwordSameAsOld"),
                     )
 
             # hash password
-            hashed_password = security_manager.hash_password(new_password)
+            hashed_password = await security_manager.hash_password_async(new_password)
             statement = (
                 update(User)
                 .where(User.email == user_email)
@@ -532,6 +560,8 @@ class AuthCrud:
             )
             await self.db.execute(statement)
             await self.db.commit()
+            if user:
+                await redis_manager.delete_async(f"user_principal:{user.id}")
             return True
         return False
 
@@ -574,12 +604,18 @@ class AuthCrud:
                 )
 
             # 5. 验证密码
-            if not security_manager.verify_password(password, user.password_hash):
+            if not await security_manager.verify_password_async(
+                password, user.password_hash
+            ):
                 raise HTTPException(
                     status_code=400,
                     detail=get_message(key="auth.accountLogin.invalidCredentials"),
                 )
 
+            # Argon2 参数调整后，用户下次登录时透明地重新哈希（随令牌一起提交）
+            if security_manager.password_needs_rehash(user.password_hash):
+                await self._rehash_password(user, password)
+
             # 6. 智能生成令牌
             tokens = await self._generate_tokens_by_condition(
                 user_id=user.id,
@@ -610,14 +646,33 @@ class AuthCrud:
                 detail=f"Login error for user {email}: {str(e)}",
             )
 
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """用当前 Argon2 参数重新哈希密码
+
+        只在密码哈希未被并发修改（例如同时重置密码）时更新。
+        """
+        new_password_hash = await security_manager.hash_password_async(password)
+        await self.db.execute(
+            update(User)
+            .where(User.id == user.id, User.password_hash == user.password_hash)
+            .values(password_hash=new_password_hash)
+        )
+        self.logger.info(
+            f"Password rehashed with current parameters for user {user.id}"
+        )
+
     async def account_logout(
-        self, user_id: int, access_token_jti: Optional[str] = None
+        self,
+        user_id: int,
+        access_token_jti: Optional[str] = None,
+        access_token_expires_at: Optional[int] = None,
     ) -> bool:
         """User account logout - 撤销用户所有 refresh token 并将 access token 加入黑名单
 
         Args:
             user_id: 用户 ID
             access_token_jti: Access token 的 JTI（用于加入黑名单）
+            access_token_expires_at: Access token 的过期时间戳（exp），黑名单保留到此时
         """
         # 获取用户信息
         user = await self.get_user_by_id(user_id)
@@ -628,11 +683,9 @@ class AuthCrud:
             # 将 access token 加入黑名单（如果提供了 JTI）
             if access_token_jti:
                 try:
-                    # 使用 Redis 存储黑名单，30 分钟后自动过期
-                    await redis_manager.set_async(
-                        f"blacklist:access_token:{access_token_jti}",
-                        "1",
-                        ex=1800,  # 30 分钟（access token 的有效期）
+                    # 写入 Redis 黑名单并广播给所有 worker 的内存撤销集合
+                    await access_token_revocations.revoke_async(
+                        access_token_jti, access_token_expires_at
                     )
                     self.logger.info(
                         f"Access token {access_token_jti} added to blacklist for user {user.email}"
@@ -942,6 +995,7 @@ class AuthCrud:
         self.db.add(user)
         await self.db.commit()
         await self.db.refresh(user)
+        await redis_manager.delete_async(f"user_principal:{user.id}")
 
         # 创建社交账号
         social_account = Social_Account(
@@ -974,7 +1028,7 @@ class AuthCrud:
         self._schedule_user_tasks(user, dict(request.headers))
 
         # 清理user list缓存
-        await redis_manager.delete_pattern_async("admin_all_users:page=*")
+        await redis_manager.delete_pattern_async("admin_all_users:*")
 
         # 返回访问令牌和刷新令牌
         return {
@@ -5,8 +5,9 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 from fastapi import HTTPException, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
-from sqlmodel import select, insert, update, func, delete
+from sqlalchemy import case, literal
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from sqlmodel import and_, select, insert, update, func, delete
 from app.models.blog_model import (
     Blog,
     Blog_Tag,
@@ -22,8 +23,18 @@ from app.models.seo_model import Seo
 from app.models.media_model import Media
 from app.core.database.mysql import mysql_manager
 from app.core.database.redis import redis_manager
+from app.core.database.counters import (
+    blog_stats_counter,
+    blog_like_tracker,
+    blog_stats_projection,
+    blog_view_tracker,
+    section_blog_counts,
+    tag_blog_counts,
+)
+from app.core.database.trending import blog_leaderboard, blog_trending
 from app.core.logger import logger_manager
 from app.models.user_model import User, RoleType
+from app.utils.comment_tree import build_comment_tree
 from app.utils.keyset_pagination import paginator_desc
 from app.utils.offset_pagination import offset_paginator
 from app.utils.agent import agent_utils
@@ -36,9 +47,39 @@ from app.tasks import (
     generate_content_audio_task,
     summary_blog_content,
 )
+from app.tasks.analytics_rollup_task import mark_blog_dirty_async
+from app.tasks.cache_warming_task import schedule_cache_warming
 from app.schemas.common import LargeContentTranslationType
 from celery import chain
 
+# 评论树的最大嵌套层级（父评论 / 子评论 / 孙评论）
+BLOG_COMMENT_MAX_DEPTH = 3
+
+
+async def ensure_blog_leaderboard_loaded(db: AsyncSession) -> None:
+    """累计排行未加载（首次访问或已过期）时从 Blog_Stats 完整加载一次"""
+    if await blog_leaderboard.is_loaded_async():
+        return
+    stats = await db.execute(
+        select(
+            Blog_Stats.blog_id,
+            Blog_Stats.views,
+            Blog_Stats.likes,
+            Blog_Stats.comments,
+            Blog_Stats.saves,
+        )
+    )
+    await blog_leaderboard.seed_async(
+        {
+            "id": row[0],
+            "views": row[1],
+            "likes": row[2],
+            "comments": row[3],
+            "saves": row[4],
+        }
+        for row in stats.all()
+    )
+
 
 class BlogCrud:
     def __init__(self, db: AsyncSession):
@@ -73,21 +114,92 @@ class BlogCrud:
         self,
         blog_ids: List[int],
     ) -> Dict[int, Dict[str, Any]]:
+        # 优先读取 Redis 中的统计投影（一次往返），未命中的博客再查询数据库
+        stats = await blog_stats_projection.get_many_async(blog_ids)
+        missing_ids = [blog_id for blog_id in blog_ids if blog_id not in stats]
+        if not missing_ids:
+            return stats
+
         result = await self.db.execute(
-            select(Blog_Stats).where(Blog_Stats.blog_id.in_(blog_ids))
+            select(Blog_Stats).where(Blog_Stats.blog_id.in_(missing_ids))
         )
         stats_list = result.scalars().all()
+        pending = await blog_stats_counter.get_pending_async(missing_ids)
 
-        # 只返回需要的统计字段，去掉 id 和 blog_id
-        return {
-            stats.blog_id: {
-                "views": stats.views,
-                "likes": stats.likes,
-                "comments": stats.comments,
-                "saves": stats.saves,
-            }
-            for stats in stats_list
+        # 只返回需要的统计字段，去掉 id 和 blog_id；合并尚未落库的增量
+        loaded = {
+            blog_stats.blog_id: blog_stats_counter.merge(
+                {
+                    "views": blog_stats.views,
+                    "likes": blog_stats.likes,
+                    "comments": blog_stats.comments,
+                    "saves": blog_stats.saves,
+                },
+                pending.get(blog_stats.blog_id, {}),
+            )
+            for blog_stats in stats_list
         }
+        await blog_stats_projection.set_many_async(loaded)
+        stats.update(loaded)
+        return stats
+
+    async def _get_section_blog_count(
+        self, section_id: int, published_only: bool
+    ) -> int:
+        """栏目下的博客数量，优先读取 Redis 中维护的计数，未命中时查询一次数据库并回填
+
+        维护的计数为 0 时同样重新统计，避免计数偏差导致有数据的栏目返回 404。
+        """
+        field = "published" if published_only else "all"
+        counts = await section_blog_counts.get_many_async([section_id])
+        if counts.get(section_id, {}).get(field, 0) <= 0:
+            result = await self.db.execute(
+                select(
+                    func.count(Blog.id),
+                    func.coalesce(
+                        func.sum(case((Blog_Status.is_published == True, 1), else_=0)),
+                        0,
+                    ),
+                )
+                .outerjoin(Blog_Status, Blog_Status.blog_id == Blog.id)
+                .where(Blog.section_id == section_id)
+            )
+            all_count, published_count = result.one()
+            counts[section_id] = {"all": all_count, "published": int(published_count)}
+            await section_blog_counts.set_many_async(counts)
+        return counts[section_id][field]
+
+    async def _get_tag_blog_count(self, tag_id: int) -> int:
+        """标签下已发布的博客数量，优先读取 Redis 中维护的计数，未命中或为 0 时查询一次数据库并回填"""
+        counts = await tag_blog_counts.get_many_async([tag_id])
+        if counts.get(tag_id, {}).get("published", 0) <= 0:
+            result = await self.db.execute(
+                select(func.count(Blog_Tag.id))
+                .join(Blog_Status, Blog_Status.blog_id == Blog_Tag.blog_id)
+                .where(Blog_Tag.tag_id == tag_id, Blog_Status.is_published == True)
+            )
+            counts[tag_id] = {"published": result.scalar_one()}
+            await tag_blog_counts.set_many_async(counts)
+        return counts[tag_id]["published"]
+
+    async def _change_blog_counts(
+        self,
+        section_id: int,
+        tag_ids: List[int],
+        all_delta: int = 0,
+        published_delta: int = 0,
+    ) -> None:
+        """博客新增 / 删除 / 发布状态变化后更新栏目与标签下的博客数量（计数存在时才累加）"""
+        deltas = {}
+        if all_delta:
+            deltas["all"] = all_delta
+        if published_delta:
+            deltas["published"] = published_delta
+        if deltas:
+            await section_blog_counts.incr_async(section_id, **deltas)
+        if published_delta:
+            for tag_id in tag_ids:
+                await tag_blog_counts.incr_async(tag_id, published=published_delta)
 
     async def _get_blog_comment_by_id(
         self, comment_id: int, include_deleted: bool = False
@@ -114,54 +226,46 @@ class BlogCrud:
                 detail=get_message("blog.common.blogNotFound"),
             )
 
+        delta = 0
         if comment_type == "create":
             await self.db.execute(
                 update(Blog_Stats)
                 .where(Blog_Stats.blog_id == blog_id)
                 .values(comments=Blog_Stats.comments + 1)
             )
+            delta = 1
         elif comment_type == "delete" and blog_stats.comments > 0:
             await self.db.execute(
                 update(Blog_Stats)
                 .where(Blog_Stats.blog_id == blog_id)
                 .values(comments=Blog_Stats.comments - 1)
             )
+            delta = -1
         await self.db.commit()
+        if delta:
+            # 同步更新 Redis 中的统计投影
+            await blog_stats_projection.incr_async(blog_id, comments=delta)
+            await blog_leaderboard.incr_async(blog_id, "comments", delta)
+            await mark_blog_dirty_async(blog_id)
+        if delta > 0:
+            await blog_trending.record_async(blog_id, "comment")
         return True
 
-    async def _build_blog_comment_tree(
-        self,
-        comments: List[Blog_Comment],
-        parent_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        tree = []
-        for comment in comments:
-            if comment.parent_id == parent_id:
-                children = await self._build_blog_comment_tree(comments, comment.id)
-
-                comment_dict = {
-                    "comment_id": comment.id,
-                    "user_id": comment.user_id,
-                    "username": comment.user.username if comment.user else None,
-                    "avatar_url": comment.user.avatar.thumbnail_filepath_url
-                    or comment.user.avatar.original_filepath_url
-                    if comment.user and comment.user.avatar
-                    else None,
-                    "user_role": comment.user.role.name,
-                    "city": comment.user.city,
-                    "parent_id": comment.parent_id,
-                    "comment": comment.comment,
-                    "created_at": comment.created_at.isoformat()
-                    if comment.created_at
-                    else None,
-                    "updated_at": comment.updated_at.isoformat()
-                    if comment.updated_at
-                    else None,
-                }
-                if children:
-                    comment_dict["children"] = children
-                tree.append(comment_dict)
-        return tree
+    @staticmethod
+    def _serialize_blog_comment_row(row: Any) -> Dict[str, Any]:
+        """把评论树查询的一行（评论列 + 作者列）转换为评论字典"""
+        return {
+            "comment_id": row.id,
+            "user_id": row.user_id,
+            "username": row.username,
+            "avatar_url": row.thumbnail_filepath_url or row.original_filepath_url,
+            "user_role": row.role.name if row.role else None,
+            "city": row.city,
+            "parent_id": row.parent_id,
+            "comment": row.comment,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        }
 
     async def get_blog_lists(
         self,
@@ -169,9 +273,11 @@ class BlogCrud:
         page: int = 1,
         size: int = 20,
         published_only: bool = True,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        """获取博客列表，使用传统分页工具 page_paginator。
+        """获取博客列表，默认使用传统分页工具 offset_paginator。
 
+        cursor 不为 None 时使用游标分页（空字符串为第一页），深分页的开销只与每页数量有关。
         返回 (items, pagination_metadata)，并在缓存中存储标准响应结构。
         统计数据和变现信息每次都实时获取，不会被缓存。
         """
@@ -185,34 +291,57 @@ class BlogCrud:
                 detail=get_message("common.invalidRequest"),
             )
 
-        cache_key = f"blog_lists:{section_id}:lang={language}:page={page}:size={size}:published_only={published_only}"
-        cache_data = await redis_manager.get_async(cache_key)
-
-        if cache_data:
-            # 命中缓存：获取缓存的博客基础数据
-            payload = json.loads(cache_data)
-            cached_items = payload.get("items", [])
-            pagination_metadata = payload.get("pagination", {})
+        if cursor is None:
+            cache_key = f"blog_lists:{section_id}:lang={language}:page={page}:size={size}:published_only={published_only}"
+        else:
+            # 缓存键使用解码校验后的游标，无效游标与第一页共用缓存
+            cursor = paginator_desc.normalize_cursor(cursor)
+            cache_key = f"blog_lists:{section_id}:lang={language}:cursor={cursor}:size={size}:published_only={published_only}"
+        # 缓存中只存博客基础数据，未命中时单飞重建，避免缓存失效瞬间并发回源；
+        # 过了软 TTL 的数据先返回旧值，再在独立会话中后台刷新
+        payload = await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: self._build_blog_lists_payload(
+                section_id, page, size, published_only, language, cursor
+            ),
+            refresh=lambda: mysql_manager.run_in_session(
+                lambda db: BlogCrud(db)._build_blog_lists_payload(
+                    section_id, page, size, published_only, language, cursor
+                )
+            ),
+        )
+        cached_items = payload.get("items", [])
+        pagination_metadata = payload.get("pagination", {})
 
-            # 实时获取统计数据和变现信息并添加到缓存数据中
-            if cached_items:
-                blog_ids = [item["blog_id"] for item in cached_items]
-                stats = await self._get_real_time_blog_stats(blog_ids)
+        # 实时获取统计数据和变现信息并添加到缓存数据中
+        if cached_items:
+            blog_ids = [item["blog_id"] for item in cached_items]
+            stats = await self._get_real_time_blog_stats(blog_ids)
 
-                # 为每个博客项添加实时统计数据和变现信息（不修改缓存）
-                items_with_stats = []
-                for item in cached_items:
-                    blog_id = item["blog_id"]
-                    item_with_stats = item.copy()  # 创建副本，不修改缓存数据
-                    item_with_stats["blog_stats"] = stats.get(blog_id, {})
+            # 为每个博客项添加实时统计数据和变现信息（不修改缓存）
+            items_with_stats = []
+            for item in cached_items:
+                blog_id = item["blog_id"]
+                item_with_stats = item.copy()  # 创建副本，不修改缓存数据
+                item_with_stats["blog_stats"] = stats.get(blog_id, {})
 
-                    items_with_stats.append(item_with_stats)
+                items_with_stats.append(item_with_stats)
 
-                return items_with_stats, pagination_metadata
+            return items_with_stats, pagination_metadata
 
-            return cached_items, pagination_metadata
+        return cached_items, pagination_metadata
 
-        # 未命中缓存：构建 JOIN 查询与计数查询
+    async def _build_blog_lists_payload(
+        self,
+        section_id: int,
+        page: int,
+        size: int,
+        published_only: bool,
+        language: Language,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """从数据库构建博客列表缓存数据（不包含统计数据）"""
+        # 构建 JOIN 查询，总数来自栏目博客数量计数而不是 COUNT(*)
         # 优化：使用 selectinload 替代 joinedload，减少 JOIN 数量
         if published_only is True:
             base_stmt = (
@@ -237,18 +366,27 @@ class BlogCrud:
                 .where(Blog.section_id == section_id)
             )
 
-        count_stmt = select(func.count(Blog.id)).where(
-            Blog.section_id == section_id,
-        )
+        total_count = await self._get_section_blog_count(section_id, published_only)
 
-        rows, pagination_metadata = await offset_paginator.get_paginated_join_result(
-            db=self.db,
-            base_stmt=base_stmt,
-            count_stmt=count_stmt,
-            page=page,
-            size=size,
-            order_by=[Blog.created_at.desc(), Blog.id.desc()],
-        )
+        if cursor is None:
+            (
+                rows,
+                pagination_metadata,
+            ) = await offset_paginator.get_paginated_join_result(
+                db=self.db,
+                base_stmt=base_stmt,
+                page=page,
+                size=size,
+                order_by=[Blog.created_at.desc(), Blog.id.desc()],
+                total_count=total_count,
+            )
+            # rows 为 JOIN 结果，当前 select 仅选择 Blog，因此每行第一个元素为 Blog 实例
+            blogs: List[Blog] = [row[0] for row in rows]
+        else:
+            blogs, has_next, next_cursor = await paginator_desc.get_paginated_result(
+                self.db, base_stmt, Blog.created_at, Blog.id, cursor, size
+            )
+            pagination_metadata = {"total_count": total_count}
 
         # 计算本月的博客数量
         if published_only is False:
@@ -278,9 +416,6 @@ class BlogCrud:
             pagination_metadata["new_items_this_month"] = count_this_month
             pagination_metadata["updated_items_this_month"] = count_updated
 
-        # rows 为 JOIN 结果，当前 select 仅选择 Blog，因此每行第一个元素为 Blog 实例
-        blogs: List[Blog] = [row[0] for row in rows]
-
         items: List[Dict[str, Any]] = [
             {
                 "blog_id": blog.id,
@@ -334,36 +469,29 @@ class BlogCrud:
                     }
                 )
 
-        # 缓存结果（不包含统计数据）
-        cache_payload = offset_paginator.create_response_data(
-            items, pagination_metadata
+        # 缓存数据（不包含统计数据）
+        if cursor is None:
+            return offset_paginator.create_response_data(items, pagination_metadata)
+        payload = paginator_desc.create_response_data(
+            items, size, has_next=has_next, next_cursor=next_cursor
         )
-        await redis_manager.set_async(cache_key, json.dumps(cache_payload))
-
-        # 实时获取统计数据和变现信息并添加到返回数据中
-        if items:
-            blog_ids = [item["blog_id"] for item in items]
-            stats = await self._get_real_time_blog_stats(blog_ids)
-
-            # 为每个博客项添加实时统计数据和变现信息
-            for item in items:
-                blog_id = item["blog_id"]
-                item["blog_stats"] = stats.get(blog_id, {})
-
-        return items, pagination_metadata
+        payload["pagination"].update(pagination_metadata)
+        return payload
 
     async def get_blog_lists_by_tag_slug(
         self,
         tag_slug: str,
         page: int = 1,
         size: int = 20,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        """根据标签slug获取博客列表，使用传统分页工具 offset_paginator。
+        """根据标签slug获取博客列表，默认使用传统分页工具 offset_paginator。
 
         Args:
             tag_slug: 标签的slug
             page: 页码
             size: 每页数量
+            cursor: 游标，不为 None 时使用游标分页（空字符串为第一页）
 
         Returns:
             (items, pagination_metadata) - 博客列表和分页元数据
@@ -381,7 +509,30 @@ class BlogCrud:
                 detail=get_message("common.invalidRequest"),
             )
 
-        # 首先验证标签是否存在
+        # 缓存键
+        if cursor is None:
+            cache_key = f"blog_lists_by_tag_slug:{tag_slug}:lang={language}:page={page}:size={size}"
+        else:
+            cursor = paginator_desc.normalize_cursor(cursor)
+            cache_key = f"blog_lists_by_tag_slug:{tag_slug}:lang={language}:cursor={cursor}:size={size}"
+        payload = await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: self._build_blog_lists_by_tag_payload(
+                tag_slug, page, size, language, cursor
+            ),
+        )
+        return payload.get("items", []), payload.get("pagination", {})
+
+    async def _build_blog_lists_by_tag_payload(
+        self,
+        tag_slug: str,
+        page: int,
+        size: int,
+        language: Language,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """从数据库构建标签博客列表缓存数据，命中缓存时无需再查询标签"""
+        # 验证标签是否存在（不存在时抛出 404，不会写入缓存）
         tag_statement = select(Tag).where(Tag.slug == tag_slug)
         tag_result = await self.db.execute(tag_statement)
         tag = tag_result.scalar_one_or_none()
@@ -392,20 +543,7 @@ class BlogCrud:
                 detail=get_message("tag.common.tagNotFound"),
             )
 
-        # 缓存键
-        cache_key = (
-            f"blog_lists_by_tag_slug:{tag_slug}:lang={language}:page={page}:size={size}"
-        )
-        cache_data = await redis_manager.get_async(cache_key)
-
-        if cache_data:
-            # 命中缓存：获取缓存的博客基础数据
-            payload = json.loads(cache_data)
-            cached_items = payload.get("items", [])
-            pagination_metadata = payload.get("pagination", {})
-            return cached_items, pagination_metadata
-
-        # 未命中缓存：构建 JOIN 查询与计数查询
+        # 构建 JOIN 查询，总数来自标签博客数量计数而不是 COUNT(*)
         # 优化：使用 selectinload 替代 joinedload
         base_stmt = (
             select(Blog)
@@ -420,27 +558,26 @@ class BlogCrud:
             )
         )
 
-        count_stmt = (
-            select(func.count(Blog.id))
-            .join(Blog_Tag, Blog_Tag.blog_id == Blog.id)
-            .join(Blog_Status, Blog_Status.blog_id == Blog.id)
-            .where(
-                Blog_Tag.tag_id == tag.id,
-                Blog_Status.is_published == True,
+        total_count = await self._get_tag_blog_count(tag.id)
+
+        if cursor is None:
+            (
+                rows,
+                pagination_metadata,
+            ) = await offset_paginator.get_paginated_join_result(
+                db=self.db,
+                base_stmt=base_stmt,
+                page=page,
+                size=size,
+                order_by=[Blog.created_at.desc(), Blog.id.desc()],
+                total_count=total_count,
+            )
+            # rows 为 JOIN 结果，当前 select 仅选择 Blog，因此每行第一个元素为 Blog 实例
+            blogs: List[Blog] = [row[0] for row in rows]
+        else:
+            blogs, has_next, next_cursor = await paginator_desc.get_paginated_result(
+                self.db, base_stmt, Blog.created_at, Blog.id, cursor, size
             )
-        )
-
-        rows, pagination_metadata = await offset_paginator.get_paginated_join_result(
-            db=self.db,
-            base_stmt=base_stmt,
-            count_stmt=count_stmt,
-            page=page,
-            size=size,
-            order_by=[Blog.created_at.desc(), Blog.id.desc()],
-        )
-
-        # rows 为 JOIN 结果，当前 select 仅选择 Blog，因此每行第一个元素为 Blog 实例
-        blogs: List[Blog] = [row[0] for row in rows]
 
         items: List[Dict[str, Any]] = [
             {
@@ -459,13 +596,13 @@ class BlogCrud:
             for blog in blogs
         ]
 
-        # 缓存结果
-        cache_payload = offset_paginator.create_response_data(
-            items, pagination_metadata
+        if cursor is None:
+            return offset_paginator.create_response_data(items, pagination_metadata)
+        payload = paginator_desc.create_response_data(
+            items, size, has_next=has_next, next_cursor=next_cursor
         )
-        await redis_manager.set_async(cache_key, json.dumps(cache_payload))
-
-        return items, pagination_metadata
+        payload["pagination"]["total_count"] = total_count
+        return payload
 
     async def get_archived_blog_lists(
         self,
@@ -482,7 +619,8 @@ class BlogCrud:
             包含归档博客列表和分页信息的字典
         """
         language = get_current_language()
-        # 缓存键
+        # 缓存键（使用解码校验后的游标）
+        cursor = paginator_desc.normalize_cursor(cursor)
         cache_key = f"blog_archived_lists:lang={language}:limit={limit}:cursor={cursor}"
         cache_data = await redis_manager.get_async(cache_key)
 
@@ -637,48 +775,69 @@ class BlogCrud:
         is_editor: bool = False,
         user_id: Optional[int] = None,
     ) -> Optional[Dict]:
+        if is_editor:
+            # 编辑器需要读到刚保存的内容，不使用从库
+            mysql_manager.use_primary(self.db)
         language = get_current_language()
-        details_cache_key = f"blog_details:{blog_slug}:lang={language}:is_editor={is_editor}:user_id={user_id}"
-        hash_cache_key = (
-            f"blog_details_hash:{blog_slug}:is_editor={is_editor}:user_id={user_id}"
+        details_cache_key = self._blog_details_cache_key(
+            blog_slug, language, is_editor, user_id
         )
-        cache_data = await redis_manager.get_async(details_cache_key)
         current_ip = client_info_utils.get_client_ip(request)
         user_agent = client_info_utils.get_user_agent(request)
 
-        blog = await self.get_blog_by_slug(blog_slug)
-        if not blog:
-            raise HTTPException(
-                status_code=404,
-                detail=get_message("blog.common.blogNotFound"),
-            )
+        async def build() -> Dict[str, Any]:
+            blog = await self.get_blog_by_slug(blog_slug)
+            if not blog:
+                raise HTTPException(
+                    status_code=404,
+                    detail=get_message("blog.common.blogNotFound"),
+                )
+            return await self._build_blog_details(blog, language, is_editor, user_id)
+
+        # 先读缓存：命中时只访问 Redis，博客 id 取自缓存数据
+        response = await redis_manager.get_or_build_async(details_cache_key, build)
 
-        # 计算哈希值
-        hash_key = hashlib.sha256(
+        # 访客标识
+        viewer = hashlib.sha256(
             f"{current_ip}:{user_agent}:{is_editor}".encode()
         ).hexdigest()
 
-        # 命中缓存：统一使用 Redis 缓存进行 hash 比对
-        if cache_data:
-            should_increment_view = False
-            cached_last_hash = await redis_manager.get_async(hash_cache_key)
-            if not cached_last_hash or cached_last_hash != hash_key:
-                should_increment_view = True
+        # 按天去重的独立访客：当天首次访问才累加浏览数（写回式计数，一次往返）
+        blog_id = response["blog_id"]
+        if await blog_view_tracker.record_view_async(blog_id, viewer):
+            await blog_trending.record_async(blog_id, "view")
 
-            if should_increment_view:
-                await self.db.execute(
-                    update(Blog_Stats)
-                    .where(Blog_Stats.blog_id == blog.id)
-                    .values(views=Blog_Stats.views + 1)
-                )
-                await self.db.commit()
-                # 更新缓存中的 hash 值
-                await redis_manager.set_async(hash_cache_key, hash_key)
+        return response
 
-            return json.loads(cache_data)
+    async def warm_blog_details(self, blog_slug: str) -> None:
+        """预热匿名访客看到的博客详情缓存（不计浏览量）"""
+        language = get_current_language()
+        blog = await self.get_blog_by_slug(blog_slug)
+        if not blog:
+            return
+        await redis_manager.get_or_build_async(
+            self._blog_details_cache_key(blog_slug, language, False, None),
+            lambda: self._build_blog_details(blog, language, False, None),
+        )
 
-        # 未命中缓存：查询数据库构建详情，并处理浏览量逻辑
-        # 首先检查用户是否保存了该博客
+    @staticmethod
+    def _blog_details_cache_key(
+        blog_slug: str,
+        language: Language,
+        is_editor: bool,
+        user_id: Optional[int],
+    ) -> str:
+        return f"blog_details:{blog_slug}:lang={language}:is_editor={is_editor}:user_id={user_id}"
+
+    async def _build_blog_details(
+        self,
+        blog: Blog,
+        language: Language,
+        is_editor: bool,
+        user_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """从数据库构建博客详情缓存数据"""
+        # 检查用户是否保存了该博客
         is_saved = False
         if user_id is not None:
             saved_blog_result = await self.db.execute(
@@ -688,22 +847,6 @@ class BlogCrud:
             )
             is_saved = saved_blog_result.scalar_one_or_none() is not None
 
-        # 统一使用 Redis 缓存进行 hash 比对
-        should_increment_view = False
-        cached_last_hash = await redis_manager.get_async(hash_cache_key)
-        if not cached_last_hash or cached_last_hash != hash_key:
-            should_increment_view = True
-
-        if should_increment_view:
-            await self.db.execute(
-                update(Blog_Stats)
-                .where(Blog_Stats.blog_id == blog.id)
-                .values(views=Blog_Stats.views + 1)
-            )
-            await self.db.commit()
-            # 更新缓存中的 hash 值
-            await redis_manager.set_async(hash_cache_key, hash_key)
-
         if is_editor:
             response = {
                 "seo_id": blog.seo_id if blog.seo_id else None,
@@ -755,9 +898,6 @@ class BlogCrud:
                 "updated_at": blog.updated_at.isoformat() if blog.updated_at else None,
             }
 
-        # 更新缓存
-        await redis_manager.set_async(details_cache_key, json.dumps(response))
-
         return response
 
     async def get_blog_tts(
@@ -900,10 +1040,13 @@ class BlogCrud:
         )
         task_chain.apply_async()
 
-        # 更新缓存
-        await redis_manager.delete_pattern_async(f"blog_lists:{section_id}:*")
-        # 清除热门博客缓存（新博客可能影响排名）
-        await redis_manager.delete_pattern_async("get_recent_populor_blog:*")
+        # 新博客默认未发布，只计入栏目的全部博客数量
+        await self._change_blog_counts(section_id, [], all_delta=1)
+
+        # 更新缓存，同时清除热门博客缓存（新博客可能影响排名）
+        await redis_manager.invalidate_async(
+            patterns=[f"blog_lists:{section_id}:*", "get_recent_populor_blog:*"]
+        )
 
         return slug
 
@@ -967,6 +1110,7 @@ class BlogCrud:
         )
 
         # 更新博客标签：先删除旧标签，再插入新标签
+        old_tag_ids = [blog_tag.tag_id for blog_tag in blog.blog_tags]
         if blog_tags:
             # 删除该博客的所有旧标签
             await self.db.execute(delete(Blog_Tag).where(Blog_Tag.blog_id == blog.id))
@@ -982,6 +1126,10 @@ class BlogCrud:
 
         await self.db.commit()
 
+        # 标签变化后删除新旧标签的博客数量，下次读取时重新统计
+        if blog_tags and set(blog_tags) != set(old_tag_ids):
+            await tag_blog_counts.delete_async(set(blog_tags) | set(old_tag_ids))
+
         # 检查是否English_content 有变化
         if blog_content_changed:
             self.logger.info(
@@ -1004,20 +1152,21 @@ class BlogCrud:
                 f"No content change detected for blog ID {blog.id}, skipping task chain"
             )
 
-        # 更新缓存
-        await redis_manager.delete_pattern_async("blog_lists:*")
-        # TTS 任务完成后会自己清理缓存，这里不需要提前清理
-        await redis_manager.delete_pattern_async(
-            f"blog_details:{blog.slug}:lang={language}:*"
-        )
-        await redis_manager.delete_async(f"blog_details_seo:{blog.slug}")
-        await redis_manager.delete_async(f"blog_summary:{blog.id}:lang={language}")
-        await redis_manager.delete_pattern_async(
-            f"blog_archived_lists:lang={language}:*"
+        # 更新缓存（TTS 任务完成后会自己清理缓存，这里不需要提前清理）
+        await redis_manager.invalidate_async(
+            keys=[
+                f"blog_details_seo:{blog.slug}",
+                f"blog_summary:{blog.id}:lang={language}",
+                f"blog_navigation:{blog.id}:lang={language}",
+            ],
+            patterns=[
+                "blog_lists:*",
+                f"get_recent_populor_blog:lang={language}:*",
+                f"blog_details:{blog.slug}:lang={language}:*",
+                f"blog_archived_lists:lang={language}:*",
+                "user_saved_blogs:*",
+            ],
         )
-        await redis_manager.delete_async(f"get_recent_populor_blog:lang={language}")
-        await redis_manager.delete_pattern_async("user_saved_blogs:*")
-        await redis_manager.delete_async(f"blog_navigation:{blog.id}:lang={language}")
 
         return slug
 
@@ -1062,101 +1211,97 @@ class BlogCrud:
         if cache_data:
             return json.loads(cache_data)
 
-        # 先获取父评论（parent_id 为 None 的评论）
-        parent_statement = (
-            select(Blog_Comment)
-            .options(selectinload(Blog_Comment.user).selectinload(User.avatar))
-            .where(
-                Blog_Comment.blog_id == blog_id,
-                Blog_Comment.is_deleted == False,
-                Blog_Comment.parent_id.is_(None),
-            )
+        # 一条查询取回一页评论线程：
+        # 1. comment_page：当前页的父评论 id（keyset 分页，多取一条判断是否有下一页）
+        # 2. comment_thread：递归 CTE 从父评论向下展开子评论与孙评论（三级嵌套）
+        # 3. 外连接作者与头像，作者信息随评论一并返回
+        page_statement = select(Blog_Comment.id).where(
+            Blog_Comment.blog_id == blog_id,
+            Blog_Comment.is_deleted == False,
+            Blog_Comment.parent_id.is_(None),
         )
-
-        # 应用 keyset pagination 过滤到父评论
         if cursor:
-            parent_statement = paginator_desc.apply_filters(
-                parent_statement,
-                Blog_Comment.created_at,
-                Blog_Comment.id,
-                cursor,
+            page_statement = paginator_desc.apply_filters(
+                page_statement, Blog_Comment.created_at, Blog_Comment.id, cursor
             )
-
-        # 应用排序到父评论
-        parent_statement = parent_statement.order_by(
-            *paginator_desc.order_by(Blog_Comment.created_at, Blog_Comment.id)
+        # MySQL 不支持 IN 子查询中的 LIMIT，因此作为派生表 JOIN
+        comment_page = (
+            page_statement.order_by(
+                *paginator_desc.order_by(Blog_Comment.created_at, Blog_Comment.id)
+            )
+            .limit(limit + 1)
+            .subquery("comment_page")
         )
 
-        # 限制父评论数量
-        parent_statement = parent_statement.limit(limit + 1)
-
-        # 获取父评论
-        parent_result = await self.db.execute(parent_statement)
-        parent_comments = parent_result.scalars().all()
+        comment_thread = (
+            select(Blog_Comment.id, literal(1).label("depth"))
+            .join(comment_page, comment_page.c.id == Blog_Comment.id)
+            .cte("comment_thread", recursive=True)
+        )
+        reply = aliased(Blog_Comment)
+        comment_thread = comment_thread.union_all(
+            select(reply.id, comment_thread.c.depth + 1)
+            .join(comment_thread, reply.parent_id == comment_thread.c.id)
+            .where(
+                reply.blog_id == blog_id,
+                reply.is_deleted == False,
+                comment_thread.c.depth < BLOG_COMMENT_MAX_DEPTH,
+            )
+        )
 
-        # 检查是否有更多父评论
+        statement = (
+            select(
+                Blog_Comment.id,
+                Blog_Comment.user_id,
+                Blog_Comment.parent_id,
+                Blog_Comment.comment,
+                Blog_Comment.created_at,
+                Blog_Comment.updated_at,
+                User.username,
+                User.role,
+                User.city,
+                Media.thumbnail_filepath_url,
+                Media.original_filepath_url,
+            )
+            .join(comment_thread, comment_thread.c.id == Blog_Comment.id)
+            .outerjoin(User, User.id == Blog_Comment.user_id)
+            .outerjoin(Media, and_(Media.user_id == User.id, Media.is_avatar == True))
+            .order_by(Blog_Comment.id)
+        )
+        result = await self.db.execute(statement)
+        rows = result.all()
 
-        has_next = len(parent_comments) > limit
+        # 父评论按 (created_at, id) 倒序分页，子评论按 id 顺序挂载
+        parent_rows = sorted(
+            {row.id: row for row in rows if row.parent_id is None}.values(),
+            key=lambda row: (row.created_at, row.id),
+            reverse=True,
+        )
+        has_next = len(parent_rows) > limit
         if has_next:
-            parent_comments = parent_comments[:-1]
+            parent_rows = parent_rows[:limit]
 
-        if not parent_comments:
+        if not parent_rows:
             raise HTTPException(
                 status_code=404,
                 detail=get_message("blog.getBlogCommentLists.commentNotFound"),
             )
 
-        # 获取所有父评论的子评论和孙评论，确保评论树完整（支持三级嵌套）
-        all_comments = list(parent_comments)
-        parent_ids = [c.id for c in parent_comments]
-
-        # 第一级：获取所有子评论（parent_id 指向父评论）
-        children_statement = (
-            select(Blog_Comment)
-            .options(selectinload(Blog_Comment.user).selectinload(User.avatar))
-            .where(
-                Blog_Comment.blog_id == blog_id,
-                Blog_Comment.is_deleted == False,
-                Blog_Comment.parent_id.in_(parent_ids),
+        roots = {
+            comment["comment_id"]: comment
+            for comment in build_comment_tree(
+                self._serialize_blog_comment_row(row) for row in rows
             )
+        }
+        comment_tree = [roots[row.id] for row in parent_rows]
+        self.logger.info(
+            f"Retrieved {len(parent_rows)} comment threads with {len(rows)} comments in one query"
         )
 
-        children_result = await self.db.execute(children_statement)
-        children_comments = children_result.scalars().all()
-        all_comments.extend(children_comments)
-
-        # 第二级：获取所有孙评论（parent_id 指向子评论）
-        if children_comments:
-            children_ids = [c.id for c in children_comments]
-            grandchildren_statement = (
-                select(Blog_Comment)
-                .options(selectinload(Blog_Comment.user).selectinload(User.avatar))
-                .where(
-                    Blog_Comment.blog_id == blog_id,
-                    Blog_Comment.is_deleted == False,
-                    Blog_Comment.parent_id.in_(children_ids),
-                )
-            )
-
-            grandchildren_result = await self.db.execute(grandchildren_statement)
-            grandchildren_comments = grandchildren_result.scalars().all()
-            all_comments.extend(grandchildren_comments)
-
-            self.logger.info(
-                f"Retrieved {len(parent_comments)} parent comments, {len(children_comments)} child comments, and {len(grandchildren_comments)} grandchild comments"
-            )
-        else:
-            self.logger.info(
-                f"Retrieved {len(parent_comments)} parent comments and {len(children_comments)} child comments"
-            )
-
-        # 构建评论树
-        comment_tree = await self._build_blog_comment_tree(all_comments)
-
         # 生成下一页的 cursor（基于父评论）
         next_cursor = None
-        if has_next and parent_comments:
-            last_parent_comment = parent_comments[-1]
+        if has_next:
+            last_parent_comment = parent_rows[-1]
             next_cursor = paginator_desc.encode_cursor(
                 last_parent_comment.created_at, last_parent_comment.id
             )
@@ -1324,13 +1469,9 @@ class BlogCrud:
                     Saved_Blog.user_id == user_id, Saved_Blog.blog_id == blog_id
                 )
             )
-            # 减少博客的保存数
-            await self.db.execute(
-                update(Blog_Stats)
-                .where(Blog_Stats.blog_id == blog_id)
-                .values(saves=Blog_Stats.saves - 1)
-            )
             await self.db.commit()
+            # 减少博客的保存数（写回式计数）
+            await blog_stats_counter.incr_async(blog_id, saves=-1)
 
             return False
         else:
@@ -1341,49 +1482,36 @@ class BlogCrud:
                     blog_id=blog_id,
                 )
             )
-            # 增加博客的保存数
-            await self.db.execute(
-                update(Blog_Stats)
-                .where(Blog_Stats.blog_id == blog_id)
-                .values(saves=Blog_Stats.saves + 1)
-            )
             await self.db.commit()
+            # 增加博客的保存数（写回式计数）
+            await blog_stats_counter.incr_async(blog_id, saves=1)
+            await blog_trending.record_async(blog_id, "save")
 
             return True
 
-    async def like_blog_button(self, blog_id: int, ip_address: str) -> bool:
-        cache_key = f"blog_like_button:{blog_id}:ip={ip_address}"
-        cache_data = await redis_manager.get_async(cache_key)
-        if cache_data:
-            # 用户已经点赞过，那么取消点赞
-            await self.db.execute(
-                update(Blog_Stats)
-                .where(Blog_Stats.blog_id == blog_id)
-                .values(likes=Blog_Stats.likes - 1)
-            )
-            await self.db.commit()
-            await redis_manager.delete_async(cache_key)
-            return False
-
-        blog = await self.get_blog_by_id(blog_id)
-        if not blog:
-            raise HTTPException(
-                status_code=404,
-                detail=get_message("blog.common.blogNotFound"),
-            )
+    async def like_blog_button(self, blog_id: int, ip_address: str) -> Dict[str, Any]:
+        """点赞 / 取消点赞，返回新的点赞状态与最新点赞数
 
-        # 增加点赞数
-        await self.db.execute(
-            update(Blog_Stats)
-            .where(Blog_Stats.blog_id == blog_id)
-            .values(likes=Blog_Stats.likes + 1)
-        )
-        await self.db.commit()
+        状态切换、写回式计数与统计投影在一个 Lua 脚本中原子完成，并发点击不会重复计数；
+        统计投影不存在时先从数据库加载（同时校验博客是否存在）再切换。
+        """
+        toggled = await blog_like_tracker.toggle_async(blog_id, ip_address)
+        if toggled is None:
+            stats = await self._get_real_time_blog_stats([blog_id])
+            if blog_id not in stats:
+                raise HTTPException(
+                    status_code=404,
+                    detail=get_message("blog.common.blogNotFound"),
+                )
+            toggled = await blog_like_tracker.toggle_async(blog_id, ip_address)
+            if toggled is None:
+                # 投影刚加载就过期的极端情况，仍按加载的统计值返回
+                return {"is_liked": False, "likes": stats[blog_id]["likes"]}
 
-        # 设置缓存，防止重复点赞（缓存24小时）
-        await redis_manager.set_async(cache_key, "1", ex=86400)
-
-        return True
+        is_liked, likes = toggled
+        if is_liked:
+            await blog_trending.record_async(blog_id, "like")
+        return {"is_liked": is_liked, "likes": likes}
 
     async def update_blog_status(
         self,
@@ -1409,6 +1537,9 @@ class BlogCrud:
                 detail=get_message("blog.common.blogNotFound"),
             )
 
+        was_published = bool(blog.blog_status and blog.blog_status.is_published)
+        tag_ids = [blog_tag.tag_id for blog_tag in blog.blog_tags]
+
         # 构建更新值字典，只包含非None的字段
         update_values = {}
         if is_published is not None:
@@ -1425,10 +1556,23 @@ class BlogCrud:
         )
         await self.db.commit()
 
-        # 更新缓存
-        await redis_manager.delete_pattern_async("blog_lists:*")
-        # 清理导航缓存
-        await redis_manager.delete_pattern_async("blog_navigation:*")
+        # 发布状态变化时更新栏目与标签下的已发布博客数量
+        if is_published is not None and is_published != was_published:
+            await self._change_blog_counts(
+                blog.section_id, tag_ids, published_delta=1 if is_published else -1
+            )
+
+        # 取消发布的博客移出热度排行
+        if is_published is False:
+            await blog_trending.remove_async(blog.id)
+
+        # 更新列表缓存并清理导航缓存
+        await redis_manager.invalidate_async(
+            patterns=["blog_lists:*", "blog_navigation:*"]
+        )
+        # 发布状态变化后预热列表，避免首批访客集中回源
+        if is_published is not None:
+            await schedule_cache_warming(f"blog {blog.id} published={is_published}")
 
         return True
 
@@ -1530,23 +1674,17 @@ class BlogCrud:
         return response
 
     async def get_blog_stats(self, blog_id: int) -> Optional[Dict]:
-        stats = await self.db.execute(
-            select(Blog_Stats).where(Blog_Stats.blog_id == blog_id)
-        )
-        stats = stats.scalar_one_or_none()
-
-        if not stats:
+        stats = await self._get_real_time_blog_stats([blog_id])
+        if blog_id not in stats:
             raise HTTPException(
                 status_code=404,
                 detail=get_message("blog.getBlogStats.blogStatsNotFound"),
             )
 
-        response = {
-            "views": stats.views,
-            "likes": stats.likes,
-            "comments": stats.comments,
-            "saves": stats.saves,
-        }
+        response = dict(stats[blog_id])
+        # 最近 REDIS_UNIQUE_VIEW_RETENTION_DAYS 天的独立访客数
+        unique_viewers = await blog_view_tracker.count_unique_async([blog_id])
+        response["unique_viewers"] = unique_viewers[blog_id]
 
         return response
 
@@ -1558,6 +1696,9 @@ class BlogCrud:
                 status_code=404,
                 detail=get_message("blog.common.blogNotFound"),
             )
+        section_id = blog.section_id
+        was_published = bool(blog.blog_status and blog.blog_status.is_published)
+        tag_ids = [blog_tag.tag_id for blog_tag in blog.blog_tags]
 
         try:
             # Step 1: 删除所有子评论（replies）- 先删除有 parent_id 的评论
@@ -1580,13 +1721,25 @@ class BlogCrud:
 
             # 更新缓存 - 使用try-except包装，避免缓存错误影响删除结果
             try:
-                await redis_manager.delete_pattern_async("blog_lists:*")
-                await redis_manager.delete_pattern_async("blog_details:*")
-                await redis_manager.delete_pattern_async("blog_details_seo:*")
-                # 清理导航缓存
-                await redis_manager.delete_pattern_async("blog_navigation:*")
-                # 清除热门博客缓存（删除的可能是热门博客）
-                await redis_manager.delete_pattern_async("get_recent_populor_blog:*")
+                # 移出热度排行与累计排行，更新栏目与标签下的博客数量
+                await blog_trending.remove_async(blog_id)
+                await blog_leaderboard.remove_async(blog_id)
+                await self._change_blog_counts(
+                    section_id,
+                    tag_ids,
+                    all_delta=-1,
+                    published_delta=-1 if was_published else 0,
+                )
+                # 包括导航缓存与热门博客缓存（删除的可能是热门博客）
+                await redis_manager.invalidate_async(
+                    patterns=[
+                        "blog_lists:*",
+                        "blog_details:*",
+                        "blog_details_seo:*",
+                        "blog_navigation:*",
+                        "get_recent_populor_blog:*",
+                    ]
+                )
             except Exception as cache_error:
                 # 记录缓存清理错误，但不影响删除结果
                 self.logger.warning(
@@ -1700,46 +1853,81 @@ class BlogCrud:
 
         return formatted_items, pagination_metadata
 
-    async def get_recent_populor_blog(self) -> List[Dict[str, Any]]:
+    async def get_recent_populor_blog(
+        self, window: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        获取最近受欢迎阅读量 留言点赞收藏加起来数量最多的排名前3的博客
+        获取最近受欢迎的博客：按时间衰减热度排名，window 为 24h / 7d / 30d 时按滚动窗口内的互动排名
         """
         language = get_current_language()
         # 缓存键
-        cache_key = f"get_recent_populor_blog:lang={language}"
-        cache_data = await redis_manager.get_async(cache_key)
-        if cache_data:
-            return json.loads(cache_data)
+        cache_key = (
+            f"get_recent_populor_blog:lang={language}:window={window or 'decay'}"
+        )
+        # 热度随互动实时变化，缓存5分钟，过期后先返回旧值并后台刷新
+        return await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: self._build_recent_populor_blog(language, window),
+            ex=300,
+            refresh=lambda: mysql_manager.run_in_session(
+                lambda db: BlogCrud(db)._build_recent_populor_blog(language, window)
+            ),
+        )
 
-        # 查询博客统计数据，计算总热度（views + likes + comments + saves）
-        # 只获取已发布的博客
-        # 优化：使用 selectinload 替代 joinedload
-        statement = (
-            select(Blog, Blog_Stats)
-            .join(Blog_Stats, Blog_Stats.blog_id == Blog.id)
+    async def _get_published_blogs_in_order(self, blog_ids: List[int]) -> List[Blog]:
+        """按 blog_ids 的顺序加载其中已发布的博客（含封面与标签）"""
+        if not blog_ids:
+            return []
+        result = await self.db.execute(
+            select(Blog)
             .join(Blog_Status, Blog_Status.blog_id == Blog.id)
             .options(
                 selectinload(Blog.cover),
                 selectinload(Blog.blog_tags).selectinload(Blog_Tag.tag),
             )
-            .where(Blog_Status.is_published == True)
-            .order_by(
-                (
-                    Blog_Stats.views
-                    + Blog_Stats.likes
-                    + Blog_Stats.comments
-                    + Blog_Stats.saves
-                ).desc()
-            )
-            .limit(9)
+            .where(Blog.id.in_(blog_ids), Blog_Status.is_published == True)
         )
+        blogs_by_id = {blog.id: blog for blog in result.scalars().all()}
+        return [blogs_by_id[blog_id] for blog_id in blog_ids if blog_id in blogs_by_id]
 
-        result = await self.db.execute(statement)
-        rows = result.all()
+    async def _build_recent_populor_blog(
+        self, language: Language, window: Optional[str] = None, limit: int = 9
+    ) -> List[Dict[str, Any]]:
+        """从热度排行构建热门博客缓存数据
+
+        排行中的博客可能已取消发布，多取一些再按发布状态过滤；
+        排行不足 limit 篇时（例如刚上线没有互动数据），从 Redis 中的累计排行
+        （views + likes + comments + saves）补齐，累计排行未加载时先从 Blog_Stats 加载。
+        """
+        ranked_ids = [
+            blog_id for blog_id, _ in await blog_trending.top_async(limit * 3, window)
+        ]
+        blogs = (await self._get_published_blogs_in_order(ranked_ids))[:limit]
+
+        if len(blogs) < limit:
+            await ensure_blog_leaderboard_loaded(self.db)
+            # 各指标前 limit * 3 名的并集，按出现的累计值之和排序
+            totals: Dict[int, int] = {}
+            for rows in (await blog_leaderboard.top_async(limit * 3)).values():
+                for blog_id, score in rows:
+                    totals[blog_id] = totals.get(blog_id, 0) + score
+            selected = {blog.id for blog in blogs}
+            candidate_ids = [
+                blog_id
+                for blog_id in sorted(totals, key=totals.__getitem__, reverse=True)
+                if blog_id not in selected
+            ]
+            blogs.extend(
+                (await self._get_published_blogs_in_order(candidate_ids))[
+                    : limit - len(blogs)
+                ]
+            )
+
+        stats_map = await self._get_real_time_blog_stats([blog.id for blog in blogs])
 
         # 格式化响应数据
         items: List[Dict[str, Any]] = []
-        for blog, stats in rows:
+        for blog in blogs:
             items.append(
                 {
                     "blog_id": blog.id,
@@ -1763,21 +1951,15 @@ class BlogCrud:
                         }
                         for tag in blog.blog_tags
                     ],
-                    "blog_stats": {
-                        "views": stats.views,
-                        "likes": stats.likes,
-                        "comments": stats.comments,
-                        "saves": stats.saves,
-                    },
+                    "blog_stats": stats_map.get(
+                        blog.id, {"views": 0, "likes": 0, "comments": 0, "saves": 0}
+                    ),
                     "created_at": blog.created_at.isoformat()
                     if blog.created_at
                     else None,
                 }
             )
 
-        # 缓存结果（缓存1小时）
-        await redis_manager.set_async(cache_key, json.dumps(items), ex=3600)
-
         return items
 
 
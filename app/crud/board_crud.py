@@ -2,7 +2,7 @@ import json
 from fastapi import Depends, HTTPException
 from sqlmodel import select, update, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from app.models.board_model import Board, Board_Comment
 from app.models.user_model import RoleType, User
 from sqlalchemy.orm import selectinload
@@ -11,6 +11,7 @@ from app.core.database.redis import redis_manager
 from app.core.logger import logger_manager
 from app.core.i18n.i18n import get_message, Language, get_current_language
 from app.utils.agent import agent_utils
+from app.utils.comment_tree import build_comment_tree
 from app.utils.keyset_pagination import paginator_desc
 
 
@@ -19,37 +20,27 @@ class BoardCrud:
         self.db = db
         self.logger = logger_manager.get_logger(__name__)
 
-    async def _build_board_comment_tree(
-        self, comments: List[Board_Comment], parent_id: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        tree = []
-        for comment in comments:
-            if comment.parent_id == parent_id:
-                children = await self._build_board_comment_tree(comments, comment.id)
-
-                comment_dict = {
-                    "comment_id": comment.id,
-                    "user_id": comment.user_id,
-                    "username": comment.user.username if comment.user else None,
-                    "avatar_url": comment.user.avatar.thumbnail_filepath_url
-                    or comment.user.avatar.original_filepath_url
-                    if comment.user and comment.user.avatar
-                    else None,
-                    "user_role": comment.user.role.name,
-                    "city": comment.user.city,
-                    "parent_id": comment.parent_id,
-                    "comment": comment.comment,
-                    "created_at": comment.created_at.isoformat()
-                    if comment.created_at
-                    else None,
-                    "updated_at": comment.updated_at.isoformat()
-                    if comment.updated_at
-                    else None,
-                }
-                if children:
-                    comment_dict["children"] = children
-                tree.append(comment_dict)
-        return tree
+    @staticmethod
+    def _serialize_board_comment(comment: Board_Comment) -> Dict[str, Any]:
+        return {
+            "comment_id": comment.id,
+            "user_id": comment.user_id,
+            "username": comment.user.username if comment.user else None,
+            "avatar_url": comment.user.avatar.thumbnail_filepath_url
+            or comment.user.avatar.original_filepath_url
+            if comment.user and comment.user.avatar
+            else None,
+            "user_role": comment.user.role.name,
+            "city": comment.user.city,
+            "parent_id": comment.parent_id,
+            "comment": comment.comment,
+            "created_at": comment.created_at.isoformat()
+            if comment.created_at
+            else None,
+            "updated_at": comment.updated_at.isoformat()
+            if comment.updated_at
+            else None,
+        }
 
     async def _get_board_by_id(self, board_id: int) -> Optional[Board]:
         statement = select(Board).where(Board.id == board_id)
@@ -278,7 +269,9 @@ class BoardCrud:
                 )
 
         # 构建评论树
-        comment_tree = await self._build_board_comment_tree(all_comments)
+        comment_tree = build_comment_tree(
+            self._serialize_board_comment(comment) for comment in all_comments
+        )
 
         # 生成下一页的 cursor（基于父评论）
         next_cursor = None
@@ -235,9 +235,7 @@ class PaymentCrud:
         payment_record = payment_record_result.scalar_one()
 
         # 清理缓存
-        await redis_manager.delete_pattern_async(
-            "payment_record:page=*:size=*:user_id=*"
-        )
+        await redis_manager.delete_pattern_async("payment_record:*")
 
         return payment_record
 
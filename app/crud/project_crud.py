@@ -119,11 +119,28 @@ class ProjectCrud:
 
         # Cache key
         cache_key = f"project_lists:lang={language}:page={page}:size={size}:published_only={published_only}"
-        cache_data = await redis_manager.get_async(cache_key)
-        if cache_data:
-            payload = json.loads(cache_data)
-            return payload.get("items", []), payload.get("pagination", {})
+        # Serve stale entries immediately and refresh them in the background
+        payload = await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: self._build_project_lists_payload(
+                page, size, published_only, language
+            ),
+            refresh=lambda: mysql_manager.run_in_session(
+                lambda db: ProjectCrud(db)._build_project_lists_payload(
+                    page, size, published_only, language
+                )
+            ),
+        )
+        return payload.get("items", []), payload.get("pagination", {})
 
+    async def _build_project_lists_payload(
+        self,
+        page: int,
+        size: int,
+        published_only: bool,
+        language: Language,
+    ) -> Dict[str, Any]:
+        """Build the cached project list payload from the database"""
         # Set filters based on published_only parameter
         filters = {"is_published": True} if published_only else {}
 
@@ -207,13 +224,9 @@ class ProjectCrud:
                     }
                 )
 
-        # Cache result
-        cache_data = offset_paginator.create_response_data(
+        return offset_paginator.create_response_data(
             response_items, pagination_metadata
         )
-        await redis_manager.set_async(cache_key, json.dumps(cache_data))
-
-        return response_items, pagination_metadata
 
     async def create_project(
         self,
@@ -407,9 +420,9 @@ class ProjectCrud:
             )
 
         # 清理缓存
-        await redis_manager.delete_pattern_async("project_lists:*")
-        await redis_manager.delete_pattern_async("project_details:*")
-        await redis_manager.delete_pattern_async("project_seo:*")
+        await redis_manager.invalidate_async(
+            patterns=["project_lists:*", "project_details:*", "project_seo:*"]
+        )
 
         return slug
 
@@ -432,9 +445,11 @@ class ProjectCrud:
         await self.db.commit()
 
         # 清理缓存
-        await redis_manager.delete_pattern_async("project_lists:*")
-        await redis_manager.delete_pattern_async(
-            f"project_details:lang={language}:project_id={project_id}:*"
+        await redis_manager.invalidate_async(
+            patterns=[
+                "project_lists:*",
+                f"project_details:lang={language}:project_id={project_id}:*",
+            ]
         )
 
         return True
@@ -445,6 +460,9 @@ class ProjectCrud:
         user_id: Optional[int] = None,
         is_editor: Optional[bool] = False,
     ) -> Dict[str, Any]:
+        if is_editor:
+            # 编辑器需要读到刚保存的内容，不使用从库
+            mysql_manager.use_primary(self.db)
         language = get_current_language()
         cache_key = f"project_details:lang={language}:project_slug={project_slug}:user_id={user_id}:is_editor={is_editor}"
         cache_result = await redis_manager.get_async(cache_key)
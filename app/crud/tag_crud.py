@@ -1,4 +1,3 @@
-import json
 import slugify
 from datetime import datetime, timezone
 from fastapi import Depends, HTTPException
@@ -53,11 +52,26 @@ class TagCrud:
 
         # 缓存键（包含语言以避免不同语言之间的缓存污染）
         cache_key = f"tag_lists:lang={language}:page={page}:size={size}"
-        cache_data = await redis_manager.get_async(cache_key)
-        if cache_data:
-            payload = json.loads(cache_data)
-            return payload.get("items", []), payload.get("pagination", {})
+        # 过了软 TTL 的数据先返回旧值，再在独立会话中后台刷新
+        payload = await redis_manager.get_or_build_async(
+            cache_key,
+            lambda: self._build_tag_lists_payload(page, size, published_only, language),
+            refresh=lambda: mysql_manager.run_in_session(
+                lambda db: TagCrud(db)._build_tag_lists_payload(
+                    page, size, published_only, language
+                )
+            ),
+        )
+        return payload.get("items", []), payload.get("pagination", {})
 
+    async def _build_tag_lists_payload(
+        self,
+        page: int,
+        size: int,
+        published_only: Optional[bool],
+        language: Language,
+    ) -> Dict[str, Any]:
+        """从数据库构建标签列表缓存数据"""
         # 使用分页工具获取结果
         items, pagination_metadata = await offset_paginator.get_paginated_result(
             db=self.db,
@@ -121,13 +135,9 @@ class TagCrud:
                     }
                 )
 
-        # 缓存结果
-        cache_data = offset_paginator.create_response_data(
+        return offset_paginator.create_response_data(
             response_items, pagination_metadata
         )
-        await redis_manager.set_async(cache_key, json.dumps(cache_data))
-
-        return response_items, pagination_metadata
 
     async def create_tag(
         self,
@@ -228,9 +228,14 @@ class UserCrud:
         delete_user_media_task.delay(user_id)
 
         # Invalidate caches (best-effort)
-        await redis_manager.delete_async(f"user_profile_{user_id}")
-        await redis_manager.delete_async(f"other_user_profile:{user_id}")
-        await redis_manager.delete_pattern_async("admin_all_users:*")
+        await redis_manager.invalidate_async(
+            keys=[
+                f"user_profile_{user_id}",
+                f"other_user_profile:{user_id}",
+                f"user_principal:{user_id}",
+            ],
+            patterns=["admin_all_users:*"],
+        )
 
         return True
 
@@ -266,8 +271,10 @@ class UserCrud:
         await self.db.refresh(user)
 
         # 删除缓存
-        await redis_manager.delete_pattern_async("admin_all_users:*")
-        await redis_manager.delete_async(f"user_profile_{user_id}")
+        await redis_manager.invalidate_async(
+            keys=[f"user_profile_{user_id}", f"user_principal:{user_id}"],
+            patterns=["admin_all_users:*"],
+        )
 
         return True
 
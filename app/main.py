@@ -15,8 +15,10 @@ from fastapi.staticfiles import StaticFiles
 from app.core.i18n.i18n import get_message, set_request_language, get_language
 from app.core.logger import logger_manager
 from app.core.database.connection import db_manager
+from app.core.database.mysql import WRITE_METHODS, mysql_manager
 from app.core.config.settings import settings
 from app.schemas.common import SuccessResponse
+from app.tasks.cache_warming_task import schedule_cache_warming
 from app.router.v1 import (
     auth_router,
     user_router,
@@ -96,6 +98,10 @@ async def lifespan(_app: FastAPI):
         logger.error(f"❌ Database connection failed: {e}")
         logger.warning("⚠️ Application will start without database connections")
 
+    # 预热热点缓存（多个 worker 同时启动时只会排队一次）
+    if settings.redis.REDIS_WARMING_ON_STARTUP:
+        await schedule_cache_warming("startup")
+
     yield
 
     # 关闭数据库连接
@@ -127,6 +133,19 @@ async def language_middleware(request: Request, call_next):
     return response
 
 
+# 读己之写中间件：写请求成功后，该客户端短时间内的读取不使用从库
+@app.middleware("http")
+async def read_your_writes_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if (
+        mysql_manager.replica_engines
+        and request.method in WRITE_METHODS
+        and response.status_code < 400
+    ):
+        mysql_manager.mark_recent_write(response)
+    return response
+
+
 # 全局异常处理器
 @app.exception_handler(HTTPException)
 async def http_exception_handler(_request: Request, exc: HTTPException):
@@ -1,8 +1,16 @@
+from .analytics_model import (
+    Blog_Daily_Rollup,
+    Media_Daily_Rollup,
+    Payment_Daily_Rollup,
+    Project_Daily_Rollup,
+    User_Daily_Rollup,
+)
 from .auth_model import Code, RefreshToken, Social_Account
 from .blog_model import (
     Blog,
     Blog_Status,
     Blog_Stats,
+    Blog_Stats_Flush_Batch,
     Blog_TTS,
     Blog_Comment,
     Saved_Blog,
@@ -22,12 +30,18 @@ from .subscriber_model import Subscriber
 
 
 __all__ = [
+    "Blog_Daily_Rollup",
+    "Media_Daily_Rollup",
+    "Payment_Daily_Rollup",
+    "Project_Daily_Rollup",
+    "User_Daily_Rollup",
     "Code",
     "Token",
     "Social_Account",
     "Blog",
     "Blog_Status",
     "Blog_Stats",
+    "Blog_Stats_Flush_Batch",
     "Blog_TTS",
     "Blog_Comment",
     "Saved_Blog",
@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Optional
+from sqlmodel import Field, Index, SQLModel
+from app.models.payment_model import PaymentStatus, PaymentType
+from app.models.project_model import ProjectType
+
+# 分析后台的每日汇总表，由 analytics_rollup_task 维护
+# 每行按实体创建日期（day）分桶，保存当天创建的实体“当前”的计数与合计，
+# 全量指标 = 所有桶之和，本月 / 最近 N 天指标 = 对应日期范围内的桶之和
+
+
+class Blog_Daily_Rollup(SQLModel, table=True):
+    """博客每日汇总 - 按创建日期与栏目分桶"""
+
+    __tablename__ = "blog_daily_rollup"
+
+    __table_args__ = (
+        Index("idx_blog_daily_rollup_day_section", "day", "section_id", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    day: date = Field(nullable=False)
+    section_id: Optional[int] = Field(default=None, nullable=True)
+    blogs: int = Field(nullable=False, default=0)
+    published: int = Field(nullable=False, default=0)
+    archived: int = Field(nullable=False, default=0)
+    featured: int = Field(nullable=False, default=0)
+    views: int = Field(nullable=False, default=0)
+    likes: int = Field(nullable=False, default=0)
+    comments: int = Field(nullable=False, default=0)
+    saves: int = Field(nullable=False, default=0)
+
+
+class User_Daily_Rollup(SQLModel, table=True):
+    """用户每日汇总 - 按注册日期分桶"""
+
+    __tablename__ = "user_daily_rollup"
+
+    __table_args__ = (Index("idx_user_daily_rollup_day", "day", unique=True),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    day: date = Field(nullable=False)
+    users: int = Field(nullable=False, default=0)
+    active_users: int = Field(nullable=False, default=0)
+
+
+class Payment_Daily_Rollup(SQLModel, table=True):
+    """支付每日汇总 - 按支付日期、支付方式与支付状态分桶"""
+
+    __tablename__ = "payment_daily_rollup"
+
+    __table_args__ = (
+        Index(
+            "idx_payment_daily_rollup_day_type_status",
+            "day",
+            "payment_type",
+            "payment_status",
+            unique=True,
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    day: date = Field(nullable=False)
+    payment_type: PaymentType = Field(nullable=False)
+    payment_status: PaymentStatus = Field(nullable=False)
+    payments: int = Field(nullable=False, default=0)
+    amount: float = Field(nullable=False, default=0)
+    tax_amount: float = Field(nullable=False, default=0)
+
+
+class Media_Daily_Rollup(SQLModel, table=True):
+    """媒体文件每日汇总 - 按上传日期分桶"""
+
+    __tablename__ = "media_daily_rollup"
+
+    __table_args__ = (Index("idx_media_daily_rollup_day", "day", unique=True),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    day: date = Field(nullable=False)
+    media: int = Field(nullable=False, default=0)
+    avatars: int = Field(nullable=False, default=0)
+
+
+class Project_Daily_Rollup(SQLModel, table=True):
+    """项目每日汇总 - 按创建日期、栏目与项目类型分桶"""
+
+    __tablename__ = "project_daily_rollup"
+
+    __table_args__ = (
+        Index(
+            "idx_project_daily_rollup_day_section_type",
+            "day",
+            "section_id",
+            "type",
+            unique=True,
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    day: date = Field(nullable=False)
+    section_id: Optional[int] = Field(default=None, nullable=True)
+    type: ProjectType = Field(nullable=False)
+    projects: int = Field(nullable=False, default=0)
+    published: int = Field(nullable=False, default=0)
@@ -34,8 +34,12 @@ class RefreshToken(SQLModel, table=True):
         Index("idx_refresh_tokens_jti", "jti"),
         Index("idx_refresh_tokens_expired_at", "expired_at"),
         # 复合索引 - 用于高效查询
+        # 等值条件在前、范围条件（expired_at / expires_at）在后，范围之后的列无法用于定位
         Index(
-            "idx_refresh_tokens_get_user_tokens", "user_id", "expired_at", "is_active"
+            "idx_refresh_tokens_user_active_expired",
+            "user_id",
+            "is_active",
+            "expired_at",
         ),  # auth_crud.py: _get_user_tokens
         Index(
             "idx_refresh_tokens_revoke_user_tokens", "user_id", "is_active"
@@ -84,16 +88,21 @@ class Code(SQLModel, table=True):
         Index("idx_codes_type", "type"),
         Index("idx_codes_is_used", "is_used"),
         # 复合索引
+        # 等值条件在前、范围条件 expires_at 在后
         Index(
-            "idx_codes_get_valid_code", "user_id", "type", "expires_at", "is_used"
+            "idx_codes_user_type_used_expires",
+            "user_id",
+            "type",
+            "is_used",
+            "expires_at",
         ),  # auth_crud.py: _get_valid_code
         Index(
-            "idx_codes_validate_code",
+            "idx_codes_user_code_type_used_expires",
             "user_id",
             "code",
             "type",
-            "expires_at",
             "is_used",
+            "expires_at",
         ),  # auth_crud.py: _validate_code
         # 排序索引
         Index("idx_codes_created_at_desc", desc("created_at")),
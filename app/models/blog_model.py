@@ -32,6 +32,10 @@ class Blog(SQLModel, table=True):
         Index("idx_blogs_section_id", "section_id"),
         Index("idx_blogs_seo_id", "seo_id"),
         Index("idx_blogs_slug", "slug"),
+        # 复合索引 - 与热点查询的过滤 + 排序列一致，避免 filesort
+        Index(
+            "idx_blogs_section_created", "section_id", "created_at", "id"
+        ),  # blog_crud.py: _build_blog_lists_payload（offset 与游标分页）
         # 排序索引
         Index("idx_users_created_at_desc", desc("created_at")),
         Index("idx_users_updated_at_desc", desc("updated_at")),
@@ -183,6 +187,9 @@ class Blog_Status(SQLModel, table=True):
         Index("idx_blog_status_is_archived", "is_archived"),
         Index("idx_blog_status_is_featured", "is_featured"),
         # 复合索引
+        Index(
+            "idx_blog_status_blog_published", "blog_id", "is_published"
+        ),  # blog_crud.py: 已发布博客列表 JOIN blog_status（覆盖索引）
         # 排序索引
         Index("idx_blog_status_created_at_desc", desc("created_at")),
         Index("idx_blog_status_updated_at_desc", desc("updated_at")),
@@ -267,6 +274,24 @@ class Blog_Stats(SQLModel, table=True):
         return f"<Blog_Stats(id={self.id}, blog_id={self.blog_id}, views={self.views}, likes={self.likes}, comments={self.comments}, saves={self.saves})>"
 
 
+class Blog_Stats_Flush_Batch(SQLModel, table=True):
+    """博客统计落库批次表 - 与 Blog_Stats 的 UPDATE 在同一事务中写入，防止同一批增量重复落库"""
+
+    __tablename__ = "blog_stats_flush_batch"
+
+    __table_args__ = (Index("idx_blog_stats_flush_batch_applied_at", "applied_at"),)
+
+    batch_id: str = Field(max_length=32, primary_key=True)
+    applied_at: datetime = Field(
+        nullable=False,
+        sa_type=TIMESTAMP,
+        sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
+    )
+
+    def __repr__(self):
+        return f"<Blog_Stats_Flush_Batch(batch_id={self.batch_id}, applied_at={self.applied_at})>"
+
+
 class Blog_Comment(SQLModel, table=True):
     """博客评论表 - 存储博客的评论信息"""
 
@@ -280,6 +305,14 @@ class Blog_Comment(SQLModel, table=True):
         Index("idx_blog_comment_parent_id", "parent_id"),
         Index("idx_blog_comment_is_deleted", "is_deleted"),
         # 复合索引
+        Index(
+            "idx_blog_comment_thread",
+            "blog_id",
+            "is_deleted",
+            "parent_id",
+            "created_at",
+            "id",
+        ),  # blog_crud.py: get_blog_comment_lists（父评论游标分页与子评论查询）
         # 排序索引
         Index("idx_blog_comment_created_at_desc", desc("created_at")),
         Index("idx_blog_comment_updated_at_desc", desc("updated_at")),
@@ -358,6 +391,9 @@ class Saved_Blog(SQLModel, table=True):
         Index("idx_saved_blog_blog_id", "blog_id"),
         # 复合索引
         Index("idx_saved_blog_user_id_blog_id", "user_id", "blog_id"),
+        Index(
+            "idx_saved_blog_user_created", "user_id", "created_at", "id"
+        ),  # blog_crud.py: get_saved_blog_lists
         # 排序索引
         Index("idx_saved_blog_created_at_desc", desc("created_at")),
         Index("idx_saved_blog_updated_at_desc", desc("updated_at")),
@@ -415,6 +451,9 @@ class Blog_Tag(SQLModel, table=True):
         Index("idx_blog_tag_tag_id", "tag_id"),
         # 复合索引
         Index("idx_blog_tag_blog_id_tag_id", "blog_id", "tag_id"),
+        Index(
+            "idx_blog_tag_tag_id_blog_id", "tag_id", "blog_id"
+        ),  # blog_crud.py: _build_blog_lists_by_tag_payload、_get_tag_blog_count（覆盖索引）
         # 排序索引
         Index("idx_blog_tag_created_at_desc", desc("created_at")),
         Index("idx_blog_tag_updated_at_desc", desc("updated_at")),
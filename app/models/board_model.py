@@ -90,6 +90,14 @@ class Board_Comment(SQLModel, table=True):
         # 复合索引
         Index("idx_board_comments_board_id_user_id", "board_id", "user_id"),
         Index("idx_board_comments_board_created", "board_id", "created_at"),
+        Index(
+            "idx_board_comments_thread",
+            "board_id",
+            "is_deleted",
+            "parent_id",
+            "created_at",
+            "id",
+        ),  # board_crud.py: get_board_comment_lists（父评论游标分页与子评论查询）
         # 排序索引
         Index("idx_board_comments_created_at_desc", desc("created_at")),
         Index("idx_board_comments_updated_at_desc", desc("updated_at")),
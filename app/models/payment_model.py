@@ -47,6 +47,12 @@ class Payment_Record(SQLModel, table=True):
         Index("idx_payment_record_payment_type", "payment_type"),
         Index("idx_payment_record_payment_status", "payment_status"),
         # 复合索引
+        Index(
+            "idx_payment_record_project_user_created",
+            "project_id",
+            "user_id",
+            "created_at",
+        ),  # project_crud.py: get_project_details 最近一次支付记录
         # 排序索引
         Index("idx_payment_record_created_at_desc", desc("created_at")),
     )
@@ -38,6 +38,13 @@ class Project(SQLModel, table=True):
         Index("idx_projects_seo_id", "seo_id"),
         Index("idx_projects_chinese_title", "chinese_title"),
         Index("idx_projects_is_published", "is_published"),
+        # 复合索引
+        Index(
+            "idx_projects_published_created", "is_published", "created_at", "id"
+        ),  # project_crud.py: _build_project_lists_payload（已发布项目）
+        Index(
+            "idx_projects_created", "created_at", "id"
+        ),  # project_crud.py: _build_project_lists_payload（全部项目）
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
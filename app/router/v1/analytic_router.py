@@ -124,3 +124,13 @@ async def get_growth_trends_router(
     """获取增长趋势数据"""
     result = await analytic_service.get_growth_trends(role=current_user.role, days=days)
     return SuccessResponse(message="增长趋势数据获取成功", data=result)
+
+
+@router.get("/admin/cache-metrics", response_model=SuccessResponse)
+async def get_cache_metrics_router(
+    analytic_service: AnalyticService = Depends(get_analytic_service),
+    current_user=Depends(get_current_user_dependency),
+):
+    """获取当前 worker 的缓存指标（按键族统计命中率、字节数与延迟）"""
+    result = await analytic_service.get_cache_metrics(role=current_user.role)
+    return SuccessResponse(message="缓存指标获取成功", data=result)
@@ -5,7 +5,11 @@ from typing import Optional
 from app.services.blog_service import get_blog_service, BlogService
 from app.router.v1.auth_router import get_current_user_dependency
 from app.utils.offset_pagination import offset_paginator
-from app.utils.pagination_headers import set_pagination_headers
+from app.utils.pagination_headers import (
+    set_keyset_pagination_headers,
+    set_pagination_headers,
+)
+from app.utils.http_cache import conditional_response
 from app.core.i18n.i18n import get_message
 from app.schemas.blog_schemas import (
     CreateBlogCommentRequest,
@@ -21,24 +25,38 @@ router = APIRouter(prefix="/blog", tags=["Blog"])
 
 @router.get("/get-blog-lists", response_model=SuccessResponse)
 async def get_blog_lists(
+    request: Request,
     response: Response,
     page: int = Query(1, ge=1, description="页码，从1开始"),
     size: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
     section_id: int = Query(..., description="栏目ID，必填"),
     blog_service: BlogService = Depends(get_blog_service),
     published_only: bool = Query(True, description="是否只返回已发布博客"),
+    cursor: Optional[str] = Query(
+        None, description="游标分页：传入时忽略 page，空字符串为第一页"
+    ),
 ):
     items, pagination_metadata = await blog_service.get_blog_lists(
         section_id=section_id,
         page=page,
         size=size,
         published_only=published_only,
+        cursor=cursor,
     )
-    set_pagination_headers(response, pagination_metadata)
+    if cursor is None:
+        set_pagination_headers(response, pagination_metadata)
+    else:
+        set_keyset_pagination_headers(response, pagination_metadata)
     # 返回标准分页数据结构
-    return SuccessResponse(
-        message=get_message("blog.getBlogLists"),
-        data=offset_paginator.create_response_data(items, pagination_metadata),
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getBlogLists"),
+            data=offset_paginator.create_response_data(items, pagination_metadata),
+        ),
+        response,
+        private=not published_only,
+        surrogate_keys=[f"blog_lists:{section_id}"],
     )
 
 
@@ -84,13 +102,18 @@ async def update_blog(
 
 @router.get("/get-blog-details-seo/{blog_slug}", response_model=SuccessResponse)
 async def get_blog_details_seo(
+    request: Request,
     blog_slug: str,
     blog_service: BlogService = Depends(get_blog_service),
 ):
     result = await blog_service.get_blog_details_seo(
         blog_slug=blog_slug,
     )
-    return SuccessResponse(message=get_message("blog.getBlogDetailsSeo"), data=result)
+    return await conditional_response(
+        request,
+        SuccessResponse(message=get_message("blog.getBlogDetailsSeo"), data=result),
+        surrogate_keys=[f"blog_details_seo:{blog_slug}"],
+    )
 
 
 @router.get("/get-blog-details/{blog_slug}", response_model=SuccessResponse)
@@ -107,38 +130,55 @@ async def get_blog_details(
         is_editor=is_editor,
         user_id=user_id,
     )
-    return SuccessResponse(message=get_message("blog.getBlogDetails"), data=result)
+    return await conditional_response(
+        request,
+        SuccessResponse(message=get_message("blog.getBlogDetails"), data=result),
+        # 每次访问都需要到达 API 才能计入浏览量与热度，不进入共享缓存，
+        # 浏览器仍可凭 ETag 重新验证
+        private=True,
+    )
 
 
 @router.get("/get-blog-tts/{blog_id}", response_model=SuccessResponse)
 async def get_blog_tts(
+    request: Request,
     blog_id: int,
     blog_service: BlogService = Depends(get_blog_service),
 ):
     result = await blog_service.get_blog_tts(
         blog_id=blog_id,
     )
-    return SuccessResponse(
-        message=get_message("blog.getBlogTTS.getBlogTTSSuccess"), data=result
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getBlogTTS.getBlogTTSSuccess"), data=result
+        ),
+        surrogate_keys=[f"blog_tts:{blog_id}"],
     )
 
 
 @router.get("/get-blog-summary/{blog_id}", response_model=SuccessResponse)
 async def get_blog_summary(
+    request: Request,
     blog_id: int,
     blog_service: BlogService = Depends(get_blog_service),
 ):
     result = await blog_service.get_blog_summary(
         blog_id=blog_id,
     )
-    return SuccessResponse(
-        message=get_message("blog.getBlogSummary.getBlogSummarySuccess"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getBlogSummary.getBlogSummarySuccess"),
+            data=result,
+        ),
+        surrogate_keys=[f"blog_summary:{blog_id}"],
     )
 
 
 @router.get("/get-blog-comment-lists/{blog_id}", response_model=SuccessResponse)
 async def get_blog_comment_lists(
+    request: Request,
     blog_id: int,
     limit: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
     cursor: Optional[str] = Query(None, description="游标，可选"),
@@ -149,9 +189,13 @@ async def get_blog_comment_lists(
         limit=limit,
         cursor=cursor,
     )
-    return SuccessResponse(
-        message=get_message("blog.getBlogCommentLists.getBlogCommentListsSuccess"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getBlogCommentLists.getBlogCommentListsSuccess"),
+            data=result,
+        ),
+        surrogate_keys=[f"blog_comment_lists:{blog_id}"],
     )
 
 
@@ -232,7 +276,7 @@ async def like_blog_button(
         blog_id=form_data.blog_id,
     )
 
-    if result:
+    if result["is_liked"]:
         return SuccessResponse(
             message=get_message("blog.likeBlogButton.likedBlogButtonSuccess"),
             data=result,
@@ -280,13 +324,18 @@ async def update_blog_status(
 
 @router.get("/get-blog-navigation/{blog_id}", response_model=SuccessResponse)
 async def get_blog_navigation(
+    request: Request,
     blog_id: int,
     blog_service: BlogService = Depends(get_blog_service),
 ):
     result = await blog_service.get_blog_navigation(
         blog_id=blog_id,
     )
-    return SuccessResponse(message=get_message("blog.getBlogNavigation"), data=result)
+    return await conditional_response(
+        request,
+        SuccessResponse(message=get_message("blog.getBlogNavigation"), data=result),
+        surrogate_keys=[f"blog_navigation:{blog_id}"],
+    )
 
 
 @router.get("/get-blog-stats/{blog_id}", response_model=SuccessResponse)
@@ -335,42 +384,64 @@ async def get_saved_blog_lists(
 
 @router.get("/get-recent-popular-blog", response_model=SuccessResponse)
 async def get_recent_popular_blog(
+    request: Request,
+    window: Optional[str] = Query(
+        None,
+        pattern="^(24h|7d|30d)$",
+        description="滚动窗口 24h / 7d / 30d，不传时按时间衰减热度排名",
+    ),
     blog_service: BlogService = Depends(get_blog_service),
 ):
-    result = await blog_service.get_recent_populor_blog()
+    result = await blog_service.get_recent_populor_blog(window=window)
 
-    return SuccessResponse(
-        message=get_message("blog.getRecentPopularBlog"), data=result
+    return await conditional_response(
+        request,
+        SuccessResponse(message=get_message("blog.getRecentPopularBlog"), data=result),
+        surrogate_keys=["get_recent_populor_blog"],
     )
 
 
 @router.get("/get-blog-lists-by-tag-slug/{tag_slug}", response_model=SuccessResponse)
 async def get_blog_lists_by_tag_slug(
+    request: Request,
     response: Response,
     tag_slug: str,
     page: int = Query(1, ge=1, description="页码，从1开始"),
     size: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
+    cursor: Optional[str] = Query(
+        None, description="游标分页：传入时忽略 page，空字符串为第一页"
+    ),
     blog_service: BlogService = Depends(get_blog_service),
 ):
-    """根据标签slug获取博客列表 - 使用传统分页方式"""
+    """根据标签slug获取博客列表 - 默认使用传统分页方式，传入 cursor 时使用游标分页"""
     items, pagination_metadata = await blog_service.get_blog_lists_by_tag_slug(
         tag_slug=tag_slug,
         page=page,
         size=size,
+        cursor=cursor,
     )
 
     # 在响应头中添加分页信息
-    set_pagination_headers(response, pagination_metadata)
+    if cursor is None:
+        set_pagination_headers(response, pagination_metadata)
+    else:
+        set_keyset_pagination_headers(response, pagination_metadata)
 
     # 返回标准分页数据结构
-    return SuccessResponse(
-        message=get_message("blog.getBlogListsByTagSlug"),
-        data=offset_paginator.create_response_data(items, pagination_metadata),
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getBlogListsByTagSlug"),
+            data=offset_paginator.create_response_data(items, pagination_metadata),
+        ),
+        response,
+        surrogate_keys=["blog_lists", "tag_lists"],
     )
 
 
 @router.get("/get-archived-blog-lists", response_model=SuccessResponse)
 async def get_archived_blog_lists(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
     cursor: Optional[str] = Query(None, description="游标，可选"),
     blog_service: BlogService = Depends(get_blog_service),
@@ -380,7 +451,11 @@ async def get_archived_blog_lists(
         cursor=cursor,
         limit=limit,
     )
-    return SuccessResponse(
-        message=get_message("blog.getArchivedBlogLists"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("blog.getArchivedBlogLists"),
+            data=result,
+        ),
+        surrogate_keys=["blog_archived_lists", "blog_lists"],
     )
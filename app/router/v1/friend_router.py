@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from app.services.friend_service import FriendService, get_friend_service
 from app.schemas.friend_schemas import (
     FriendUpdateRequest,
@@ -9,6 +9,7 @@ from app.schemas.common import SuccessResponse
 from app.router.v1.auth_router import get_current_user_dependency
 from app.core.i18n.i18n import get_message
 from app.utils.offset_pagination import offset_paginator
+from app.utils.http_cache import conditional_response
 
 
 router = APIRouter(prefix="/friend", tags=["Friend"])
@@ -16,12 +17,17 @@ router = APIRouter(prefix="/friend", tags=["Friend"])
 
 @router.get("/get-friend-details", response_model=SuccessResponse)
 async def get_friend_details(
+    request: Request,
     friend_service: FriendService = Depends(get_friend_service),
 ):
     result = await friend_service.get_friend_details()
-    return SuccessResponse(
-        message=get_message("friend.getFriendDetails"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("friend.getFriendDetails"),
+            data=result,
+        ),
+        surrogate_keys=["friend_details"],
     )
 
 
@@ -45,6 +51,7 @@ async def update_friend(
 
 @router.get("/get-friend-list/{friend_id}", response_model=SuccessResponse)
 async def get_friend_list(
+    request: Request,
     friend_id: int,
     limit: int = Query(20, ge=1, le=100),
     cursor: str | None = Query(None),
@@ -54,9 +61,13 @@ async def get_friend_list(
     result = await friend_service.get_friend_list(
         friend_id=friend_id, limit=limit, cursor=cursor
     )
-    return SuccessResponse(
-        message=get_message("friend.getFriendList"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("friend.getFriendList"),
+            data=result,
+        ),
+        surrogate_keys=[f"friend_list:{friend_id}"],
     )
 
 
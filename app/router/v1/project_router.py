@@ -1,5 +1,5 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, Response, Query
+from fastapi import APIRouter, Depends, Request, Response, Query
 from app.schemas.project_schemas import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
@@ -10,6 +10,7 @@ from app.router.v1.auth_router import get_current_user_dependency
 from app.services.project_service import get_project_service, ProjectService
 from app.utils.offset_pagination import offset_paginator
 from app.utils.pagination_headers import set_pagination_headers
+from app.utils.http_cache import conditional_response
 from app.core.i18n.i18n import get_message
 
 
@@ -18,6 +19,7 @@ router = APIRouter(prefix="/project", tags=["Project"])
 
 @router.get("/get-project-lists", response_model=SuccessResponse)
 async def get_project_lists_router(
+    request: Request,
     response: Response,
     page: int = Query(1, ge=1, description="页码，从1开始"),
     size: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
@@ -28,9 +30,15 @@ async def get_project_lists_router(
         page=page, size=size, published_only=published_only
     )
     set_pagination_headers(response, pagination_metadata)
-    return SuccessResponse(
-        message=get_message("project.getProjectLists"),
-        data=offset_paginator.create_response_data(items, pagination_metadata),
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("project.getProjectLists"),
+            data=offset_paginator.create_response_data(items, pagination_metadata),
+        ),
+        response,
+        private=not published_only,
+        surrogate_keys=["project_lists"],
     )
 
 
@@ -107,6 +115,7 @@ async def publish_or_unpublish_project_router(
 
 @router.get("/get-project-details/{project_slug}", response_model=SuccessResponse)
 async def get_project_details_router(
+    request: Request,
     project_slug: str,
     user_id: Optional[int] = Query(None, description="用户ID，用于检查支付状态"),
     is_editor: Optional[bool] = Query(False, description="是否为编辑模式"),
@@ -117,21 +126,31 @@ async def get_project_details_router(
         user_id=user_id,
         is_editor=is_editor,
     )
-    return SuccessResponse(
-        message=get_message("project.getProjectDetails"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("project.getProjectDetails"),
+            data=result,
+        ),
+        private=is_editor or user_id is not None,
+        surrogate_keys=[f"project_details:{project_slug}"],
     )
 
 
 @router.get("/get-project-details-seo/{project_slug}", response_model=SuccessResponse)
 async def get_project_details_seo_router(
+    request: Request,
     project_slug: str,
     project_service: ProjectService = Depends(get_project_service),
 ):
     result = await project_service.get_project_details_seo(project_slug=project_slug)
-    return SuccessResponse(
-        message=get_message("project.getProjectDetailsSeo"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("project.getProjectDetailsSeo"),
+            data=result,
+        ),
+        surrogate_keys=[f"project_seo:{project_slug}"],
     )
 
 
@@ -1,45 +1,61 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from app.schemas.section_schemas import UpdateSectionRequest
 from app.schemas.common import SuccessResponse
 from app.core.i18n.i18n import get_message
 from app.router.v1.auth_router import get_current_user_dependency
 from app.services.section_service import get_section_service, SectionService
+from app.utils.http_cache import conditional_response
 
 router = APIRouter(prefix="/section", tags=["Section"])
 
 
 @router.get("/get-section-lists", response_model=SuccessResponse)
 async def get_section_lists_router(
+    request: Request,
     section_service: SectionService = Depends(get_section_service),
 ):
     result = await section_service.get_section_lists()
-    return SuccessResponse(
-        message=get_message("section.getSectionLists"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("section.getSectionLists"),
+            data=result,
+        ),
+        surrogate_keys=["section_lists_tree"],
     )
 
 
 @router.get("/get-section-seo-by-slug/{slug}", response_model=SuccessResponse)
 async def get_section_seo_by_slug_router(
+    request: Request,
     slug: str,
     section_service: SectionService = Depends(get_section_service),
 ):
     result = await section_service.get_section_seo_by_slug(slug)
-    return SuccessResponse(
-        message=get_message("section.getSectionSeoBySlug"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("section.getSectionSeoBySlug"),
+            data=result,
+        ),
+        surrogate_keys=[f"section_seo_by_slug:{slug}", "section_lists_tree"],
     )
 
 
 @router.get("/get-section-details-by-slug/{slug}", response_model=SuccessResponse)
 async def get_section_details_by_slug_router(
+    request: Request,
     slug: str,
     section_service: SectionService = Depends(get_section_service),
 ):
     result = await section_service.get_section_details_by_slug(slug)
-    return SuccessResponse(
-        message=get_message("section.getSectionDetailsBySlug"),
-        data=result,
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("section.getSectionDetailsBySlug"),
+            data=result,
+        ),
+        surrogate_keys=[f"section_details_by_slug:{slug}", "section_lists_tree"],
     )
 
 
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Response, Query
+from fastapi import APIRouter, Depends, Request, Response, Query
 from app.schemas.tag_schemas import TagCreateRequest, TagUpdateRequest
 from app.schemas.common import SuccessResponse
 from app.router.v1.auth_router import get_current_user_dependency
 from app.services.tag_service import get_tag_service, TagService
 from app.utils.offset_pagination import offset_paginator
 from app.utils.pagination_headers import set_pagination_headers
+from app.utils.http_cache import conditional_response
 from app.core.i18n.i18n import get_message
 
 
@@ -13,6 +14,7 @@ router = APIRouter(prefix="/tag", tags=["Tag"])
 
 @router.get("/get-tag-lists", response_model=SuccessResponse)
 async def get_tag_lists_router(
+    request: Request,
     response: Response,
     page: int = Query(1, ge=1, description="页码，从1开始"),
     size: int = Query(20, ge=1, le=100, description="每页数量，最大100"),
@@ -30,9 +32,15 @@ async def get_tag_lists_router(
     # 在响应头中添加分页信息
     set_pagination_headers(response, pagination_metadata)
 
-    return SuccessResponse(
-        message=get_message("tag.getTagLists"),
-        data=offset_paginator.create_response_data(items, pagination_metadata),
+    return await conditional_response(
+        request,
+        SuccessResponse(
+            message=get_message("tag.getTagLists"),
+            data=offset_paginator.create_response_data(items, pagination_metadata),
+        ),
+        response,
+        private=not published_only,
+        surrogate_keys=["tag_lists"],
     )
 
 
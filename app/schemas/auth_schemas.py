@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from app.models.user_model import RoleType
 
 
 class EmailSchema(BaseModel):
@@ -35,3 +36,14 @@ class AccountLoginRequest(EmailSchema, PasswordSchema):
 
 class ResetLoggedInUserPasswordRequest(PasswordSchema):
     pass
+
+
+class CurrentUser(BaseModel):
+    """当前登录用户的状态与角色快照，缓存于 Redis 与进程内缓存"""
+
+    id: int
+    email: str
+    role: RoleType
+    is_active: bool
+    is_verified: bool
+    is_deleted: bool
@@ -89,6 +89,13 @@ class AnalyticService:
             )
         return await self.analytic_crud.get_overview_statistics()
 
+    async def get_cache_metrics(self, role: RoleType) -> Dict[str, Any]:
+        if role != RoleType.admin:
+            raise HTTPException(
+                status_code=403, detail="You are not authorized to access this resource"
+            )
+        return self.analytic_crud.get_cache_metrics()
+
 
 def get_analytic_service(
     analytic_crud: AnalyticCrud = Depends(get_analytic_crud),
@@ -178,7 +178,7 @@ class AuthService:
             )
 
         # 加密密码
-        password_hash = self.security_manager.hash_password(password)
+        password_hash = await self.security_manager.hash_password_async(password)
 
         # 创建用户
         await self.auth_crud.create_user_account(
@@ -256,15 +256,19 @@ class AuthService:
             access_token_cookie = APIKeyCookie(name="access_token", auto_error=False)
             access_token = await access_token_cookie(request)
             access_token_jti = None
+            access_token_expires_at = None
 
             if access_token:
                 token_data = self.security_manager.decode_token(access_token)
                 if token_data:
                     access_token_jti = token_data.get("jti")
+                    access_token_expires_at = token_data.get("exp")
 
             # 撤销所有 refresh token 并将 access token 加入黑名单
             await self.auth_crud.account_logout(
-                user_id=user_id, access_token_jti=access_token_jti
+                user_id=user_id,
+                access_token_jti=access_token_jti,
+                access_token_expires_at=access_token_expires_at,
             )
 
             # 清理用户的cookies
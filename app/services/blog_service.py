@@ -18,12 +18,14 @@ class BlogService:
         page: int = 1,
         size: int = 20,
         published_only: bool = True,
+        cursor: Optional[str] = None,
     ) -> tuple[list[dict], dict]:
         return await self.blog_crud.get_blog_lists(
             section_id=section_id,
             page=page,
             size=size,
             published_only=published_only,
+            cursor=cursor,
         )
 
     async def create_blog(
@@ -200,7 +202,7 @@ class BlogService:
             blog_id=blog_id,
         )
 
-    async def like_blog_button(self, request: Request, blog_id: int) -> bool:
+    async def like_blog_button(self, request: Request, blog_id: int) -> Dict[str, Any]:
         ip_address = client_info_utils.get_client_ip(request)
         return await self.blog_crud.like_blog_button(
             blog_id=blog_id,
@@ -224,14 +226,17 @@ class BlogService:
             user_id=user_id, page=page, size=size
         )
 
-    async def get_recent_populor_blog(self) -> List[Dict[str, Any]]:
-        return await self.blog_crud.get_recent_populor_blog()
+    async def get_recent_populor_blog(
+        self, window: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.blog_crud.get_recent_populor_blog(window=window)
 
     async def get_blog_lists_by_tag_slug(
         self,
         tag_slug: str,
         page: int = 1,
         size: int = 20,
+        cursor: Optional[str] = None,
     ) -> tuple[list[dict], dict]:
         """根据标签slug获取博客列表
 
@@ -240,6 +245,7 @@ class BlogService:
             language: 语言设置
             page: 页码
             size: 每页数量
+            cursor: 游标，不为 None 时使用游标分页
 
         Returns:
             (items, pagination_metadata) - 博客列表和分页元数据
@@ -248,6 +254,7 @@ class BlogService:
             tag_slug=tag_slug,
             page=page,
             size=size,
+            cursor=cursor,
         )
 
     async def get_archived_blog_lists(
@@ -11,6 +11,10 @@ from .notification_task import notification_task
 from .backup_database_task import backup_database_task
 from .cleanup_unverified_users_task import cleanup_unverified_users_task
 from .cleanup_expired_tokens_task import cleanup_expired_tokens_task
+from .cache_warming_task import cache_warming_task
+from .http_cache_purge_task import http_cache_purge_task
+from .blog_stats_flush_task import blog_stats_flush_task
+from .analytics_rollup_task import analytics_rollup_task
 
 __all__ = [
     "client_info_task",
@@ -28,4 +32,8 @@ __all__ = [
     "backup_database_task",
     "cleanup_unverified_users_task",
     "cleanup_expired_tokens_task",
+    "cache_warming_task",
+    "http_cache_purge_task",
+    "blog_stats_flush_task",
+    "analytics_rollup_task",
 ]
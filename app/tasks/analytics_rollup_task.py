@@ -0,0 +1,274 @@
+"""
+分析后台汇总任务
+把博客 / 用户 / 支付 / 媒体 / 项目按创建日期聚合到 *_daily_rollup 汇总表，
+分析接口只读取汇总表，耗时不再随历史数据量增长。
+
+增量刷新：Celery beat 每隔 CELERY_ANALYTICS_ROLLUP_INTERVAL 秒执行一次，
+只重新聚合自上次水位线以来 created_at / updated_at 有变化的实体所在的日期；
+博客统计（浏览 / 点赞 / 评论 / 收藏）没有更新时间，由写路径把博客 id 记入待汇总集合。
+全量重建：每天凌晨执行一次，纠正删除等无法通过水位线发现的变化；水位线丢失时同样全量重建。
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import case
+from sqlmodel import and_, delete, func, insert, or_, select
+
+from app.core.celery import celery_app, with_db_init
+from app.core.database.mysql import mysql_manager
+from app.core.database.redis import redis_manager
+from app.core.logger import logger_manager
+from app.models.analytics_model import (
+    Blog_Daily_Rollup,
+    Media_Daily_Rollup,
+    Payment_Daily_Rollup,
+    Project_Daily_Rollup,
+    User_Daily_Rollup,
+)
+from app.models.blog_model import Blog, Blog_Stats, Blog_Status
+from app.models.media_model import Media
+from app.models.payment_model import Payment_Record
+from app.models.project_model import Project
+from app.models.user_model import User
+
+logger = logger_manager.get_logger(__name__)
+
+# 上次成功刷新时数据库的当前时间
+ROLLUP_WATERMARK_KEY = "analytics_rollup:watermark"
+# 统计有变化、需要重新汇总所在日期的博客 id
+ROLLUP_DIRTY_BLOGS_KEY = "analytics_rollup:dirty_blogs"
+# 水位线回看时间，覆盖刷新期间尚未提交的长事务
+ROLLUP_WATERMARK_LOOKBACK = timedelta(minutes=5)
+
+
+def mark_blogs_dirty_sync(blog_ids: Iterable[int]) -> None:
+    """记录统计有变化的博客，下次刷新时重新汇总其创建日期"""
+    blog_ids = list(blog_ids)
+    if blog_ids:
+        redis_manager.get_sync_client().sadd(ROLLUP_DIRTY_BLOGS_KEY, *blog_ids)
+
+
+async def mark_blog_dirty_async(blog_id: int) -> None:
+    """mark_blogs_dirty_sync 的异步版本"""
+    client = await redis_manager.get_async_client()
+    await client.sadd(ROLLUP_DIRTY_BLOGS_KEY, blog_id)
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _total(column):
+    return func.coalesce(func.sum(column), 0)
+
+
+def _day_filter(column, days: Set[date]):
+    """created_at 落在任一日期内；按范围比较以使用 created_at 索引"""
+    return or_(
+        *[
+            and_(
+                column >= datetime.combine(day, time.min),
+                column < datetime.combine(day + timedelta(days=1), time.min),
+            )
+            for day in sorted(days)
+        ]
+    )
+
+
+def _changed_days(db, statement) -> Set[date]:
+    return {row[0] for row in db.execute(statement.distinct()).all()}
+
+
+def _blog_aggregate():
+    day = func.date(Blog.created_at)
+    return (
+        select(
+            day.label("day"),
+            Blog.section_id.label("section_id"),
+            func.count(Blog.id).label("blogs"),
+            _count_if(Blog_Status.is_published == True).label("published"),
+            _count_if(Blog_Status.is_archived == True).label("archived"),
+            _count_if(Blog_Status.is_featured == True).label("featured"),
+            _total(Blog_Stats.views).label("views"),
+            _total(Blog_Stats.likes).label("likes"),
+            _total(Blog_Stats.comments).label("comments"),
+            _total(Blog_Stats.saves).label("saves"),
+        )
+        .outerjoin(Blog_Status, Blog_Status.blog_id == Blog.id)
+        .outerjoin(Blog_Stats, Blog_Stats.blog_id == Blog.id)
+        .group_by(day, Blog.section_id)
+    )
+
+
+def _user_aggregate():
+    day = func.date(User.created_at)
+    return select(
+        day.label("day"),
+        func.count(User.id).label("users"),
+        _count_if(and_(User.is_active == True, User.is_deleted == False)).label(
+            "active_users"
+        ),
+    ).group_by(day)
+
+
+def _payment_aggregate():
+    day = func.date(Payment_Record.created_at)
+    return select(
+        day.label("day"),
+        Payment_Record.payment_type.label("payment_type"),
+        Payment_Record.payment_status.label("payment_status"),
+        func.count(Payment_Record.id).label("payments"),
+        _total(Payment_Record.amount).label("amount"),
+        _total(Payment_Record.tax_amount).label("tax_amount"),
+    ).group_by(day, Payment_Record.payment_type, Payment_Record.payment_status)
+
+
+def _media_aggregate():
+    day = func.date(Media.created_at)
+    return select(
+        day.label("day"),
+        func.count(Media.id).label("media"),
+        _count_if(Media.is_avatar == True).label("avatars"),
+    ).group_by(day)
+
+
+def _project_aggregate():
+    day = func.date(Project.created_at)
+    return select(
+        day.label("day"),
+        Project.section_id.label("section_id"),
+        Project.type.label("type"),
+        func.count(Project.id).label("projects"),
+        _count_if(Project.is_published == True).label("published"),
+    ).group_by(day, Project.section_id, Project.type)
+
+
+def _get_changed_days(db, since: datetime, blog_ids: List[int]) -> Dict[str, Set[date]]:
+    """自 since 以来有新增或更新的实体所在的创建日期"""
+    blog_conditions = [
+        Blog.created_at >= since,
+        Blog.updated_at >= since,
+        Blog_Status.updated_at >= since,
+    ]
+    if blog_ids:
+        blog_conditions.append(Blog.id.in_(blog_ids))
+    return {
+        "blogs": _changed_days(
+            db,
+            select(func.date(Blog.created_at))
+            .outerjoin(Blog_Status, Blog_Status.blog_id == Blog.id)
+            .where(or_(*blog_conditions)),
+        ),
+        "users": _changed_days(
+            db,
+            select(func.date(User.created_at)).where(
+                or_(User.created_at >= since, User.updated_at >= since)
+            ),
+        ),
+        # 支付记录与媒体文件创建后不再修改
+        "payments": _changed_days(
+            db,
+            select(func.date(Payment_Record.created_at)).where(
+                Payment_Record.created_at >= since
+            ),
+        ),
+        "media": _changed_days(
+            db, select(func.date(Media.created_at)).where(Media.created_at >= since)
+        ),
+        "projects": _changed_days(
+            db,
+            select(func.date(Project.created_at)).where(
+                or_(Project.created_at >= since, Project.updated_at >= since)
+            ),
+        ),
+    }
+
+
+# 实体 -> (汇总表, 分桶所用的创建时间列, 聚合查询)
+ROLLUPS = {
+    "blogs": (Blog_Daily_Rollup, Blog.created_at, _blog_aggregate),
+    "users": (User_Daily_Rollup, User.created_at, _user_aggregate),
+    "payments": (Payment_Daily_Rollup, Payment_Record.created_at, _payment_aggregate),
+    "media": (Media_Daily_Rollup, Media.created_at, _media_aggregate),
+    "projects": (Project_Daily_Rollup, Project.created_at, _project_aggregate),
+}
+
+
+def _refresh_rollup(db, entity: str, days: Optional[Set[date]]) -> int:
+    """重新聚合指定日期（None 表示全部日期）的汇总行，返回写入的行数"""
+    model, created_at, aggregate = ROLLUPS[entity]
+    statement = aggregate()
+    delete_statement = delete(model)
+    if days is not None:
+        if not days:
+            return 0
+        statement = statement.where(_day_filter(created_at, days))
+        delete_statement = delete_statement.where(model.day.in_(days))
+
+    rows = [dict(row) for row in db.execute(statement).mappings().all()]
+    db.execute(delete_statement)
+    if rows:
+        db.execute(insert(model), rows)
+    return len(rows)
+
+
+def refresh_analytics_rollups(full: bool = False) -> Dict[str, int]:
+    """刷新汇总表，返回每个实体写入的汇总行数
+
+    所有汇总表在同一事务中替换，分析接口不会读到只刷新了一半的数据。
+    """
+    client = redis_manager.get_sync_client()
+    watermark = None if full else client.get(ROLLUP_WATERMARK_KEY)
+    blog_ids = [int(blog_id) for blog_id in client.smembers(ROLLUP_DIRTY_BLOGS_KEY)]
+
+    db = mysql_manager.get_sync_db()
+    try:
+        started_at = db.execute(select(func.now())).scalar_one()
+        if watermark is None:
+            changed_days = {entity: None for entity in ROLLUPS}
+        else:
+            since = datetime.fromisoformat(watermark) - ROLLUP_WATERMARK_LOOKBACK
+            changed_days = _get_changed_days(db, since, blog_ids)
+
+        refreshed = {
+            entity: _refresh_rollup(db, entity, days)
+            for entity, days in changed_days.items()
+        }
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    # 刷新期间新记入的博客保留在集合中，等待下一次刷新
+    with redis_manager.pipeline_sync() as pipe:
+        pipe.set(ROLLUP_WATERMARK_KEY, started_at.isoformat())
+        if blog_ids:
+            pipe.srem(ROLLUP_DIRTY_BLOGS_KEY, *blog_ids)
+
+    logger.info(
+        f"Refreshed analytics rollups ({'full' if watermark is None else 'incremental'}): {refreshed}"
+    )
+    return refreshed
+
+
+@celery_app.task(
+    name="analytics_rollup_task",
+    bind=True,
+    max_retries=0,
+    time_limit=900,  # 15 分钟超时（全量重建）
+    soft_time_limit=840,
+)
+@with_db_init
+def analytics_rollup_task(self, full: bool = False) -> dict:
+    """
+    刷新分析后台的每日汇总表
+    失败时水位线不变，由下一次定时任务重新刷新同一范围，因此不再单独重试
+    """
+    try:
+        return {"success": True, "rows": refresh_analytics_rollups(full)}
+    except Exception as e:
+        logger.error(f"Analytics rollup task failed: {e}")
+        return {"success": False, "error": str(e)}
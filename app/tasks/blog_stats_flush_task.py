@@ -0,0 +1,153 @@
+"""
+博客统计落库任务
+浏览 / 点赞 / 收藏的增量先累加在 Redis 中（blog_stats_counter），
+由 Celery beat 每隔 REDIS_COUNTER_FLUSH_INTERVAL 秒用一条 UPDATE 批量写入 Blog_Stats
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from redis.exceptions import LockError
+from sqlalchemy import case
+from sqlmodel import delete, insert, select, update
+
+from app.core.celery import celery_app, with_db_init
+from app.core.database.counters import blog_stats_counter, blog_stats_projection
+from app.core.database.mysql import mysql_manager
+from app.core.database.redis import redis_manager
+from app.core.database.trending import blog_leaderboard
+from app.core.logger import logger_manager
+from app.models.blog_model import Blog_Stats, Blog_Stats_Flush_Batch
+from app.tasks.analytics_rollup_task import mark_blogs_dirty_sync
+
+logger = logger_manager.get_logger(__name__)
+
+
+# 同一时间只允许一个落库任务取出并提交处理中的增量，租约与任务的 time_limit 一致
+FLUSH_LOCK_KEY = "lock:blog_stats_flush"
+FLUSH_LOCK_TIMEOUT = 120
+# 已落库批次号的保留时间，远大于一批增量从取出到确认的最长间隔
+FLUSH_BATCH_RETENTION = timedelta(days=7)
+
+
+def flush_blog_stats() -> int:
+    """把待落库增量写入 Blog_Stats，返回更新的博客数
+
+    所有博客的所有字段合并为一条语句：
+    UPDATE blog_stats SET views = views + CASE blog_id WHEN ... END, ...
+    WHERE blog_id IN (...)
+    增量先以一个批次移入处理中的 hash，提交后才删除；写入失败或任务在提交前被终止时，
+    增量留在处理中，由下一次落库以同一批次号重试。
+    批次号与 UPDATE 在同一事务中写入 Blog_Stats_Flush_Batch，提交后确认前被终止
+    （time_limit、OOM、发布）或确认失败时，下一次落库发现批次已写入，只确认不再累加。
+    """
+    lock = redis_manager.get_sync_client().lock(
+        FLUSH_LOCK_KEY, timeout=FLUSH_LOCK_TIMEOUT, blocking=False
+    )
+    if not lock.acquire():
+        logger.info("Another blog stats flush is running, skipping")
+        return 0
+    try:
+        return _flush_claimed_stats()
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            # 租约已过期，锁可能已被下一次落库获取
+            logger.warning("Blog stats flush lock expired before release")
+
+
+def _flush_claimed_stats() -> int:
+    batch_id, drained = blog_stats_counter.claim_sync()
+    if not drained:
+        return 0
+
+    values = {}
+    for field in blog_stats_counter.fields:
+        field_deltas = {
+            blog_id: deltas[field]
+            for blog_id, deltas in drained.items()
+            if field in deltas
+        }
+        if field_deltas:
+            column = getattr(Blog_Stats, field)
+            values[field] = column + case(
+                field_deltas, value=Blog_Stats.blog_id, else_=0
+            )
+
+    db = mysql_manager.get_sync_db()
+    try:
+        applied = db.execute(
+            select(Blog_Stats_Flush_Batch.batch_id).where(
+                Blog_Stats_Flush_Batch.batch_id == batch_id
+            )
+        ).scalar_one_or_none()
+        if applied is None:
+            db.execute(
+                update(Blog_Stats)
+                .where(Blog_Stats.blog_id.in_(list(drained)))
+                .values(**values)
+            )
+            db.execute(insert(Blog_Stats_Flush_Batch).values(batch_id=batch_id))
+            db.execute(
+                delete(Blog_Stats_Flush_Batch).where(
+                    Blog_Stats_Flush_Batch.applied_at
+                    < datetime.now(timezone.utc) - FLUSH_BATCH_RETENTION
+                )
+            )
+            db.commit()
+        else:
+            logger.warning(
+                f"Blog stats batch {batch_id} was already flushed, acknowledging only"
+            )
+    except Exception:
+        db.rollback()
+        db.close()
+        raise
+
+    blog_stats_counter.ack_sync()
+    # 提交并删除处理中的增量后，删除已落库博客的统计投影，下次读取时从数据库重新加载，
+    # 纠正落库期间回填的投影可能漏掉或重复的增量
+    blog_stats_projection.delete_sync(drained)
+    # 分析后台汇总表下次刷新时重新汇总这些博客的统计
+    mark_blogs_dirty_sync(drained)
+
+    # 用落库后的累计值更新分析后台的累计排行
+    try:
+        rows = db.execute(
+            select(
+                Blog_Stats.blog_id, Blog_Stats.views, Blog_Stats.likes, Blog_Stats.saves
+            ).where(Blog_Stats.blog_id.in_(list(drained)))
+        ).all()
+        blog_leaderboard.set_sync(
+            {
+                row[0]: {"views": row[1], "likes": row[2], "saves": row[3]}
+                for row in rows
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update blog leaderboard after flush: {e}")
+    finally:
+        db.close()
+
+    logger.info(f"Flushed pending stats for {len(drained)} blogs")
+    return len(drained)
+
+
+@celery_app.task(
+    name="blog_stats_flush_task",
+    bind=True,
+    max_retries=0,
+    time_limit=FLUSH_LOCK_TIMEOUT,
+    soft_time_limit=100,
+)
+@with_db_init
+def blog_stats_flush_task(self) -> dict:
+    """
+    批量写入 Redis 中累加的博客浏览 / 点赞 / 收藏增量
+    失败时增量仍保留在 Redis 的处理中 hash，由下一次定时任务重试，因此不再单独重试
+    """
+    try:
+        return {"success": True, "flushed_blogs": flush_blog_stats()}
+    except Exception as e:
+        logger.error(f"Blog stats flush task failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,218 @@
+"""
+缓存预热任务
+部署启动、博客发布/取消发布后，预先构建访问最多的缓存键，避免首批访客集中回源
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.celery import celery_app, with_db_init
+from app.core.config.settings import settings
+from app.core.database.mysql import mysql_manager
+from app.core.database.redis import redis_manager
+from app.core.i18n.i18n import Language, set_request_language
+from app.core.logger import logger_manager
+from app.models.blog_model import Blog, Blog_Status
+
+logger = logger_manager.get_logger(__name__)
+
+# 预热任务去抖标记：窗口期内重复触发只会排队一次
+WARMING_SCHEDULED_KEY = "cache_warming_scheduled"
+
+
+async def _get_published_section_ids(db: AsyncSession) -> List[int]:
+    result = await db.execute(
+        select(Blog.section_id)
+        .join(Blog_Status, Blog_Status.blog_id == Blog.id)
+        .where(Blog_Status.is_published == True)
+        .distinct()
+    )
+    return list(result.scalars().all())
+
+
+async def _get_recent_published_blogs(db: AsyncSession, limit: int) -> List[Any]:
+    result = await db.execute(
+        select(Blog.id, Blog.slug)
+        .join(Blog_Status, Blog_Status.blog_id == Blog.id)
+        .where(Blog_Status.is_published == True)
+        .order_by(Blog.created_at.desc())
+        .limit(limit)
+    )
+    return list(result.all())
+
+
+async def warm_cache(
+    pages: Optional[int] = None,
+    recent_blogs: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, int]:
+    """预热热点缓存，已存在的缓存键不会重建
+
+    每个预热项使用独立的数据库会话，并发数受 concurrency 限制以保护 MySQL。
+
+    Args:
+        pages: 每个栏目每种语言预热的列表页数
+        recent_blogs: 预热详情 / SEO / 导航的最近发布博客数量
+        concurrency: 同时访问数据库的预热项数量上限
+
+    Returns:
+        dict: 成功与失败的预热项数量
+    """
+    from app.crud.blog_crud import BlogCrud
+    from app.crud.section_crud import SectionCrud
+
+    config = settings.redis
+    pages = pages or config.REDIS_WARMING_PAGES
+    recent_blogs = recent_blogs or config.REDIS_WARMING_RECENT_BLOGS
+    semaphore = asyncio.Semaphore(concurrency or config.REDIS_WARMING_CONCURRENCY)
+    stats = {"warmed": 0, "failed": 0}
+
+    async def run(
+        name: str,
+        language: Optional[Language],
+        func: Callable[[AsyncSession], Awaitable[Any]],
+    ) -> None:
+        async with semaphore:
+            # 每个预热项运行在独立的 Task 中，语言上下文互不影响
+            if language is not None:
+                set_request_language(language)
+            try:
+                await mysql_manager.run_in_session(func)
+                stats["warmed"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                logger.warning(f"Cache warming failed for {name}: {e}")
+
+    section_ids = await mysql_manager.run_in_session(_get_published_section_ids)
+    blogs = await mysql_manager.run_in_session(
+        lambda db: _get_recent_published_blogs(db, recent_blogs)
+    )
+    size = config.REDIS_WARMING_PAGE_SIZE
+
+    jobs = []
+    for language in Language:
+        jobs.append(
+            run(
+                "section_lists_tree",
+                language,
+                lambda db: SectionCrud(db).get_section_lists(),
+            )
+        )
+        jobs.append(
+            run(
+                "get_recent_populor_blog",
+                language,
+                lambda db: BlogCrud(db).get_recent_populor_blog(),
+            )
+        )
+        jobs.append(
+            run(
+                "blog_archived_lists",
+                language,
+                lambda db: BlogCrud(db).get_archived_blog_lists(limit=size),
+            )
+        )
+        for section_id in section_ids:
+            for page in range(1, pages + 1):
+                jobs.append(
+                    run(
+                        f"blog_lists:{section_id}:page={page}",
+                        language,
+                        lambda db, section_id=section_id, page=page: BlogCrud(
+                            db
+                        ).get_blog_lists(section_id=section_id, page=page, size=size),
+                    )
+                )
+        for blog_id, blog_slug in blogs:
+            jobs.append(
+                run(
+                    f"blog_details:{blog_slug}",
+                    language,
+                    lambda db, blog_slug=blog_slug: BlogCrud(db).warm_blog_details(
+                        blog_slug
+                    ),
+                )
+            )
+            jobs.append(
+                run(
+                    f"blog_navigation:{blog_id}",
+                    language,
+                    lambda db, blog_id=blog_id: BlogCrud(db).get_blog_navigation(
+                        blog_id
+                    ),
+                )
+            )
+
+    # SEO 缓存与语言无关
+    for _, blog_slug in blogs:
+        jobs.append(
+            run(
+                f"blog_details_seo:{blog_slug}",
+                None,
+                lambda db, blog_slug=blog_slug: BlogCrud(db).get_blog_details_seo(
+                    blog_slug
+                ),
+            )
+        )
+
+    await asyncio.gather(*jobs)
+    # 等待预热过程中触发的 stale-while-revalidate 后台刷新完成
+    if redis_manager.refresh_tasks:
+        await asyncio.gather(*redis_manager.refresh_tasks, return_exceptions=True)
+
+    logger.info(
+        f"Cache warming finished: {stats['warmed']} warmed, {stats['failed']} failed"
+    )
+    return stats
+
+
+async def schedule_cache_warming(reason: str) -> bool:
+    """延迟 REDIS_WARMING_DEBOUNCE 秒排队预热任务，窗口期内的重复触发会被合并"""
+    countdown = settings.redis.REDIS_WARMING_DEBOUNCE
+    try:
+        client = await redis_manager.get_async_client()
+        scheduled = await client.set(
+            WARMING_SCHEDULED_KEY, reason, nx=True, ex=countdown
+        )
+        if not scheduled:
+            return False
+        cache_warming_task.apply_async(countdown=countdown)
+        logger.info(f"Cache warming scheduled in {countdown}s ({reason})")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to schedule cache warming ({reason}): {e}")
+        return False
+
+
+@celery_app.task(
+    name="cache_warming_task",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=60,
+    time_limit=900,  # 15 分钟超时
+    soft_time_limit=840,  # 14 分钟软超时
+)
+@with_db_init
+def cache_warming_task(
+    self, pages: Optional[int] = None, recent_blogs: Optional[int] = None
+) -> dict:
+    """
+    预热热点缓存：栏目树、各栏目前几页博客列表、热门博客、归档列表，
+    以及最近发布博客的详情 / SEO / 导航
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(
+            warm_cache(pages=pages, recent_blogs=recent_blogs)
+        )
+    except Exception as e:
+        logger.error(f"Cache warming task failed: {e}")
+        raise self.retry(exc=e)
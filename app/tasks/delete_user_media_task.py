@@ -7,6 +7,7 @@ from app.models.user_model import User
 from app.models.media_model import Media
 from app.core.logger import logger_manager
 from app.core.database.mysql import mysql_manager
+from app.core.database.redis import redis_manager
 from app.core.celery import celery_app, with_db_init
 from app.utils.s3_bucket import create_s3_bucket
 
@@ -163,6 +164,8 @@ def delete_user_media_task(self, user_id: int) -> None:
                     logger.info(
                         f"用户 {user_id} 已从数据库删除，影响行数: {deleted_rows.rowcount}"
                     )
+                # 删除期间请求可能重新缓存了用户快照
+                redis_manager.delete_sync(f"user_principal:{user_id}")
             except Exception as db_error:
                 logger.error(f"删除用户 {user_id} 失败: {db_error}")
                 raise self.retry(exc=db_error, countdown=60)
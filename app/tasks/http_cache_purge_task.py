@@ -0,0 +1,70 @@
+"""
+nginx 代理缓存刷新任务
+缓存失效时找出依赖这些缓存键的公开 URL，请求 nginx 内部监听端口强制回源，
+用最新响应覆盖代理缓存中的旧条目
+"""
+
+from typing import Dict, List
+
+import httpx
+
+from app.core.celery import celery_app
+from app.core.config.settings import settings
+from app.core.database.redis import redis_manager
+from app.core.logger import logger_manager
+from app.utils.http_cache import get_purge_sets
+
+logger = logger_manager.get_logger(__name__)
+
+
+def purge_http_cache(keys: List[str], prefixes: List[str]) -> Dict[str, int]:
+    """刷新依赖这些缓存键 / 前缀的 nginx 缓存条目
+
+    索引集合会先被删除：刷新请求经过 conditional_response 时会重新登记，
+    刷新失败的条目最多在 max-age 之后过期。
+    """
+    config = settings.http_cache
+    names = sorted(get_purge_sets(keys, prefixes))
+    with redis_manager.pipeline_sync() as pipe:
+        pipe.sunion(names)
+        pipe.delete(*names)
+        members, _ = pipe.execute()
+
+    stats = {"refreshed": 0, "failed": 0}
+    if not members:
+        return stats
+
+    with httpx.Client(
+        base_url=config.HTTP_CACHE_PURGE_URL, timeout=config.HTTP_CACHE_PURGE_TIMEOUT
+    ) as http:
+        for member in sorted(members):
+            language, _, url = member.partition(" ")
+            try:
+                http.get(url, headers={"X-Language": language}).raise_for_status()
+                stats["refreshed"] += 1
+            except httpx.HTTPError as e:
+                stats["failed"] += 1
+                logger.warning(f"Failed to refresh proxy cache for {url}: {e}")
+
+    logger.info(
+        f"Proxy cache purge finished: {stats['refreshed']} refreshed, "
+        f"{stats['failed']} failed"
+    )
+    return stats
+
+
+@celery_app.task(
+    name="http_cache_purge_task",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=10,
+    time_limit=300,
+    soft_time_limit=270,
+)
+def http_cache_purge_task(self, keys: List[str], prefixes: List[str]) -> dict:
+    """失效的缓存键 / 前缀对应的 nginx 代理缓存刷新"""
+    try:
+        return purge_http_cache(keys, prefixes)
+    except Exception as e:
+        logger.error(f"Proxy cache purge task failed: {e}")
+        raise self.retry(exc=e)
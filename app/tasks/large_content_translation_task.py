@@ -107,9 +107,13 @@ def large_content_translation_task(
                 session.commit()
 
                 # 更新缓存
-                redis_manager.delete_pattern_sync(f"blog_details:{blog.slug}:*")
-                redis_manager.delete_pattern_sync(f"blog_tts:{content_id}")
-                redis_manager.delete_pattern_sync(f"blog_summary:{content_id}:*")
+                redis_manager.invalidate_sync(
+                    patterns=[
+                        f"blog_details:{blog.slug}:*",
+                        f"blog_tts:{content_id}",
+                        f"blog_summary:{content_id}:*",
+                    ]
+                )
                 logger.info(
                     f"Successfully translated blog content for blog ID: {content_id}"
                 )
@@ -132,9 +136,13 @@ def large_content_translation_task(
                 session.commit()
 
                 # 更新缓存
-                redis_manager.delete_pattern_sync(f"project_details:{project.slug}:*")
-                redis_manager.delete_pattern_sync(f"project_tts:{content_id}")
-                redis_manager.delete_pattern_sync(f"project_summary:{content_id}:*")
+                redis_manager.invalidate_sync(
+                    patterns=[
+                        f"project_details:{project.slug}:*",
+                        f"project_tts:{content_id}",
+                        f"project_summary:{content_id}:*",
+                    ]
+                )
 
                 logger.info(
                     f"Successfully translated project content for project ID: {content_id}"
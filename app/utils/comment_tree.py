@@ -0,0 +1,26 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def build_comment_tree(comments: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """把扁平的评论字典组装为评论树，O(n)
+
+    每条评论需包含 comment_id 与 parent_id。第一遍按 comment_id 建立索引，
+    第二遍把每条评论挂到父评论的 children 下，子评论保持输入顺序；
+    parent_id 为空的评论作为根评论返回，父评论不在输入中的评论被丢弃。
+    只有存在子评论时才会写入 children 字段。
+    """
+    nodes: Dict[int, Dict[str, Any]] = {}
+    for comment in comments:
+        # 同一评论重复出现时（例如 JOIN 产生的重复行）保留第一条
+        nodes.setdefault(comment["comment_id"], comment)
+
+    roots: List[Dict[str, Any]] = []
+    for comment in nodes.values():
+        parent_id: Optional[int] = comment["parent_id"]
+        if parent_id is None:
+            roots.append(comment)
+            continue
+        parent = nodes.get(parent_id)
+        if parent is not None:
+            parent.setdefault("children", []).append(comment)
+    return roots
@@ -0,0 +1,142 @@
+import hashlib
+from typing import Iterable, List, Optional, Set
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.config.settings import settings
+from app.core.database.redis import redis_manager
+from app.core.i18n.i18n import get_current_language
+from app.core.logger import logger_manager
+from app.schemas.common import SuccessResponse
+
+logger = logger_manager.get_logger(__name__)
+
+# 响应体随语言变化，共享缓存需按语言区分
+VARY_HEADERS = "Accept-Language, X-Language"
+
+# 代理缓存的 surrogate key 索引：
+#   surrogate_key:{key}    - 直接声明了该 key 的 URL
+#   surrogate_tag:{prefix} - 声明的 key 以 prefix: 开头的 URL（供按前缀失效使用）
+# 成员格式为 "{语言} {path?query}"，刷新时带上同样的语言头
+SURROGATE_KEY_PREFIX = "surrogate_key:"
+SURROGATE_TAG_PREFIX = "surrogate_tag:"
+
+
+def compute_etag(body: bytes) -> str:
+    """根据最终响应体计算强 ETag"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 按弱比较匹配（忽略 W/ 前缀），支持多个值与 *"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        candidate = candidate.removeprefix("W/")
+        if candidate == etag:
+            return True
+    return False
+
+
+def build_cache_control(private: bool = False) -> str:
+    config = settings.http_cache
+    if private:
+        # 与用户相关的响应只允许浏览器缓存，且每次使用前都需要重新验证
+        return "private, no-cache"
+    return (
+        f"public, max-age={config.HTTP_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={config.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+
+def get_surrogate_tags(key: str) -> List[str]:
+    """key 在每个 ':' 边界处的前缀，例如 blog_lists:3 -> [blog_lists]"""
+    parts = key.split(":")
+    return [":".join(parts[:index]) for index in range(1, len(parts))]
+
+
+def get_purge_sets(keys: Iterable[str], prefixes: Iterable[str]) -> Set[str]:
+    """缓存失效对应需要刷新的 surrogate 索引集合
+
+    - 按前缀失效：声明了该 key 或其子 key 的 URL
+    - 精确删除的缓存键（例如 blog_summary:1:lang=zh）：还包括声明了它某个前缀的 URL
+    """
+    sets = set()
+    for prefix in prefixes:
+        sets.add(f"{SURROGATE_KEY_PREFIX}{prefix}")
+        sets.add(f"{SURROGATE_TAG_PREFIX}{prefix}")
+    for key in keys:
+        sets.add(f"{SURROGATE_KEY_PREFIX}{key}")
+        sets.add(f"{SURROGATE_TAG_PREFIX}{key}")
+        sets.update(f"{SURROGATE_KEY_PREFIX}{tag}" for tag in get_surrogate_tags(key))
+    return sets
+
+
+async def record_surrogate_keys(request: Request, surrogate_keys: List[str]) -> None:
+    """记录响应 URL 与 surrogate key 的对应关系，失效时据此刷新 nginx 缓存"""
+    member = f"{get_current_language().value} {request.url.path}"
+    if request.url.query:
+        member = f"{member}?{request.url.query}"
+    ttl = settings.http_cache.HTTP_CACHE_SURROGATE_TTL
+    try:
+        async with redis_manager.pipeline_async() as pipe:
+            for key in surrogate_keys:
+                names = [f"{SURROGATE_KEY_PREFIX}{key}"]
+                names.extend(
+                    f"{SURROGATE_TAG_PREFIX}{tag}" for tag in get_surrogate_tags(key)
+                )
+                for name in names:
+                    pipe.sadd(name, member)
+                    pipe.expire(name, ttl)
+    except Exception as e:
+        logger.warning(f"Failed to record surrogate keys {surrogate_keys}: {e}")
+
+
+async def conditional_response(
+    request: Request,
+    content: SuccessResponse,
+    response: Optional[Response] = None,
+    private: bool = False,
+    surrogate_keys: Optional[List[str]] = None,
+) -> Response:
+    """返回带 ETag / Cache-Control 的 JSON 响应，If-None-Match 命中时返回 304
+
+    Args:
+        request: 当前请求
+        content: 路由原本要返回的响应模型
+        response: 路由注入的 Response（例如已设置分页响应头），其响应头会被保留
+        private: 响应是否与用户相关（例如携带 user_id 或编辑模式）
+        surrogate_keys: 响应依赖的缓存键前缀，公开响应会输出 Surrogate-Key 响应头，
+            并在这些键失效时刷新 nginx 代理缓存
+    """
+    json_response = JSONResponse(content=jsonable_encoder(content))
+    headers = {}
+    if response is not None:
+        headers.update(
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-length", "content-type")
+        )
+
+    if settings.http_cache.HTTP_CACHE_ENABLED:
+        etag = compute_etag(json_response.body)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = build_cache_control(private)
+        headers["Vary"] = VARY_HEADERS
+        if (
+            surrogate_keys
+            and not private
+            and settings.http_cache.HTTP_CACHE_SURROGATE_KEYS
+        ):
+            headers["Surrogate-Key"] = " ".join(surrogate_keys)
+            await record_surrogate_keys(request, surrogate_keys)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers=headers)
+
+    json_response.headers.update(headers)
+    return json_response
@@ -43,6 +43,22 @@ class KeysetPaginator:
         except (ValueError, AttributeError, UnicodeDecodeError):
             return None, None
 
+    def normalize_cursor(self, cursor: Optional[str]) -> str:
+        """
+        Return the canonical encoding of a cursor, suitable for cache keys.
+
+        Args:
+            cursor: Base64 encoded cursor string supplied by the client
+
+        Returns:
+            Re-encoded cursor string, or "" if the cursor is empty or invalid
+            (apply_filters treats both as the first page)
+        """
+        created_at, row_id = self.decode_cursor(cursor)
+        if created_at is None or row_id is None:
+            return ""
+        return self.encode_cursor(created_at, row_id)
+
     def encode_cursor(self, created_at: datetime, row_id: int) -> str:
         """
         Encode (created_at, id) tuple to base64 cursor string.
@@ -147,6 +163,46 @@ class KeysetPaginator:
 
         return response
 
+    async def get_paginated_result(
+        self,
+        db: Any,
+        base_stmt: Any,
+        created_at_col: Any,
+        id_col: Any,
+        cursor: Optional[str],
+        limit: int,
+    ) -> Tuple[List[Any], bool, Optional[str]]:
+        """
+        Fetch one keyset page; the cost depends only on the page size.
+
+        Args:
+            db: Database session
+            base_stmt: SELECT statement of a single entity
+            created_at_col: Column reference for created_at
+            id_col: Column reference for id
+            cursor: Base64 encoded cursor string (None or invalid for the first page)
+            limit: Maximum number of items per page
+
+        Returns:
+            Tuple of (items, has_next, next_cursor)
+        """
+        stmt = self.apply_filters(base_stmt, created_at_col, id_col, cursor)
+        # 多取一条用于判断是否有下一页
+        stmt = stmt.order_by(*self.order_by(created_at_col, id_col)).limit(limit + 1)
+        result = await db.execute(stmt)
+        items = list(result.scalars().all())
+
+        has_next = len(items) > limit
+        if has_next:
+            items = items[:limit]
+        next_cursor = None
+        if has_next and items:
+            last = items[-1]
+            next_cursor = self.encode_cursor(
+                getattr(last, created_at_col.key), getattr(last, id_col.key)
+            )
+        return items, has_next, next_cursor
+
     # Convenience methods for backward compatibility
     def decode(self, cursor: Optional[str]) -> Tuple[Optional[datetime], Optional[int]]:
         """Alias for decode_cursor for backward compatibility."""
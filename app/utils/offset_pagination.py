@@ -198,11 +198,12 @@ class OffsetPaginator:
         self,
         db: AsyncSession,
         base_stmt: Any,
-        count_stmt: Any,
+        count_stmt: Any = None,
         page: int = 1,
         size: int = 20,
         order_by: Optional[List[Any]] = None,
         language: Language = Language.EN_US,
+        total_count: Optional[int] = None,
     ) -> Tuple[List[Any], Dict[str, Any]]:
         """
         Get paginated result for complex JOIN queries.
@@ -214,6 +215,7 @@ class OffsetPaginator:
             page: Page number (1-based)
             size: Page size
             order_by: List of ordering expressions
+            total_count: Known total count (e.g. a maintained counter); skips count_stmt
 
         Returns:
             Tuple of (items, pagination_metadata)
@@ -222,8 +224,9 @@ class OffsetPaginator:
         page, size = self.validate_pagination_params(page, size)
 
         # Get total count
-        count_result = await db.execute(count_stmt)
-        total_count = count_result.scalar()
+        if total_count is None:
+            count_result = await db.execute(count_stmt)
+            total_count = count_result.scalar()
 
         if total_count == 0:
             raise HTTPException(
@@ -10,3 +10,14 @@ def set_pagination_headers(response: Response, pagination_metadata: Dict[str, An
     response.headers["X-Page-Size"] = str(pagination_metadata["page_size"])
     response.headers["X-Has-Next"] = str(pagination_metadata["has_next"]).lower()
     response.headers["X-Has-Prev"] = str(pagination_metadata["has_prev"]).lower()
+
+
+def set_keyset_pagination_headers(
+    response: Response, pagination_metadata: Dict[str, Any]
+):
+    """设置游标分页响应头"""
+    response.headers["X-Total-Count"] = str(pagination_metadata["total_count"])
+    response.headers["X-Page-Size"] = str(pagination_metadata["limit"])
+    response.headers["X-Has-Next"] = str(pagination_metadata["has_next"]).lower()
+    if pagination_metadata.get("next_cursor"):
+        response.headers["X-Next-Cursor"] = pagination_metadata["next_cursor"]
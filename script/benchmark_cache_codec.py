@@ -0,0 +1,136 @@
+"""缓存值编解码基准测试
+
+用与 blog_details 缓存结构一致的富文本数据，比较原始 JSON 与各压缩级别下的
+Redis 存储字节数、编码与解码耗时。无需连接 Redis / MySQL：
+
+    python -m script.benchmark_cache_codec
+"""
+
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+from app.core.database.codec import CacheValueCodec
+
+CHINESE_SENTENCES = [
+    "在本文中我们会一步步搭建一个基于 FastAPI 的博客后端。",
+    "缓存的失效策略往往比缓存本身更难设计。",
+    "异步数据库驱动可以显著提升高并发场景下的吞吐量。",
+    "我们使用 Celery 处理翻译、摘要和语音合成等耗时任务。",
+    "记录生活与思考的点滴，捕捉日常中的灵感与瞬间。",
+]
+
+ENGLISH_SENTENCES = [
+    "In this post we build a FastAPI blog backend step by step.",
+    "Cache invalidation is usually harder to design than the cache itself.",
+    "Async database drivers noticeably improve throughput under load.",
+    "Celery handles slow jobs such as translation, summaries and TTS.",
+    "Notes on coding, ideas, and problem-solving in daily development.",
+]
+
+
+def build_rich_text(sentences: List[str], paragraphs: int) -> Dict[str, Any]:
+    """生成与编辑器输出结构一致的富文本 JSON"""
+    content: List[Dict[str, Any]] = []
+    for index in range(paragraphs):
+        if index % 8 == 0:
+            content.append(
+                {
+                    "type": "heading",
+                    "attrs": {"level": 2},
+                    "content": [{"type": "text", "text": random.choice(sentences)}],
+                }
+            )
+        if index % 5 == 0:
+            content.append(
+                {
+                    "type": "codeBlock",
+                    "attrs": {"language": "python"},
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "async def get_async(self, key: str):\n"
+                            "    return await client.get(key)\n",
+                        }
+                    ],
+                }
+            )
+        content.append(
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "marks": [{"type": "bold"}] if index % 3 == 0 else [],
+                        "text": " ".join(random.choices(sentences, k=4)),
+                    }
+                ],
+            }
+        )
+    return {"type": "doc", "content": content}
+
+
+def build_blog_details(sentences: List[str], paragraphs: int) -> Dict[str, Any]:
+    return {
+        "blog_id": 1,
+        "blog_name": sentences[0],
+        "blog_description": sentences[1],
+        "cover_url": "https://cdn.example.com/blog/cover/1-watermark.webp",
+        "blog_content": build_rich_text(sentences, paragraphs),
+        "is_saved": False,
+        "blog_tags": [
+            {"tag_id": i, "tag_slug": f"tag-{i}", "tag_title": sentences[i]}
+            for i in range(3)
+        ],
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "updated_at": None,
+    }
+
+
+def measure(codec: CacheValueCodec, value: str, rounds: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encoded = codec.encode(value)
+    encode_us = (time.perf_counter() - start) / rounds * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        json.loads(codec.decode(encoded))
+    decode_us = (time.perf_counter() - start) / rounds * 1e6
+
+    return {
+        "bytes": len(encoded.encode("utf-8")),
+        "encode_us": encode_us,
+        "decode_us": decode_us,
+    }
+
+
+def main() -> None:
+    random.seed(42)
+    rounds = 200
+    codecs = {"json": CacheValueCodec(codec="none", threshold=0)}
+    for level in (1, 6, 9):
+        codecs[f"zlib-{level}"] = CacheValueCodec(
+            codec="zlib", threshold=0, level=level
+        )
+
+    print(
+        f"{'payload':<18}{'codec':<10}{'bytes':>10}{'ratio':>8}"
+        f"{'encode µs':>12}{'decode µs':>12}"
+    )
+    for language, sentences in (("zh", CHINESE_SENTENCES), ("en", ENGLISH_SENTENCES)):
+        for paragraphs in (10, 60, 300):
+            value = json.dumps(build_blog_details(sentences, paragraphs))
+            baseline = len(value.encode("utf-8"))
+            for name, codec in codecs.items():
+                result = measure(codec, value, rounds)
+                print(
+                    f"{f'{language}/{paragraphs}p':<18}{name:<10}"
+                    f"{result['bytes']:>10}{result['bytes'] / baseline:>8.2f}"
+                    f"{result['encode_us']:>12.1f}{result['decode_us']:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""评论树组装基准测试
+
+用与 get_blog_comment_lists 查询结果一致的扁平评论（父评论 / 子评论 / 孙评论三级嵌套），
+比较原先逐层递归扫描整个列表的 O(n²) 组装与 build_comment_tree 的 O(n) 组装耗时。
+无需连接 Redis / MySQL：
+
+    python -m script.benchmark_comment_tree
+"""
+
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from app.utils.comment_tree import build_comment_tree
+
+
+def build_flat_comments(total: int, threads: int) -> List[Dict[str, Any]]:
+    """生成 total 条评论，分布在 threads 个父评论下，按 id 顺序返回"""
+    comments: List[Dict[str, Any]] = []
+    levels: List[List[int]] = [[], [], []]
+    for comment_id in range(1, total + 1):
+        if comment_id <= threads:
+            depth, parent_id = 0, None
+        else:
+            depth = random.choice((1, 2)) if levels[1] else 1
+            parent_id = random.choice(levels[depth - 1])
+        levels[depth].append(comment_id)
+        comments.append(
+            {
+                "comment_id": comment_id,
+                "user_id": comment_id % 50 + 1,
+                "username": f"user-{comment_id % 50 + 1}",
+                "avatar_url": None,
+                "user_role": "user",
+                "city": "Tokyo",
+                "parent_id": parent_id,
+                "comment": "谢谢分享，这篇文章写得很清楚。",
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "updated_at": None,
+            }
+        )
+    return comments
+
+
+def build_recursive(
+    comments: List[Dict[str, Any]], parent_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """原先的组装方式：每个节点都重新扫描整个列表寻找子评论"""
+    tree = []
+    for comment in comments:
+        if comment["parent_id"] == parent_id:
+            children = build_recursive(comments, comment["comment_id"])
+            node = dict(comment)
+            if children:
+                node["children"] = children
+            tree.append(node)
+    return tree
+
+
+def measure(build, comments: List[Dict[str, Any]], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build([dict(comment) for comment in comments])
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main() -> None:
+    random.seed(42)
+    print(f"{'comments':>10}{'threads':>10}{'recursive ms':>15}{'O(n) ms':>10}")
+    for total, threads in ((100, 20), (1000, 20), (2000, 20), (5000, 20)):
+        comments = build_flat_comments(total, threads)
+        rounds = max(1, 2000 // total)
+        recursive_ms = measure(build_recursive, comments, rounds)
+        linear_ms = measure(build_comment_tree, comments, rounds * 10)
+        print(f"{total:>10}{threads:>10}{recursive_ms:>15.2f}{linear_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""JWT 解码微基准测试
+
+比较每次都验签解析（原先的 decode_token）与已验证声明 LRU 缓存命中 / 未命中时
+decode_token 的单次耗时。无需连接 Redis / MySQL（导入配置需要 .env）：
+
+    python -m script.benchmark_jwt_decode
+"""
+
+import time
+from typing import Callable
+
+from app.core.security import JWTManager
+
+ROUNDS = 20000
+
+
+def make_manager(claims_cache_size: int) -> JWTManager:
+    return JWTManager(
+        secret_key="benchmark-secret-key-at-least-32-bytes",
+        algorithm="HS256",
+        issuer="xiaoli",
+        audience="xiaoli_users",
+        access_token_expiry=1800,
+        refresh_token_expiry=604800,
+        claims_cache_size=claims_cache_size,
+    )
+
+
+def measure(decode: Callable[[int], object], rounds: int = ROUNDS) -> float:
+    """返回单次调用的平均耗时（微秒）"""
+    started = time.perf_counter()
+    for index in range(rounds):
+        decode(index)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    manager = make_manager(claims_cache_size=4096)
+    payload = {
+        "user_id": 1,
+        "email": "user@example.com",
+        "username": "user",
+        "role": 1,
+        "jti": "benchmark",
+    }
+    token, _ = manager.create_access_token(payload)
+
+    # 原先的做法：每次都验签并校验声明
+    uncached_us = measure(lambda _: manager._verify_token(token))
+
+    manager.decode_token(token)
+    hit_us = measure(lambda _: manager.decode_token(token))
+
+    # 每次都是不同的令牌，且缓存容量不足：验签 + 写入缓存 + LRU 淘汰
+    tokens = [
+        manager.create_access_token({**payload, "jti": str(index)})[0]
+        for index in range(ROUNDS)
+    ]
+    small = make_manager(claims_cache_size=1024)
+    miss_us = measure(lambda index: small.decode_token(tokens[index]))
+
+    print(f"{'case':<28}{'us / decode':>12}")
+    print(f"{'verify every time':<28}{uncached_us:>12.2f}")
+    print(f"{'cache hit':<28}{hit_us:>12.2f}")
+    print(f"{'cache miss + eviction':<28}{miss_us:>12.2f}")
+    print(f"speed-up on hit: {uncached_us / hit_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
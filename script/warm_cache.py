@@ -0,0 +1,37 @@
+"""手动预热热点缓存（例如部署后、批量导入数据后）
+
+python -m script.warm_cache --pages 3 --recent-blogs 20 --concurrency 2
+"""
+
+import argparse
+import asyncio
+
+from app.core.database.mysql import mysql_manager
+from app.core.database.redis import redis_manager
+from app.core.logger import logger_manager
+from app.tasks.cache_warming_task import warm_cache
+
+logger = logger_manager.get_logger(__name__)
+
+
+async def main(args: argparse.Namespace) -> None:
+    await mysql_manager.initialize()
+    await redis_manager.initialize_async()
+    try:
+        stats = await warm_cache(
+            pages=args.pages,
+            recent_blogs=args.recent_blogs,
+            concurrency=args.concurrency,
+        )
+        logger.info(f"✅ Cache warming done: {stats}")
+    finally:
+        await redis_manager.close()
+        await mysql_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm the hottest cache keys")
+    parser.add_argument("--pages", type=int, default=None)
+    parser.add_argument("--recent-blogs", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -69,6 +69,100 @@ class TestBlogCrud:
         result = await mock_blog_crud.get_blog_by_slug("nonexistent-slug")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_blog_details_cache_hit_skips_db(self, mock_blog_crud):
+        """Test a cached blog detail is served and counted without querying MySQL."""
+        payload = {"blog_id": 7, "blog_name": "cached"}
+        with patch('app.crud.blog_crud.redis_manager') as redis, \
+                patch('app.crud.blog_crud.blog_view_tracker') as tracker, \
+                patch('app.crud.blog_crud.blog_trending') as trending:
+            redis.get_or_build_async = AsyncMock(return_value=payload)
+            tracker.record_view_async = AsyncMock(return_value=True)
+            trending.record_async = AsyncMock()
+
+            result = await mock_blog_crud.get_blog_details(MagicMock(), "cached-blog")
+
+        assert result == payload
+        mock_blog_crud.db.execute.assert_not_awaited()
+        assert tracker.record_view_async.await_args.args[0] == 7
+        trending.record_async.assert_awaited_once_with(7, "view")
+
+    @pytest.mark.asyncio
+    async def test_zero_tag_blog_count_is_recounted(self, mock_blog_crud):
+        """Test a maintained count of 0 is verified with COUNT(*) instead of trusted."""
+        result = MagicMock()
+        result.scalar_one.return_value = 4
+        mock_blog_crud.db.execute = AsyncMock(return_value=result)
+        with patch('app.crud.blog_crud.tag_blog_counts') as counts:
+            counts.get_many_async = AsyncMock(return_value={3: {"published": 0}})
+            counts.set_many_async = AsyncMock()
+
+            assert await mock_blog_crud._get_tag_blog_count(3) == 4
+
+        mock_blog_crud.db.execute.assert_awaited_once()
+        counts.set_many_async.assert_awaited_once_with({3: {"published": 4}})
+
+    @pytest.mark.asyncio
+    async def test_recent_popular_tops_up_from_leaderboard(self, mock_blog_crud):
+        """Test a short trending list is topped up from the Redis leaderboard."""
+        from app.core.i18n.i18n import Language
+
+        loaded = {}
+
+        async def get_published(blog_ids):
+            loaded.setdefault("calls", []).append(list(blog_ids))
+            return [MagicMock(id=blog_id) for blog_id in blog_ids if blog_id != 3]
+
+        mock_blog_crud._get_published_blogs_in_order = get_published
+        mock_blog_crud._get_real_time_blog_stats = AsyncMock(return_value={})
+        with patch('app.crud.blog_crud.blog_trending') as trending, \
+                patch('app.crud.blog_crud.blog_leaderboard') as leaderboard:
+            trending.top_async = AsyncMock(return_value=[(1, 5.0)])
+            leaderboard.is_loaded_async = AsyncMock(return_value=True)
+            leaderboard.top_async = AsyncMock(return_value={
+                "views": [(2, 10), (3, 50), (1, 80)],
+                "likes": [(4, 30), (2, 25)],
+            })
+
+            items = await mock_blog_crud._build_recent_populor_blog(
+                Language.EN_US, limit=3
+            )
+
+        assert [item["blog_id"] for item in items] == [1, 2, 4]
+        assert loaded["calls"][1] == [3, 2, 4]
+        mock_blog_crud.db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_recent_popular_seeds_cold_leaderboard(self, mock_blog_crud):
+        """Test an unseeded leaderboard is loaded from Blog_Stats before topping up."""
+        from app.core.i18n.i18n import Language
+
+        async def get_published(blog_ids):
+            return [MagicMock(id=blog_id) for blog_id in blog_ids]
+
+        stats = MagicMock()
+        stats.all.return_value = [(7, 100, 3, 1, 2), (8, 40, 1, 0, 0)]
+        mock_blog_crud.db.execute = AsyncMock(return_value=stats)
+        mock_blog_crud._get_published_blogs_in_order = get_published
+        mock_blog_crud._get_real_time_blog_stats = AsyncMock(return_value={})
+        with patch('app.crud.blog_crud.blog_trending') as trending, \
+                patch('app.crud.blog_crud.blog_leaderboard') as leaderboard:
+            trending.top_async = AsyncMock(return_value=[])
+            leaderboard.is_loaded_async = AsyncMock(return_value=False)
+            leaderboard.seed_async = AsyncMock()
+            leaderboard.top_async = AsyncMock(return_value={
+                "views": [(7, 100), (8, 40)],
+            })
+
+            items = await mock_blog_crud._build_recent_populor_blog(
+                Language.EN_US, limit=2
+            )
+
+        assert [item["blog_id"] for item in items] == [7, 8]
+        seeded = list(leaderboard.seed_async.await_args.args[0])
+        assert seeded[0] == {"id": 7, "views": 100, "likes": 3, "comments": 1, "saves": 2}
+        mock_blog_crud.db.execute.assert_awaited_once()
+
 
 class TestUserCrud:
     """Tests for UserCrud operations."""
@@ -271,3 +365,33 @@ class TestAnalyticCrud:
     async def test_analytic_crud_exists(self, mock_analytic_crud):
         """Test AnalyticCrud exists."""
         assert mock_analytic_crud is not None
+
+    @pytest.mark.asyncio
+    async def test_payment_statistics_from_rollup(self, mock_analytic_crud):
+        """Test payment totals are summed from one grouped rollup query."""
+        from unittest.mock import AsyncMock, MagicMock
+        from app.models.payment_model import PaymentStatus, PaymentType
+
+        result = MagicMock()
+        result.all.return_value = [
+            (PaymentType.card, PaymentStatus.success, 3, 30.0, 3.0, 1, 10.0, 20.0),
+            (PaymentType.alipay, PaymentStatus.success, 2, 50.0, 5.0, 2, 50.0, 50.0),
+            (PaymentType.card, PaymentStatus.failed, 1, 9.0, 0.9, 1, 9.0, 9.0),
+        ]
+        mock_analytic_crud.db.execute = AsyncMock(return_value=result)
+
+        stats = await mock_analytic_crud._build_payment_statistics()
+
+        mock_analytic_crud.db.execute.assert_awaited_once()
+        assert "payment_daily_rollup" in str(
+            mock_analytic_crud.db.execute.call_args[0][0]
+        )
+        assert stats["total_revenue"] == 80.0
+        assert stats["total_payments"] == 6
+        assert stats["successful_payments"] == 5
+        assert stats["monthly_revenue"] == 60.0
+        assert stats["monthly_payments"] == 4
+        assert stats["yearly_revenue"] == 70.0
+        assert stats["total_tax"] == 8.0
+        assert stats["payment_type_distribution"] == {"Card": 4, "Alipay": 2}
+        assert stats["payment_status_distribution"] == {"success": 5, "failed": 1}
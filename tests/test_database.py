@@ -1,6 +1,9 @@
 """
 Tests for database connection and management.
 """
+import time
+
+import pytest
 from unittest.mock import patch
 
 
@@ -52,6 +55,137 @@ class TestMySQLManager:
             assert "mysql+pymysql://" in url
 
 
+class TestReadReplicaRouting:
+    """Tests for routing read-only queries to replicas."""
+
+    @staticmethod
+    def make_request(method="GET", cookie=None):
+        from starlette.requests import Request
+
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        return Request({"type": "http", "method": method, "headers": headers})
+
+    def test_routing_session_reads_from_replica_until_a_write(self):
+        """Test SELECTs hit the replica, and everything after a write stays on the primary."""
+        from sqlalchemy import Column, MetaData, String, Table, create_engine
+        from sqlmodel import insert, select
+        from app.core.database.mysql import READ_ENGINE_KEY, RoutingSession
+
+        markers = Table("markers", MetaData(), Column("name", String(20)))
+        primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+        for engine, name in ((primary, "primary"), (replica, "replica")):
+            with engine.begin() as conn:
+                markers.create(conn)
+                conn.execute(insert(markers).values(name=name))
+
+        with RoutingSession(bind=primary) as session:
+            session.info[READ_ENGINE_KEY] = replica
+            assert session.execute(select(markers.c.name)).scalars().all() == ["replica"]
+            session.execute(insert(markers).values(name="written"))
+            assert session.execute(select(markers.c.name)).scalars().all() == [
+                "primary",
+                "written",
+            ]
+
+        with RoutingSession(bind=primary) as session:
+            session.info[READ_ENGINE_KEY] = replica
+            locked = select(markers.c.name).with_for_update()
+            assert session.get_bind(clause=locked) is primary
+
+    @pytest.mark.asyncio
+    async def test_routing_session_reads_cold_cache_rebuild_from_replica(self):
+        """Test a list read after a cache miss still goes to the replica."""
+        from unittest.mock import AsyncMock, MagicMock
+        from sqlmodel import select
+        from app.core.database.mysql import READ_ENGINE_KEY, RoutingSession
+        from app.core.database.redis import RedisManager
+
+        client = MagicMock()
+        client.get = AsyncMock(return_value=None)
+        manager = RedisManager()
+        manager.get_async_client = AsyncMock(return_value=client)
+
+        assert await manager.get_async("blog_lists:section_id=1:page=1") is None
+
+        primary, replica = MagicMock(), MagicMock()
+        with RoutingSession(bind=primary) as session:
+            session.info[READ_ENGINE_KEY] = replica
+            assert session.get_bind(clause=select(1)) is replica
+
+    @pytest.mark.asyncio
+    async def test_choose_read_engine_skips_lagging_replicas(self):
+        """Test replicas over the lag limit or with broken replication are not used."""
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.mysql import MySQLManager
+
+        manager = MySQLManager()
+        lagging, broken, healthy = MagicMock(), MagicMock(), MagicMock()
+        manager.replica_engines = [lagging, broken, healthy]
+        lags = {id(lagging): 60.0, id(broken): None, id(healthy): 1.0}
+        manager.check_replica_lag = AsyncMock(side_effect=lambda e: lags[id(e)])
+
+        await manager.refresh_replica_lag()
+        assert manager.choose_read_engine() is healthy
+        assert manager.choose_read_engine() is healthy
+        # 检测结果在 DATABASE_REPLICA_LAG_CHECK_INTERVAL 内复用
+        assert manager.check_replica_lag.await_count == 3
+
+        # 检测结果过期后在后台重新检测，本次仍使用上一次的结果
+        lags[id(healthy)] = None
+        manager.replica_checked_at = 0.0
+        assert manager.choose_read_engine() is healthy
+        await manager._replica_refresh
+        assert manager.choose_read_engine() is None
+
+    @pytest.mark.asyncio
+    async def test_get_db_uses_primary_for_writes_and_recent_writers(self):
+        """Test only read-only requests without the recent-write cookie get a replica."""
+        from unittest.mock import MagicMock
+        from app.core.database.mysql import (
+            READ_ENGINE_KEY,
+            RECENT_WRITE_COOKIE,
+            MySQLManager,
+        )
+
+        manager = MySQLManager()
+        manager.async_session_maker = lambda: MagicMock(info={})
+        replica = MagicMock()
+        manager.choose_read_engine = MagicMock(return_value=replica)
+
+        async def read_engine_for(request):
+            async for db in manager.get_db(request):
+                return db.info.get(READ_ENGINE_KEY)
+
+        assert await read_engine_for(self.make_request()) is replica.sync_engine
+        assert await read_engine_for(self.make_request("POST")) is None
+        recent = self.make_request(cookie=f"{RECENT_WRITE_COOKIE}=1")
+        assert await read_engine_for(recent) is None
+
+    @pytest.mark.asyncio
+    async def test_get_db_opens_session_on_first_use(self):
+        """Test requests that never touch the session never create one."""
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.mysql import MySQLManager
+
+        manager = MySQLManager()
+        session = MagicMock(close=AsyncMock())
+        manager.async_session_maker = MagicMock(return_value=session)
+
+        sessions = manager.get_db(self.make_request())
+        db = await sessions.__anext__()
+        await sessions.aclose()
+        assert not db.is_active
+        manager.async_session_maker.assert_not_called()
+
+        sessions = manager.get_db(self.make_request())
+        db = await sessions.__anext__()
+        db.add("row")
+        await sessions.aclose()
+        assert db.is_active
+        session.add.assert_called_once_with("row")
+        session.close.assert_awaited_once()
+
+
 class TestRedisManager:
     """Tests for Redis manager."""
 
@@ -69,6 +203,125 @@ class TestRedisManager:
             assert hasattr(manager, 'async_client')
             assert hasattr(manager, 'sync_client')
 
+    def test_get_cache_tags(self):
+        """Test cache keys are tagged at every ':' boundary."""
+        from app.core.database.redis import RedisManager
+
+        manager = RedisManager()
+        tags = manager.get_cache_tags("blog_lists:3:lang=zh:page=1")
+        assert tags == [
+            "cache_tag:blog_lists",
+            "cache_tag:blog_lists:3",
+            "cache_tag:blog_lists:3:lang=zh",
+        ]
+        assert manager.get_cache_tags("user_profile_1") == []
+        # 不按前缀失效的键不登记标签
+        assert manager.get_cache_tags("user_principal:1") == []
+
+    def test_prefix_invalidations_are_tagged(self):
+        """Test every prefix invalidated in the code base belongs to a tagged cache family."""
+        import re
+        from pathlib import Path
+        from app.core.config.settings import settings
+
+        app_dir = Path(__file__).resolve().parent.parent / "app"
+        families = set()
+        for path in app_dir.rglob("*.py"):
+            if path == app_dir / "core" / "database" / "redis.py":
+                continue
+            families.update(re.findall(r'f?"([a-z_]+):[^"]*\*"', path.read_text()))
+        assert families
+        assert families <= set(settings.redis.REDIS_CACHE_TAG_FAMILIES)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefix_in_batches(self):
+        """Test tagged keys are scanned and unlinked in batches outside Lua."""
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database import redis as redis_module
+        from app.core.database.redis import RedisManager
+
+        members = [f"blog_lists:{index}" for index in range(redis_module.CACHE_TAG_SCAN_COUNT + 1)]
+
+        async def sscan_iter(tag, count):
+            assert tag == "cache_tag:blog_lists"
+            for member in members:
+                yield member
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=lambda: [0, len(pipe.unlink.call_args.args)])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        client = MagicMock()
+        client.unlink = AsyncMock(return_value=1)
+        client.sscan_iter = sscan_iter
+        client.pipeline = MagicMock(return_value=pipe)
+
+        manager = RedisManager()
+        manager.get_async_client = AsyncMock(return_value=client)
+        manager.publish_invalidation_async = AsyncMock()
+        manager.schedule_http_cache_purge = MagicMock()
+
+        deleted = await manager.invalidate_async(patterns=["blog_lists:*"])
+
+        assert deleted == len(members) + 1
+        client.unlink.assert_awaited_once_with("blog_lists")
+        assert pipe.unlink.call_count == 2
+        assert client.pipeline.call_args.kwargs == {"transaction": True}
+        pipe.srem.assert_called_with("cache_tag:blog_lists", members[-1])
+
+    def test_pattern_to_prefix(self):
+        """Test invalidation patterns map to tag prefixes without KEYS."""
+        from app.core.database.redis import RedisManager
+
+        manager = RedisManager()
+        assert manager.pattern_to_prefix("blog_lists:*") == "blog_lists"
+        assert manager.pattern_to_prefix("blog_lists:3:*") == "blog_lists:3"
+        assert manager.pattern_to_prefix("blog_tts:7") == "blog_tts:7"
+        # 非前缀通配退化为更宽的前缀
+        assert manager.pattern_to_prefix("admin_all_users:page=*") == "admin_all_users"
+
+    def test_pattern_to_prefix_unsupported(self):
+        """Test patterns without a usable prefix are rejected."""
+        from app.core.database.redis import RedisManager
+
+        with pytest.raises(ValueError):
+            RedisManager().pattern_to_prefix("*")
+
+    def test_stale_while_revalidate_envelope(self):
+        """Test soft-expired entries are returned together with a stale flag."""
+        from app.core.database.redis import RedisManager
+
+        manager = RedisManager()
+        value, hard_ex = manager.dump_cache_value({"a": 1}, 60, True)
+        assert hard_ex == 60 + manager.config.REDIS_STALE_TTL
+        assert manager.load_cache_value(value) == ({"a": 1}, False)
+
+        with patch('app.core.database.redis.time.time', return_value=time.time() + 61):
+            assert manager.load_cache_value(value) == ({"a": 1}, True)
+
+        plain, ex = manager.dump_cache_value([1, 2], 60, False)
+        assert ex == 60
+        assert manager.load_cache_value(plain) == ([1, 2], False)
+
+    @pytest.mark.asyncio
+    async def test_mget_only_fetches_local_cache_misses(self):
+        """Test mget_async serves local hits and batches the rest into one MGET."""
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.redis import RedisManager
+
+        manager = RedisManager()
+        manager.async_client = MagicMock()
+        manager.async_client.mget = AsyncMock(return_value=["remote", None])
+        manager.invalidation_task = MagicMock(done=MagicMock(return_value=False))
+        manager.local_cache_families = {"blog_lists"}
+        manager.local_cache.set("blog_lists:1", "local")
+
+        result = await manager.mget_async(["blog_lists:1", "blog_lists:2", "other:1"])
+
+        assert result == ["local", "remote", None]
+        manager.async_client.mget.assert_awaited_once_with(["blog_lists:2", "other:1"])
+        assert manager.local_cache.get("blog_lists:2") == "remote"
+
 
 class TestDatabaseConnection:
     """Tests for database connection manager."""
@@ -87,3 +340,477 @@ class TestDatabaseConnection:
         """Test db_manager has Redis manager."""
         from app.core.database.connection import db_manager
         assert hasattr(db_manager, 'redis_manager')
+
+
+class TestLocalCache:
+    """Tests for the in-process LRU cache in front of Redis."""
+
+    def test_get_set_and_family_stats(self):
+        """Test hits and misses are counted per key family."""
+        from app.core.database.local_cache import LocalCache
+
+        cache = LocalCache(max_bytes=1024 * 1024, default_ttl=60)
+        assert cache.get("blog_lists:1") is None
+        cache.set("blog_lists:1", "payload")
+        assert cache.get("blog_lists:1") == "payload"
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["families"]["blog_lists"]["hits"] == 1
+        assert stats["families"]["blog_lists"]["misses"] == 1
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Test the byte budget evicts the least recently used entry."""
+        import sys
+        from app.core.database.local_cache import LocalCache
+
+        entry_size = sys.getsizeof("k:1") + sys.getsizeof("x" * 100)
+        cache = LocalCache(max_bytes=entry_size * 2, default_ttl=60)
+        cache.set("k:1", "x" * 100)
+        cache.set("k:2", "x" * 100)
+        cache.get("k:1")
+        cache.set("k:3", "x" * 100)
+
+        assert cache.get("k:2") is None
+        assert cache.get("k:1") is not None
+        assert cache.current_bytes <= cache.max_bytes
+
+    def test_expired_entries_are_misses(self):
+        """Test entries past their TTL are dropped."""
+        from app.core.database.local_cache import LocalCache
+
+        cache = LocalCache(max_bytes=1024 * 1024, default_ttl=60)
+        with patch("app.core.database.local_cache.time.monotonic", return_value=0):
+            cache.set("friend_details:lang=zh", "v", ttl=10)
+        with patch("app.core.database.local_cache.time.monotonic", return_value=11):
+            assert cache.get("friend_details:lang=zh") is None
+
+    def test_delete_prefix(self):
+        """Test prefix deletion only removes keys on a ':' boundary."""
+        from app.core.database.local_cache import LocalCache
+
+        cache = LocalCache(max_bytes=1024 * 1024, default_ttl=60)
+        cache.set("blog_lists:1:page=1", "a")
+        cache.set("blog_lists:10:page=1", "b")
+        cache.delete_prefix("blog_lists:1")
+
+        assert cache.get("blog_lists:1:page=1") is None
+        assert cache.get("blog_lists:10:page=1") == "b"
+
+    def test_ignores_own_invalidation_messages(self):
+        """Test a manager does not re-apply its own broadcast."""
+        from app.core.database.redis import RedisManager
+
+        manager = RedisManager()
+        manager.local_cache.set("blog_lists:1", "a")
+        manager.apply_invalidation_message(
+            manager.build_invalidation_message(prefixes=["blog_lists"])
+        )
+        assert manager.local_cache.get("blog_lists:1") == "a"
+
+        other = RedisManager()
+        manager.apply_invalidation_message(
+            other.build_invalidation_message(prefixes=["blog_lists"])
+        )
+        assert manager.local_cache.get("blog_lists:1") is None
+
+
+class TestCacheValueCodec:
+    """Tests for the cache value codec used by RedisManager."""
+
+    def test_large_values_round_trip_compressed(self):
+        """Test values over the threshold are compressed and decoded back."""
+        import json
+        from app.core.database.codec import CacheValueCodec
+
+        codec = CacheValueCodec(codec="zlib", threshold=100)
+        value = json.dumps({"blog_content": "缓存的失效策略" * 200})
+        encoded = codec.encode(value)
+
+        assert encoded.startswith("\x01")
+        assert len(encoded) < len(value)
+        assert codec.decode(encoded) == value
+
+    def test_small_and_legacy_values_pass_through(self):
+        """Test small values are stored as-is and plain JSON stays readable."""
+        from app.core.database.codec import CacheValueCodec
+
+        codec = CacheValueCodec(codec="zlib", threshold=100)
+        assert codec.encode('{"a": 1}') == '{"a": 1}'
+        assert codec.decode('{"a": 1}') == '{"a": 1}'
+
+        # 关闭压缩后仍能读取之前压缩写入的数据
+        encoded = CacheValueCodec(codec="zlib", threshold=0).encode("x" * 500)
+        assert CacheValueCodec(codec="none", threshold=0).decode(encoded) == "x" * 500
+
+    def test_unknown_codec(self):
+        """Test unknown codec names are rejected."""
+        from app.core.database.codec import CacheValueCodec
+
+        with pytest.raises(ValueError):
+            CacheValueCodec(codec="brotli", threshold=0)
+
+
+class TestCacheMetrics:
+    """Tests for per-key-family cache metrics."""
+
+    def test_counts_per_family(self):
+        """Test hits, misses, sets and invalidations are grouped by key family."""
+        from app.core.database.cache_metrics import CacheMetrics
+
+        metrics = CacheMetrics()
+        metrics.record_get("blog_lists:1:lang=zh", "abc", 0.3)
+        metrics.record_get("blog_lists:2:lang=zh", None, 3)
+        metrics.record_local_hit("blog_lists:1:lang=zh")
+        metrics.record_set("blog_lists:2:lang=zh", "abcd", 1.5)
+        metrics.record_invalidation("blog_lists")
+
+        family = metrics.snapshot()["families"]["blog_lists"]
+        assert family["hits"] == 2
+        assert family["local_hits"] == 1
+        assert family["misses"] == 1
+        assert family["hit_ratio"] == round(2 / 3, 4)
+        assert family["sets"] == 1
+        assert family["invalidations"] == 1
+        assert family["bytes_read"] == 3
+        assert family["bytes_written"] == 4
+        assert family["get_latency"]["buckets"]["le_0.5"] == 1
+        assert family["get_latency"]["buckets"]["le_5"] == 1
+
+    def test_key_family_strips_ids(self):
+        """Test keys without ':' are grouped into a bounded set of families."""
+        from app.core.database.local_cache import get_key_family
+
+        assert get_key_family("user_profile_42") == "user_profile"
+        assert get_key_family("analytics_growth_trends_30") == "analytics_growth_trends"
+        assert get_key_family("analytics_blog_statistics") == "analytics_blog_statistics"
+        assert get_key_family("admin_all_users:page=1:size=10") == "admin_all_users"
+        assert get_key_family("blog_lists:1:lang=zh") == "blog_lists"
+        assert get_key_family("search=abc") == "search"
+
+    def test_latency_quantiles(self):
+        """Test quantiles are estimated from bucket upper bounds."""
+        from app.core.database.cache_metrics import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        for _ in range(95):
+            histogram.observe(0.2)
+        for _ in range(5):
+            histogram.observe(40)
+
+        assert histogram.quantile(0.5) == 0.5
+        assert histogram.quantile(0.95) == 0.5
+        assert histogram.quantile(0.99) == 50
+
+
+class TestWriteBehindCounter:
+    """Tests for the Redis write-behind counters."""
+
+    def test_merge_adds_pending_deltas(self):
+        """Test persisted stats and pending deltas are added together."""
+        from app.core.database.counters import WriteBehindCounter
+
+        merged = WriteBehindCounter.merge(
+            {"views": 10, "likes": 2, "comments": 1, "saves": 0}, {"views": 3, "likes": -1}
+        )
+        assert merged == {"views": 13, "likes": 1, "comments": 1, "saves": 0}
+
+    @pytest.mark.asyncio
+    async def test_pending_includes_claimed_deltas(self):
+        """Test deltas claimed by an uncommitted flush still count towards live stats."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.counters import WriteBehindCounter
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[
+            {"views": "2"}, {"views": "3", "likes": "1"}, {}, {"likes": "-1"}, {}, {},
+        ])
+
+        @asynccontextmanager
+        async def pipeline_async():
+            yield pipe
+
+        counter = WriteBehindCounter("test", ("views", "likes"))
+        with patch("app.core.database.counters.redis_manager") as redis:
+            redis.pipeline_async = pipeline_async
+            pending = await counter.get_pending_async([1, 2, 3])
+
+        assert pending == {1: {"views": 5, "likes": 1}, 2: {"likes": -1}}
+        pipe.hgetall.assert_any_call("counter_processing:test:1")
+
+    def test_claim_returns_batch_id_with_deltas(self):
+        """Test a claim returns its batch id and acknowledges batches that cancel out."""
+        from unittest.mock import MagicMock
+        from app.core.database.counters import WriteBehindCounter
+
+        counter = WriteBehindCounter("test", ("views", "likes"))
+        script = MagicMock(return_value=["b1", "1", ["views", "3"], "2", ["likes", "0"]])
+        with patch("app.core.database.counters.redis_manager") as redis, \
+                patch.object(counter, "ack_sync") as mock_ack:
+            redis.get_sync_script.return_value = script
+            assert counter.claim_sync() == ("b1", {1: {"views": 3}})
+            mock_ack.assert_not_called()
+
+            script.return_value = ["b2", "2", ["likes", "0"]]
+            assert counter.claim_sync() == (None, {})
+            mock_ack.assert_called_once_with()
+
+        assert script.call_args.kwargs["keys"][2] == "counter_processing_batch:test"
+
+    @pytest.mark.asyncio
+    async def test_unknown_fields_are_rejected(self):
+        """Test only configured counter fields can be incremented."""
+        from app.core.database.counters import blog_stats_counter
+
+        with pytest.raises(ValueError):
+            await blog_stats_counter.incr_async(1, comments=1)
+
+    def test_unique_view_window_keys(self):
+        """Test unique viewer windows are capped at the retention period."""
+        from datetime import datetime, timezone
+        from app.core.database.counters import blog_view_tracker
+
+        today = datetime.now(timezone.utc)
+        keys = blog_view_tracker.window_keys(7, days=3)
+        assert keys[0] == f"viewers:blog:7:{today:%Y%m%d}"
+        assert len(keys) == 3
+        assert len(blog_view_tracker.window_keys(7, days=10_000)) == (
+            blog_view_tracker.retention_days
+        )
+
+    @pytest.mark.asyncio
+    async def test_projection_ignores_partial_hashes(self):
+        """Test only complete stats projections are treated as hits."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.counters import blog_stats_projection
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            return_value=[
+                {"views": "5", "likes": "1", "comments": "0", "saves": "2"},
+                {"likes": "1"},
+                {},
+            ]
+        )
+
+        @asynccontextmanager
+        async def fake_pipeline():
+            yield pipe
+
+        with patch("app.core.database.counters.redis_manager.pipeline_async", fake_pipeline):
+            stats = await blog_stats_projection.get_many_async([1, 2, 3])
+
+        assert stats == {1: {"views": 5, "likes": 1, "comments": 0, "saves": 2}}
+
+
+class TestToggleTracker:
+    """Tests for atomic toggles such as blog likes."""
+
+    def test_toggle_tracker_requires_projection(self):
+        """Test toggles need a projection to return the up-to-date count."""
+        from app.core.database.counters import ToggleTracker, WriteBehindCounter
+
+        with pytest.raises(ValueError):
+            ToggleTracker("likes", WriteBehindCounter("test", ("likes",)), "likes")
+
+    @pytest.mark.asyncio
+    async def test_toggle_returns_state_and_count(self):
+        """Test the toggle script result is mapped to (state, count) or None."""
+        from unittest.mock import AsyncMock
+        from app.core.database.counters import blog_like_tracker
+
+        script = AsyncMock(side_effect=[[1, 6], [0, 5], [-1, -1]])
+        with patch(
+            "app.core.database.counters.redis_manager.get_async_script",
+            AsyncMock(return_value=script),
+        ):
+            assert await blog_like_tracker.toggle_async(1, "1.2.3.4") == (True, 6)
+            assert await blog_like_tracker.toggle_async(1, "1.2.3.4") == (False, 5)
+            assert await blog_like_tracker.toggle_async(1, "1.2.3.4") is None
+
+        keys = script.call_args.kwargs["keys"]
+        assert keys == [
+            "toggles:blog_likes:1",
+            "counter:blog_stats:1",
+            "counter_dirty:blog_stats",
+            "stats:blog:1",
+            "blog_like_button:1:ip=1.2.3.4",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_toggle_without_legacy_key(self):
+        """Test trackers without a legacy key format pass an empty key to the script."""
+        from unittest.mock import AsyncMock
+        from app.core.database.counters import (
+            StatsProjection,
+            ToggleTracker,
+            WriteBehindCounter,
+        )
+
+        counter = WriteBehindCounter(
+            "test", ("likes",), projection=StatsProjection("test", ("likes",))
+        )
+        tracker = ToggleTracker("test_likes", counter, "likes")
+        script = AsyncMock(return_value=[1, 1])
+        with patch(
+            "app.core.database.counters.redis_manager.get_async_script",
+            AsyncMock(return_value=script),
+        ):
+            assert await tracker.toggle_async(1, "actor") == (True, 1)
+
+        assert script.call_args.kwargs["keys"][-1] == ""
+
+
+class TestTokenRevocationList:
+    """Tests for the in-process revoked-token set."""
+
+    @pytest.fixture
+    def revocations(self):
+        from unittest.mock import MagicMock
+        from app.core.database.revocation import TokenRevocationList
+
+        revocations = TokenRevocationList("test_token")
+        # 模拟订阅已建立并完成加载
+        revocations.listener_task = MagicMock(done=MagicMock(return_value=False))
+        revocations.ready = True
+        return revocations
+
+    def test_check_local_answers_from_memory(self, revocations):
+        """Test revoked and unknown jtis are answered without Redis."""
+        revocations.apply_message('{"jti": "revoked", "expires_at": %f}' % (time.time() + 60))
+        revocations.apply_message('{"jti": "expired", "expires_at": %f}' % (time.time() - 1))
+        revocations.apply_message("not json")
+
+        assert revocations.check_local("revoked") is True
+        assert revocations.check_local("expired") is False
+        assert revocations.check_local("unknown") is False
+        assert "expired" not in revocations.revoked
+
+    def test_check_local_defers_to_redis_until_synced(self, revocations):
+        """Test the set is not trusted while the subscription is down."""
+        revocations.ready = False
+        assert revocations.check_local("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_writes_blacklist_and_broadcasts(self, revocations):
+        """Test revoking sets the fallback key, the load set and a broadcast."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import MagicMock, patch
+
+        pipe = MagicMock()
+
+        @asynccontextmanager
+        async def pipeline_async():
+            yield pipe
+
+        expires_at = time.time() + 120
+        with patch("app.core.database.revocation.redis_manager") as redis:
+            redis.pipeline_async = pipeline_async
+            await revocations.revoke_async("jti-1", expires_at)
+
+        assert revocations.check_local("jti-1") is True
+        key, value = pipe.set.call_args.args
+        assert key == "blacklist:test_token:jti-1"
+        assert 120 <= pipe.set.call_args.kwargs["ex"] <= 121
+        pipe.zadd.assert_called_once_with("revoked_tokens:test_token", {"jti-1": expires_at})
+        assert pipe.publish.call_args.args[0] == "token_revocation:test_token"
+
+    @pytest.mark.asyncio
+    async def test_load_backfills_legacy_blacklist_keys(self, revocations):
+        """Test tokens revoked before the ZSET existed are loaded from their blacklist keys."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        async def scan_iter(match, count):
+            assert match == "blacklist:test_token:*"
+            for key in ("blacklist:test_token:old", "blacklist:test_token:gone"):
+                yield key
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[60, -2])
+
+        @asynccontextmanager
+        async def pipeline_async():
+            yield pipe
+
+        client = MagicMock()
+        client.exists = AsyncMock(return_value=0)
+        client.scan_iter = scan_iter
+        client.zrangebyscore = AsyncMock(return_value=[])
+        with patch("app.core.database.revocation.redis_manager") as redis:
+            redis.get_async_client = AsyncMock(return_value=client)
+            redis.pipeline_async = pipeline_async
+            await revocations._load()
+
+        entries = pipe.zadd.call_args.args[1]
+        assert list(entries) == ["old"]
+        assert entries["old"] == pytest.approx(time.time() + 60, abs=2)
+        assert pipe.set.call_args.args[0] == "revoked_tokens_backfilled:test_token"
+        assert pipe.set.call_args.kwargs["nx"] is True
+
+    @pytest.mark.asyncio
+    async def test_load_skips_backfill_once_marked(self, revocations):
+        """Test reloads after the one-off backfill do not scan the keyspace."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        client = MagicMock()
+        client.exists = AsyncMock(return_value=1)
+        client.zrangebyscore = AsyncMock(return_value=[])
+        with patch("app.core.database.revocation.redis_manager") as redis:
+            redis.get_async_client = AsyncMock(return_value=client)
+            await revocations._load()
+
+        client.exists.assert_awaited_once_with("revoked_tokens_backfilled:test_token")
+        client.scan_iter.assert_not_called()
+
+
+class TestTrendingRanking:
+    """Tests for the Redis trending and leaderboard rankings."""
+
+    def test_decayed_score_halves_after_half_life(self):
+        """Test an event's weight halves after one half-life."""
+        from app.core.database.trending import blog_trending
+
+        now = 1_800_000_000
+        raw = blog_trending.log_increment(4, now)
+        later = now + blog_trending.half_life_seconds
+        assert blog_trending.decayed_score(raw, now) == pytest.approx(4)
+        assert blog_trending.decayed_score(raw, later) == pytest.approx(2)
+
+    def test_window_hour_keys(self):
+        """Test rolling windows cover one hourly bucket per hour."""
+        from datetime import datetime, timezone
+        from app.core.database.trending import blog_trending
+
+        keys = blog_trending.window_hour_keys("7d")
+        assert len(keys) == 24 * 7
+        assert keys[0] == f"trending:blog:hour:{datetime.now(timezone.utc):%Y%m%d%H}"
+        assert len(set(keys)) == len(keys)
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_top_groups_by_metric(self):
+        """Test leaderboard rankings are read per metric in one pipeline."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock
+        from app.core.database.trending import blog_leaderboard
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            return_value=[[("2", 9.0), ("1", 5.0)], [("1", 1.0)], [], [("1", 2.0)]]
+        )
+
+        @asynccontextmanager
+        async def fake_pipeline():
+            yield pipe
+
+        with patch("app.core.database.trending.redis_manager.pipeline_async", fake_pipeline):
+            ranking = await blog_leaderboard.top_async(10)
+
+        assert ranking == {
+            "views": [(2, 9), (1, 5)],
+            "likes": [(1, 1)],
+            "comments": [],
+            "saves": [(1, 2)],
+        }
@@ -1,6 +1,8 @@
 """
 Integration tests for API endpoints using TestClient.
 """
+import os
+
 import pytest
 from unittest.mock import patch
 from fastapi.testclient import TestClient
@@ -251,3 +253,35 @@ class TestAnalyticRouter:
     def test_analytic_endpoints_exist(self, analytic_router):
         """Test analytic endpoints are registered."""
         assert analytic_router is not None
+
+
+@pytest.mark.skipif(
+    not os.getenv("NGINX_CACHE_TEST_URL"),
+    reason="requires the local nginx cache (docker-compose.nginx-test.yml) and a running API",
+)
+class TestProxyCache:
+    """Tests against a local nginx proxy cache in front of a running API."""
+
+    def test_public_responses_are_served_from_cache(self):
+        """Test a repeated public GET is answered by nginx."""
+        import httpx
+
+        with httpx.Client(base_url=os.environ["NGINX_CACHE_TEST_URL"]) as client:
+            client.get("/api/v1/friend/get-friend-details", headers={"X-Language": "en"})
+            response = client.get(
+                "/api/v1/friend/get-friend-details", headers={"X-Language": "en"}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache-Status"] in ("HIT", "UPDATING", "STALE")
+        assert "Surrogate-Key" not in response.headers
+
+    def test_languages_are_cached_separately(self):
+        """Test zh and en responses do not share a cache entry."""
+        import httpx
+
+        with httpx.Client(base_url=os.environ["NGINX_CACHE_TEST_URL"]) as client:
+            zh = client.get("/api/v1/section/get-section-lists", headers={"X-Language": "zh"})
+            en = client.get("/api/v1/section/get-section-lists", headers={"X-Language": "en"})
+
+        assert zh.json()["message"] != en.json()["message"]
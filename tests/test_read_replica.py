@@ -0,0 +1,99 @@
+"""
+Read replica routing against two real MySQL instances.
+
+Runs only when MYSQL_EXPLAIN_TEST_URL (primary) and MYSQL_REPLICA_TEST_URL
+(replica) point at disposable databases (see docker-compose.mysql-test.yml).
+The two instances are not replicating; each holds a different marker row, so
+the row a query returns shows which server it was routed to.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from starlette.requests import Request
+
+pytestmark = pytest.mark.skipif(
+    not (os.getenv("MYSQL_EXPLAIN_TEST_URL") and os.getenv("MYSQL_REPLICA_TEST_URL")),
+    reason="requires two disposable MySQL databases (docker-compose.mysql-test.yml)",
+)
+
+
+def make_request(method="GET", cookie=None):
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+@pytest.fixture
+async def manager(monkeypatch):
+    from app.core.config.settings import settings
+    from app.core.database.mysql import MySQLManager
+
+    for name in ("MYSQL_EXPLAIN_TEST_URL", "MYSQL_REPLICA_TEST_URL"):
+        with create_engine(os.environ[name]).begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS replica_marker"))
+            conn.execute(text("CREATE TABLE replica_marker (name VARCHAR(20))"))
+            conn.execute(
+                text("INSERT INTO replica_marker VALUES (:name)"),
+                {"name": "primary" if name == "MYSQL_EXPLAIN_TEST_URL" else "replica"},
+            )
+
+    monkeypatch.setattr(
+        settings.database, "DATABASE_URL", os.environ["MYSQL_EXPLAIN_TEST_URL"]
+    )
+    monkeypatch.setattr(
+        settings.database,
+        "DATABASE_REPLICA_URLS",
+        [os.environ["MYSQL_REPLICA_TEST_URL"]],
+    )
+    manager = MySQLManager()
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+async def read_markers(manager, request, write_first=False, use_primary=False):
+    from sqlalchemy import select, column, table
+
+    markers = table("replica_marker", column("name"))
+    sessions = manager.get_db(request)
+    db = await sessions.__anext__()
+    try:
+        if use_primary:
+            manager.use_primary(db)
+        if write_first:
+            await db.execute(markers.insert().values(name="written"))
+        rows = (await db.execute(select(markers.c.name))).scalars().all()
+        await db.rollback()
+        return sorted(rows)
+    finally:
+        await sessions.aclose()
+
+
+class TestReadReplicaRouting:
+    async def test_get_request_reads_from_replica(self, manager):
+        assert await read_markers(manager, make_request()) == ["replica"]
+
+    async def test_write_requests_read_from_primary(self, manager):
+        assert await read_markers(manager, make_request("POST")) == ["primary"]
+
+    async def test_reads_after_a_write_stay_on_primary(self, manager):
+        rows = await read_markers(manager, make_request(), write_first=True)
+        assert rows == ["primary", "written"]
+
+    async def test_recent_writer_and_editor_read_from_primary(self, manager):
+        from app.core.database.mysql import RECENT_WRITE_COOKIE
+
+        recent = make_request(cookie=f"{RECENT_WRITE_COOKIE}=1")
+        assert await read_markers(manager, recent) == ["primary"]
+        assert await read_markers(manager, make_request(), use_primary=True) == [
+            "primary"
+        ]
+
+    async def test_lagging_replica_is_skipped(self, manager, monkeypatch):
+        from app.core.config.settings import settings
+
+        # 未配置复制的实例延迟视为 0，最大延迟设为负数即可模拟延迟超限
+        monkeypatch.setattr(settings.database, "DATABASE_REPLICA_MAX_LAG", -1)
+        manager.replica_checked_at = 0.0
+        assert await read_markers(manager, make_request()) == ["primary"]
@@ -2,7 +2,7 @@
 Tests for security module - password validation, hashing, and JWT.
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.security import (
     PasswordValidator,
@@ -90,6 +90,26 @@ class TestPasswordHasher:
         hash2 = hasher.hash(password)
         assert hash1 != hash2  # Due to random salt
 
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self, hasher):
+        """Test the executor-backed async API round-trips."""
+        password = "TestPassword123!"
+        hashed = await hasher.hash_async(password)
+        assert await hasher.verify_async(password, hashed) is True
+        assert await hasher.verify_async("WrongPassword456!", hashed) is False
+
+    def test_needs_rehash_after_parameter_change(self, hasher):
+        """Test hashes made with other Argon2 parameters are flagged for rehash."""
+        import argon2
+
+        current = hasher.hash("TestPassword123!")
+        outdated = argon2.PasswordHasher(time_cost=1, memory_cost=8192).hash(
+            "TestPassword123!"
+        )
+        assert hasher.needs_rehash(current) is False
+        assert hasher.needs_rehash(outdated) is True
+        assert hasher.verify("TestPassword123!", outdated) is True
+
 
 class TestJWTManager:
     """Tests for JWTManager class."""
@@ -141,6 +161,52 @@ class TestJWTManager:
         payload = jwt_manager.decode_token(token)
         assert payload["user_id"] == 999
 
+    def test_decode_caches_verified_claims(self, jwt_manager):
+        """Test repeated decodes skip signature verification until exp."""
+        from unittest.mock import patch
+
+        token, _ = jwt_manager.create_access_token({"user_id": 1, "jti": "jti-1"})
+        first = jwt_manager.decode_token(token)
+        first["user_id"] = 2  # 修改返回值不影响缓存
+        with patch("app.core.security.jwt.decode") as decode:
+            assert jwt_manager.decode_token(token)["user_id"] == 1
+            assert jwt_manager.decode_token(token, expected_jti="other") is None
+            decode.assert_not_called()
+
+    def test_cached_claims_expire_and_stay_bounded(self, jwt_manager):
+        """Test cached claims are dropped at exp and the LRU is size-bounded."""
+        from unittest.mock import patch
+
+        jwt_manager.claims_cache_size = 2
+        tokens = [
+            jwt_manager.create_access_token({"user_id": user_id})[0]
+            for user_id in range(3)
+        ]
+        for token in tokens:
+            jwt_manager.decode_token(token)
+        assert len(jwt_manager.claims_cache) == 2
+
+        exp = jwt_manager.decode_token(tokens[2])["exp"]
+        with patch("app.core.security.time.time", return_value=exp), \
+                patch("jwt.api_jwt.datetime") as jwt_datetime:
+            jwt_datetime.now.return_value = datetime.fromtimestamp(exp, tz=timezone.utc)
+            assert jwt_manager.decode_token(tokens[2]) is None
+        assert len(jwt_manager.claims_cache) == 1
+
+    def test_cache_is_per_audience(self, jwt_manager):
+        """Test a token cached by one manager is not accepted by another audience."""
+        other = JWTManager(
+            secret_key="test-secret-key-for-testing-only",
+            algorithm="HS256",
+            issuer="test-issuer",
+            audience="other-audience",
+            access_token_expiry=3600,
+            refresh_token_expiry=86400,
+        )
+        token, _ = jwt_manager.create_access_token({"user_id": 1})
+        assert jwt_manager.decode_token(token) is not None
+        assert other.decode_token(token) is None
+
 
 class TestSecurityManager:
     """Tests for SecurityManager class."""
@@ -175,3 +241,112 @@ class TestSecurityManager:
         
         assert access_payload["user_id"] == 100
         assert refresh_payload["user_id"] == 100
+
+
+class TestCurrentUserDependency:
+    """Tests for the cached principal used by get_current_user."""
+
+    @pytest.fixture
+    def principal(self):
+        from app.models.user_model import RoleType
+        from app.schemas.auth_schemas import CurrentUser
+
+        return CurrentUser(
+            id=1,
+            email="test@example.com",
+            role=RoleType.admin,
+            is_active=True,
+            is_verified=True,
+            is_deleted=False,
+        )
+
+    @pytest.fixture
+    def dependencies(self, mock_db_session):
+        from unittest.mock import AsyncMock
+        from app.core.database.dependencies import Dependencies
+
+        dependencies = Dependencies(mock_db_session)
+        dependencies.auth_crud.get_user_principal = AsyncMock()
+        return dependencies
+
+    @pytest.mark.asyncio
+    async def test_cached_principal_skips_db(self, dependencies, principal):
+        """Test a cached snapshot authenticates the request without MySQL."""
+        from unittest.mock import AsyncMock, patch
+        from app.models.user_model import RoleType
+
+        with patch("app.core.database.dependencies.security_manager") as security, \
+                patch("app.core.database.dependencies.redis_manager") as redis:
+            security.decode_token.return_value = {"user_id": 1, "jti": "jti-1"}
+            redis.get_with_exists_async = AsyncMock(
+                return_value=(principal.model_dump_json(), False)
+            )
+            user = await dependencies.get_current_user(access_token="token")
+
+        assert user.id == 1 and user.role == RoleType.admin
+        redis.get_with_exists_async.assert_awaited_once_with(
+            "user_principal:1", "blacklist:access_token:jti-1"
+        )
+        dependencies.auth_crud.get_user_principal.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_principal_miss_loads_from_db(self, dependencies, principal):
+        """Test a missing snapshot is rebuilt from the database."""
+        from unittest.mock import AsyncMock, patch
+
+        dependencies.auth_crud.get_user_principal.return_value = principal
+        with patch("app.core.database.dependencies.security_manager") as security, \
+                patch("app.core.database.dependencies.redis_manager") as redis:
+            security.decode_token.return_value = {"user_id": 1, "jti": "jti-1"}
+            redis.get_with_exists_async = AsyncMock(return_value=(None, False))
+            user = await dependencies.get_current_user(access_token="token")
+
+        assert user == principal
+        dependencies.auth_crud.get_user_principal.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_blacklisted_or_disabled_user_is_rejected(
+        self, dependencies, principal
+    ):
+        """Test revoked tokens and disabled users get a 401."""
+        from unittest.mock import AsyncMock, patch
+        from fastapi import HTTPException
+
+        disabled = principal.model_copy(update={"is_active": False})
+        for cached, blacklisted in ((principal, True), (disabled, False)):
+            with patch("app.core.database.dependencies.security_manager") as security, \
+                    patch("app.core.database.dependencies.redis_manager") as redis:
+                security.decode_token.return_value = {"user_id": 1, "jti": "jti-1"}
+                redis.get_with_exists_async = AsyncMock(
+                    return_value=(cached.model_dump_json(), blacklisted)
+                )
+                with pytest.raises(HTTPException) as exc_info:
+                    await dependencies.get_current_user(access_token="token")
+            assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_revocation_checked_in_memory_when_synced(
+        self, dependencies, principal
+    ):
+        """Test a synced revocation set answers without the EXISTS round trip."""
+        from unittest.mock import AsyncMock, patch
+        from fastapi import HTTPException
+
+        with patch("app.core.database.dependencies.security_manager") as security, \
+                patch("app.core.database.dependencies.redis_manager") as redis, \
+                patch("app.core.database.dependencies.access_token_revocations") as revocations:
+            security.decode_token.return_value = {"user_id": 1, "jti": "jti-1"}
+            redis.get_async = AsyncMock(return_value=principal.model_dump_json())
+            redis.get_with_exists_async = AsyncMock()
+
+            revocations.check_local.return_value = False
+            user = await dependencies.get_current_user(access_token="token")
+            assert user.id == 1
+
+            revocations.check_local.return_value = True
+            with pytest.raises(HTTPException) as exc_info:
+                await dependencies.get_current_user(access_token="token")
+            assert exc_info.value.status_code == 401
+
+        redis.get_with_exists_async.assert_not_awaited()
+        redis.get_async.assert_awaited_once_with("user_principal:1")
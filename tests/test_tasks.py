@@ -222,3 +222,259 @@ class TestWatermarkTask:
         """Test that watermark task module exists."""
         from app.tasks import watermark_task
         assert watermark_task is not None
+
+
+class TestCacheWarmingTask:
+    """Tests for cache warming task."""
+
+    def test_task_module_exists(self):
+        """Test that cache warming task is registered."""
+        from app.tasks import cache_warming_task
+        assert cache_warming_task is not None
+
+    @pytest.mark.asyncio
+    async def test_schedule_is_debounced(self):
+        """Test repeated triggers within the debounce window queue one task."""
+        import importlib
+        from unittest.mock import AsyncMock, MagicMock
+
+        module = importlib.import_module("app.tasks.cache_warming_task")
+
+        client = MagicMock()
+        client.set = AsyncMock(side_effect=[True, None])
+        with patch.object(module.redis_manager, "get_async_client", AsyncMock(return_value=client)), \
+                patch.object(module.cache_warming_task, "apply_async") as mock_apply:
+            assert await module.schedule_cache_warming("startup") is True
+            assert await module.schedule_cache_warming("blog 1 published=True") is False
+
+        mock_apply.assert_called_once()
+
+
+class TestHttpCachePurgeTask:
+    """Tests for the nginx proxy cache purge task."""
+
+    def test_task_module_exists(self):
+        """Test that the purge task is registered."""
+        from app.tasks import http_cache_purge_task
+        assert http_cache_purge_task is not None
+
+    def test_refreshes_recorded_urls_with_their_language(self):
+        """Test indexed URLs are re-fetched through nginx and the index is cleared."""
+        import importlib
+        from contextlib import contextmanager
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.http_cache_purge_task")
+
+        pipe = MagicMock()
+        pipe.execute.return_value = [
+            {"zh /api/v1/blog/get-blog-lists?section_id=3", "en /api/v1/tag/get-tag-lists"},
+            2,
+        ]
+
+        @contextmanager
+        def fake_pipeline():
+            yield pipe
+
+        http = MagicMock()
+        with patch.object(module.redis_manager, "pipeline_sync", fake_pipeline), \
+                patch.object(module.httpx, "Client") as mock_client:
+            mock_client.return_value.__enter__.return_value = http
+            stats = module.purge_http_cache([], ["blog_lists"])
+
+        assert stats == {"refreshed": 2, "failed": 0}
+        pipe.delete.assert_called_once()
+        http.get.assert_any_call(
+            "/api/v1/blog/get-blog-lists?section_id=3", headers={"X-Language": "zh"}
+        )
+
+
+class TestBlogStatsFlushTask:
+    """Tests for the write-behind blog stats flush."""
+
+    def test_task_module_exists(self):
+        """Test that the flush task is registered."""
+        from app.tasks import blog_stats_flush_task
+        assert blog_stats_flush_task is not None
+
+    def test_flush_uses_one_batched_update(self):
+        """Test all pending deltas are written with a single UPDATE."""
+        import importlib
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.blog_stats_flush_task")
+        db = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = None
+        db.execute.return_value.all.return_value = [(1, 13, 2, 0), (2, 4, 0, 1)]
+        drained = {1: {"views": 3, "likes": 1}, 2: {"saves": -1}}
+        events = []
+        db.commit.side_effect = lambda: events.append("commit")
+        with patch.object(module.blog_stats_counter, "claim_sync", return_value=("b1", drained)), \
+                patch.object(module.blog_stats_counter, "ack_sync") as mock_ack, \
+                patch.object(module.blog_stats_projection, "delete_sync") as mock_delete, \
+                patch.object(module.blog_leaderboard, "set_sync") as mock_leaderboard, \
+                patch.object(module, "mark_blogs_dirty_sync") as mock_mark_dirty, \
+                patch.object(module, "redis_manager") as redis, \
+                patch.object(module.mysql_manager, "get_sync_db", return_value=db):
+            mock_ack.side_effect = lambda: events.append("ack")
+            mock_delete.side_effect = lambda ids: events.append("delete_projection")
+            assert module.flush_blog_stats() == 2
+
+        statement = str(db.execute.call_args_list[1][0][0])
+        assert statement.startswith("UPDATE")
+        assert "views" in statement and "likes" in statement and "saves" in statement
+        # 批次号与 UPDATE 在同一事务中写入
+        batch = db.execute.call_args_list[2][0][0]
+        assert str(batch).startswith("INSERT INTO blog_stats_flush_batch")
+        assert batch.compile().params["batch_id"] == "b1"
+        db.commit.assert_called_once()
+        # 提交后才删除处理中的增量与统计投影
+        assert events == ["commit", "ack", "delete_projection"]
+        mock_ack.assert_called_once_with()
+        mock_delete.assert_called_once_with(drained)
+        redis.get_sync_client.return_value.lock.return_value.release.assert_called_once()
+        # 分析后台汇总表重新汇总这些博客
+        mock_mark_dirty.assert_called_once_with(drained)
+        # 累计排行写入落库后的最新值
+        mock_leaderboard.assert_called_once_with(
+            {
+                1: {"views": 13, "likes": 2, "saves": 0},
+                2: {"views": 4, "likes": 0, "saves": 1},
+            }
+        )
+
+    def test_failed_flush_keeps_deltas_in_processing(self):
+        """Test deltas stay claimed for the next flush when the UPDATE fails."""
+        import importlib
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.blog_stats_flush_task")
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("lock wait timeout")
+        drained = {1: {"views": 3}}
+        with patch.object(module.blog_stats_counter, "claim_sync", return_value=("b1", drained)), \
+                patch.object(module.blog_stats_counter, "ack_sync") as mock_ack, \
+                patch.object(module.blog_stats_projection, "delete_sync") as mock_delete, \
+                patch.object(module, "redis_manager"), \
+                patch.object(module.mysql_manager, "get_sync_db", return_value=db):
+            with pytest.raises(RuntimeError):
+                module.flush_blog_stats()
+
+        db.rollback.assert_called_once()
+        mock_ack.assert_not_called()
+        mock_delete.assert_not_called()
+
+    def test_already_applied_batch_is_only_acknowledged(self):
+        """Test a batch committed before its ack was lost is not added to Blog_Stats again."""
+        import importlib
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.blog_stats_flush_task")
+        db = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = "b1"
+        db.execute.return_value.all.return_value = [(1, 13, 2, 0)]
+        drained = {1: {"views": 3}}
+        with patch.object(module.blog_stats_counter, "claim_sync", return_value=("b1", drained)), \
+                patch.object(module.blog_stats_counter, "ack_sync") as mock_ack, \
+                patch.object(module.blog_stats_projection, "delete_sync"), \
+                patch.object(module.blog_leaderboard, "set_sync"), \
+                patch.object(module, "mark_blogs_dirty_sync"), \
+                patch.object(module, "redis_manager"), \
+                patch.object(module.mysql_manager, "get_sync_db", return_value=db):
+            assert module.flush_blog_stats() == 1
+
+        statements = [str(call[0][0]) for call in db.execute.call_args_list]
+        assert not any(statement.startswith("UPDATE") for statement in statements)
+        db.commit.assert_not_called()
+        mock_ack.assert_called_once_with()
+
+    def test_concurrent_flush_is_skipped(self):
+        """Test a flush does not claim deltas while another flush holds the lock."""
+        import importlib
+
+        module = importlib.import_module("app.tasks.blog_stats_flush_task")
+        with patch.object(module.blog_stats_counter, "claim_sync") as mock_claim, \
+                patch.object(module, "redis_manager") as redis:
+            redis.get_sync_client.return_value.lock.return_value.acquire.return_value = False
+            assert module.flush_blog_stats() == 0
+
+        mock_claim.assert_not_called()
+
+
+class TestAnalyticsRollupTask:
+    """Tests for the incremental analytics rollup refresh."""
+
+    def test_task_module_exists(self):
+        """Test that the rollup task is registered."""
+        from app.tasks import analytics_rollup_task
+        assert analytics_rollup_task is not None
+
+    @staticmethod
+    def run_refresh(module, db, watermark, dirty_blogs=()):
+        from datetime import datetime
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        client.get.return_value = watermark
+        client.smembers.return_value = {str(blog_id) for blog_id in dirty_blogs}
+        pipe = MagicMock()
+        pipeline = MagicMock()
+        pipeline.return_value.__enter__.return_value = pipe
+        db.execute.return_value.scalar_one.return_value = datetime(2025, 6, 1, 12, 0)
+        with patch.object(module.redis_manager, "get_sync_client", return_value=client), \
+                patch.object(module.redis_manager, "pipeline_sync", pipeline), \
+                patch.object(module.mysql_manager, "get_sync_db", return_value=db):
+            refreshed = module.refresh_analytics_rollups()
+        return refreshed, pipe
+
+    def test_missing_watermark_rebuilds_everything(self):
+        """Test every rollup table is fully replaced when no watermark exists."""
+        import importlib
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.analytics_rollup_task")
+        db = MagicMock()
+        db.execute.return_value.mappings.return_value.all.return_value = []
+        refreshed, pipe = self.run_refresh(module, db, None, dirty_blogs=[7])
+
+        assert refreshed == {entity: 0 for entity in module.ROLLUPS}
+        statements = [str(call[0][0]) for call in db.execute.call_args_list]
+        deletes = [s for s in statements if s.startswith("DELETE")]
+        assert len(deletes) == len(module.ROLLUPS)
+        assert all("WHERE" not in s for s in deletes)
+        db.commit.assert_called_once()
+        pipe.set.assert_called_once_with(
+            module.ROLLUP_WATERMARK_KEY, "2025-06-01T12:00:00"
+        )
+        pipe.srem.assert_called_once_with(module.ROLLUP_DIRTY_BLOGS_KEY, 7)
+
+    def test_incremental_refresh_only_touches_changed_days(self):
+        """Test only the days with changed rows are re-aggregated."""
+        import importlib
+        from datetime import date
+        from unittest.mock import MagicMock
+
+        module = importlib.import_module("app.tasks.analytics_rollup_task")
+        db = MagicMock()
+        changed = {"users": {date(2025, 5, 30)}}
+        row = {"day": date(2025, 5, 30), "users": 4, "active_users": 3}
+        db.execute.return_value.mappings.return_value.all.return_value = [row]
+        with patch.object(module, "_get_changed_days") as mock_changed:
+            mock_changed.return_value = {
+                entity: changed.get(entity, set()) for entity in module.ROLLUPS
+            }
+            refreshed, _ = self.run_refresh(
+                module, db, "2025-06-01T11:55:00", dirty_blogs=[3]
+            )
+
+        since = mock_changed.call_args[0][1]
+        assert since.isoformat() == "2025-06-01T11:50:00"
+        assert mock_changed.call_args[0][2] == [3]
+        assert refreshed["users"] == 1
+        assert sum(refreshed.values()) == 1
+        statements = [str(call[0][0]) for call in db.execute.call_args_list]
+        assert any(
+            s.startswith("DELETE FROM user_daily_rollup WHERE") for s in statements
+        )
+        assert any(s.startswith("INSERT INTO user_daily_rollup") for s in statements)
+        db.commit.assert_called_once()
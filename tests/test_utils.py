@@ -48,6 +48,71 @@ class TestKeysetPagination:
         result = paginator.decode_cursor(None)
         assert result == (None, None)
 
+    def test_normalize_cursor(self):
+        """Test cursors are re-encoded canonically and invalid ones map to the first page."""
+        import base64
+        from app.utils.keyset_pagination import KeysetPaginator
+
+        paginator = KeysetPaginator()
+        cursor = paginator.encode_cursor(datetime(2024, 6, 15, 10, 30, 0), 7)
+        padded = base64.urlsafe_b64encode(b"2024-06-15T10:30|007").decode()
+        assert paginator.normalize_cursor(cursor) == cursor
+        assert paginator.normalize_cursor(padded) == cursor
+        assert paginator.normalize_cursor("invalid-cursor") == ""
+        assert paginator.normalize_cursor(None) == ""
+
+    @pytest.mark.asyncio
+    async def test_get_paginated_result_next_cursor(self):
+        """Test one extra row is fetched to detect the next page."""
+        from unittest.mock import AsyncMock, MagicMock
+        from sqlmodel import select
+        from app.models.blog_model import Blog
+        from app.utils.keyset_pagination import KeysetPaginator
+
+        paginator = KeysetPaginator()
+        rows = [
+            Blog(id=row_id, created_at=datetime(2024, 1, row_id))
+            for row_id in (5, 4, 3)
+        ]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rows
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        items, has_next, next_cursor = await paginator.get_paginated_result(
+            db, select(Blog), Blog.created_at, Blog.id, None, 2
+        )
+
+        assert [item.id for item in items] == [5, 4]
+        assert has_next is True
+        assert paginator.decode_cursor(next_cursor) == (datetime(2024, 1, 4), 4)
+        statement = str(db.execute.call_args[0][0])
+        assert "ORDER BY blogs.created_at DESC, blogs.id DESC" in statement
+
+
+class TestCommentTree:
+    """Tests for the flat-list comment tree builder."""
+
+    def test_build_comment_tree(self):
+        """Test comments are nested under their parents in input order."""
+        from app.utils.comment_tree import build_comment_tree
+
+        comments = [
+            {"comment_id": 2, "parent_id": None},
+            {"comment_id": 1, "parent_id": None},
+            {"comment_id": 3, "parent_id": 1},
+            {"comment_id": 4, "parent_id": 3},
+            {"comment_id": 5, "parent_id": 1},
+            {"comment_id": 6, "parent_id": 99},
+            {"comment_id": 3, "parent_id": 1},
+        ]
+        tree = build_comment_tree(comments)
+
+        assert [root["comment_id"] for root in tree] == [2, 1]
+        assert "children" not in tree[0]
+        assert [child["comment_id"] for child in tree[1]["children"]] == [3, 5]
+        assert tree[1]["children"][0]["children"] == [{"comment_id": 4, "parent_id": 3}]
+
 
 class TestAESJsonCipher:
     """Tests for AES encryption utility."""
@@ -298,3 +363,78 @@ class TestCeleryApp:
         """Test celery app has correct name."""
         from app.core.celery import celery_app
         assert celery_app.main is not None
+
+
+class TestHttpCache:
+    """Tests for ETag / If-None-Match conditional responses."""
+
+    @staticmethod
+    def make_request(if_none_match=None):
+        from starlette.requests import Request
+
+        headers = []
+        if if_none_match is not None:
+            headers.append((b"if-none-match", if_none_match.encode()))
+        return Request({"type": "http", "method": "GET", "headers": headers})
+
+    @pytest.mark.asyncio
+    async def test_response_carries_etag_and_cache_control(self):
+        """Test a full response includes ETag, Cache-Control and pagination headers."""
+        from fastapi import Response
+        from app.schemas.common import SuccessResponse
+        from app.utils.http_cache import conditional_response
+
+        injected = Response()
+        injected.headers["X-Total-Count"] = "3"
+        response = await conditional_response(
+            self.make_request(), SuccessResponse(message="ok", data=[1, 2, 3]), injected
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
+        assert response.headers["X-Total-Count"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_matching_if_none_match_returns_304(self):
+        """Test a matching (weak or listed) ETag yields an empty 304."""
+        from app.schemas.common import SuccessResponse
+        from app.utils.http_cache import conditional_response
+
+        content = SuccessResponse(message="ok", data={"blog_id": 1})
+        etag = (await conditional_response(self.make_request(), content)).headers["ETag"]
+
+        for header in (etag, f"W/{etag}", f'"other", {etag}'):
+            response = await conditional_response(self.make_request(header), content)
+            assert response.status_code == 304
+            assert response.body == b""
+            assert response.headers["ETag"] == etag
+
+        changed = SuccessResponse(message="ok", data={"blog_id": 2})
+        response = await conditional_response(self.make_request(etag), changed)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_private_responses(self):
+        """Test user-specific responses are not cacheable by shared caches."""
+        from app.schemas.common import SuccessResponse
+        from app.utils.http_cache import conditional_response
+
+        response = await conditional_response(
+            self.make_request(), SuccessResponse(message="ok"), private=True
+        )
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_purge_sets_for_prefixes_and_keys(self):
+        """Test invalidated prefixes and exact keys map to surrogate index sets."""
+        from app.utils.http_cache import get_purge_sets, get_surrogate_tags
+
+        assert get_surrogate_tags("blog_lists:3") == ["blog_lists"]
+        assert get_purge_sets([], ["blog_lists"]) == {
+            "surrogate_key:blog_lists",
+            "surrogate_tag:blog_lists",
+        }
+        # 精确删除的键也会刷新声明了其前缀的 URL
+        assert "surrogate_key:blog_summary:1" in get_purge_sets(
+            ["blog_summary:1:lang=zh"], []
+        )